@@ -1,26 +1,77 @@
 import json
+import os
+import multiprocessing
+import hashlib
+import inspect
+import heapq
+import shutil
+import tempfile
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import networkx as nx
 import seaborn as sns
-from collections import defaultdict, Counter
+from array import array
+from collections import defaultdict, deque, Counter, namedtuple
+from collections.abc import Sequence
 from datetime import timedelta
+from time import perf_counter
 import warnings
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from scipy import sparse
+from transcript_stream import open_transcript, iter_json_array
+from similarity_backends import TfidfBackend, make_similarity_backend
+from bootstrap_intervals import bootstrap_inequality, bootstrap_group_means, default_block_length
 warnings.filterwarnings('ignore')
 
 # Set style for neutral, legible visualizations
 plt.style.use('seaborn-v0_8-whitegrid')
 sns.set_palette("husl")
 
-def load_transcript(filepath):
-    """Load and parse the JSON transcript file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data['segments']
+# Default location of the parsed-transcript cache used by the entry-point scripts
+TRANSCRIPT_CACHE_DIR = '.transcript_cache'
+# Bump when the cached array layout or the parse into a SegmentTable changes
+CACHE_FORMAT_VERSION = 3
+
+# Similarity backend for the topic functions (None: per-meeting TF-IDF); set with configure_similarity_backend
+SIMILARITY_BACKEND = None
+EMBEDDING_CACHE_PATH = '.embedding_cache/embeddings.sqlite'
+
+# Worker processes for the per-topic detectors in main() (1: run serially). Forking only
+# pays off for very long meetings, so parallelism is opt-in through the TOPIC_WORKERS
+# environment variable (see topic_workers)
+TOPIC_WORKERS = 1
+
+# Read-only inputs of a sharded topic run, inherited copy-on-write by forked pool workers
+_TOPIC_SHARD_STATE = {}
+
+def load_transcript(filepath, words_path=None, cache_dir=None):
+    """Load and parse the JSON transcript file into a columnar SegmentTable.
+    The file is streamed segment by segment (see stream_segments), so its
+    per-word arrays are never all held in memory. With cache_dir set, the parsed
+    table and the transcript's word intervals (see load_word_intervals) are
+    stored under the transcript's content hash and memory-mapped on later runs.
+    The cache is bypassed when words_path is requested, since the word side
+    file can only be produced by a real parse."""
+    if cache_dir is None or words_path:
+        return SegmentTable.from_records(stream_segments(filepath, words_path))
+
+    entry = os.path.join(cache_dir, transcript_cache_key(filepath))
+    if os.path.isdir(entry):
+        try:
+            return load_segment_cache(entry)
+        except (OSError, ValueError, KeyError):
+            pass  # Corrupt or partial entry: rebuild it below
+
+    word_intervals = _WordIntervals()
+    table = SegmentTable.from_records(stream_segments(filepath, word_intervals=word_intervals))
+    # Cached word codes follow the table's speakers, as main() requests them
+    words, word_speakers = _recode_words(word_intervals.array(), word_intervals.speakers, table.speakers)
+    table._word_intervals = (words, word_speakers, word_intervals.speakers)
+    save_segment_cache(table, entry)
+    return table
 
 def is_filler(text):
     """Check if text is a filler token."""
@@ -39,242 +90,1076 @@ def get_speaker(seg):
             return speaker_counts.most_common(1)[0][0]
     return 'UNKNOWN'
 
+# One maximal same-speaker run of segments: speaker code, first/last segment index
+# (inclusive), start of the first and end of the last segment, and the summed
+# duration of its segments
+RUN_DTYPE = np.dtype([('speaker', np.int32), ('first', np.int64), ('last', np.int64),
+                      ('start', np.float64), ('end', np.float64), ('duration', np.float64)])
+
+# One timed word: index of its segment, speaker code, start and end
+WORD_DTYPE = np.dtype([('segment', np.int64), ('speaker', np.int32), ('start', np.float64), ('end', np.float64)])
+
+class _WordIntervals:
+    """Accumulates the timed words of streamed segments as WORD_DTYPE columns.
+    Word speaker labels are interned after the given speakers; words without a
+    speaker take their segment's speaker, and words without timestamps are skipped."""
+
+    def __init__(self, speakers=()):
+        self.speakers = list(speakers)
+        self.speaker_index = {name: code for code, name in enumerate(self.speakers)}
+        self.segment, self.speaker, self.start, self.end = array('q'), array('i'), array('d'), array('d')
+
+    def add(self, i, seg):
+        """Add the words of segment i."""
+        segment_speaker = None
+        for w in seg.get('words') or []:
+            if 'start' not in w or 'end' not in w:
+                continue
+            speaker = w.get('speaker')
+            if not speaker:
+                if segment_speaker is None:
+                    segment_speaker = get_speaker(seg)
+                speaker = segment_speaker
+            if speaker not in self.speaker_index:
+                self.speaker_index[speaker] = len(self.speakers)
+                self.speakers.append(speaker)
+            self.segment.append(i)
+            self.speaker.append(self.speaker_index[speaker])
+            self.start.append(w['start'])
+            self.end.append(w['end'])
+
+    def array(self):
+        """The words added so far as a WORD_DTYPE array."""
+        words = np.empty(len(self.speaker), dtype=WORD_DTYPE)
+        words['segment'] = np.frombuffer(self.segment, dtype=np.int64) if len(self.segment) else 0
+        words['speaker'] = np.frombuffer(self.speaker, dtype=np.int32) if len(self.speaker) else 0
+        words['start'] = np.frombuffer(self.start, dtype=np.float64) if len(self.start) else 0
+        words['end'] = np.frombuffer(self.end, dtype=np.float64) if len(self.end) else 0
+        return words
+
+def _recode_words(words, word_speakers, speakers, order=None):
+    """Recode words whose speaker codes index word_speakers so that they index speakers,
+    extended with the remaining word speakers in order (default: word_speakers), as
+    load_word_intervals interns them. Returns (words, speakers); words are returned
+    as given, without a copy, when the codes already agree."""
+    speakers = list(speakers)
+    speaker_index = {name: code for code, name in enumerate(speakers)}
+    for name in word_speakers if order is None else order:
+        if name not in speaker_index:
+            speaker_index[name] = len(speakers)
+            speakers.append(name)
+    if speakers == list(word_speakers):
+        return words, speakers
+    codes = np.array([speaker_index[name] for name in word_speakers], dtype=np.int32)
+    recoded = np.array(words)
+    recoded['speaker'] = codes[words['speaker']]
+    return recoded, speakers
+
+# Compact per-segment record produced by the streaming loader
+SegmentRecord = namedtuple('SegmentRecord', ['start', 'end', 'speaker', 'text'])
+
+def stream_segments(filepath, words_path=None, word_intervals=None):
+    """Yield compact SegmentRecords from a (optionally gzip/zstd-compressed) transcript.
+    Segments are parsed one at a time. Each segment's word array is used for speaker
+    resolution and then dropped, or spilled to words_path as JSON lines if given;
+    a _WordIntervals passed as word_intervals collects the timed words on the way."""
+    spill = open(words_path, 'w', encoding='utf-8') if words_path else None
+    try:
+        with open_transcript(filepath) as f:
+            for i, seg in enumerate(iter_json_array(f, 'segments')):
+                record = SegmentRecord(seg['start'], seg['end'], get_speaker(seg), seg.get('text', ''))
+                if word_intervals is not None:
+                    word_intervals.add(i, seg)
+                if spill is not None and seg.get('words'):
+                    spill.write(json.dumps({'segment': i, 'words': seg['words']}, ensure_ascii=False))
+                    spill.write('\n')
+                yield record
+    finally:
+        if spill is not None:
+            spill.close()
+
+def load_word_intervals(filepath, speakers=(), cache_dir=None):
+    """Stream the timed words of a transcript into a WORD_DTYPE array.
+    Word speaker labels are interned after the given speakers (e.g. a SegmentTable's),
+    so codes agree with the segment table; words without a speaker take their
+    segment's speaker, and words without timestamps are skipped. With cache_dir set
+    the words come memory-mapped from the transcript's cache entry (see load_transcript)
+    instead of a second parse.
+    Returns (words, speakers)."""
+    if cache_dir is not None:
+        cached = load_transcript(filepath, cache_dir=cache_dir)._word_intervals
+        if cached is not None:
+            words, word_speakers, order = cached
+            return _recode_words(words, word_speakers, speakers, order)
+    
+    word_intervals = _WordIntervals(speakers)
+    with open_transcript(filepath) as f:
+        for i, seg in enumerate(iter_json_array(f, 'segments')):
+            word_intervals.add(i, seg)
+    return word_intervals.array(), word_intervals.speakers
+
+class SegmentTable:
+    """Columnar store of transcript segments, built once at load time.
+
+    Speakers are resolved with get_speaker() and interned to integer codes in
+    order of first appearance; filler flags are computed once with is_filler().
+    Segment text lives in a single buffer addressed by text_offsets. Iterating
+    or indexing the table yields plain segment dicts, so code written against
+    the raw JSON segment list keeps working.
+    """
+
+    def __init__(self, start, end, speaker, speakers, filler, text_buffer, text_offsets):
+        self.start = np.asarray(start, dtype=np.float64)
+        self.end = np.asarray(end, dtype=np.float64)
+        self.duration = self.end - self.start
+        self.speaker = np.asarray(speaker, dtype=np.int32)
+        self.speakers = list(speakers)
+        self.filler = np.asarray(filler, dtype=bool)
+        self.text_buffer = text_buffer
+        self.text_offsets = np.asarray(text_offsets, dtype=np.int64)
+        self.speaker_index = {name: code for code, name in enumerate(self.speakers)}
+        self._turn_bounds = None
+        self._runs = None
+        self._turn_texts = None
+        self._turn_spaces = {}
+        self._word_intervals = None  # (words, word speakers, first-seen order), set by load_transcript
+
+    @classmethod
+    def from_segments(cls, segments):
+        """Build a table from raw transcript segment dicts (or return an existing table)."""
+        if isinstance(segments, cls):
+            return segments
+        return cls.from_records(
+            SegmentRecord(seg['start'], seg['end'], get_speaker(seg), seg.get('text', ''))
+            for seg in segments)
+
+    @classmethod
+    def from_records(cls, records):
+        """Build a table from an iterable of SegmentRecords, consuming it once."""
+        start = array('d')
+        end = array('d')
+        speaker = array('i')
+        filler = array('b')
+        text_offsets = array('q', [0])
+        speaker_index = {}
+        texts = []
+
+        for record in records:
+            code = speaker_index.get(record.speaker)
+            if code is None:
+                code = speaker_index[record.speaker] = len(speaker_index)
+            start.append(record.start)
+            end.append(record.end)
+            speaker.append(code)
+            filler.append(is_filler(record.text))
+            texts.append(record.text)
+            text_offsets.append(text_offsets[-1] + len(record.text))
+
+        return cls(start, end, speaker, list(speaker_index), filler, ''.join(texts), text_offsets)
+
+    def __len__(self):
+        return len(self.start)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        return {
+            'start': float(self.start[i]),
+            'end': float(self.end[i]),
+            'text': self.text(i),
+            'speaker': self.speakers[self.speaker[i]]
+        }
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def turn_bounds(self):
+        """Return first and last segment index of each maximal same-speaker run."""
+        if self._turn_bounds is None:
+            n = len(self)
+            if n == 0:
+                self._turn_bounds = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+            else:
+                change = np.flatnonzero(self.speaker[1:] != self.speaker[:-1]) + 1
+                first = np.concatenate(([0], change))
+                last = np.concatenate((change - 1, [n - 1]))
+                self._turn_bounds = (first, last)
+        return self._turn_bounds
+
+    def speaker_runs(self):
+        """Run-length encoding of the speaker sequence as a RUN_DTYPE array, one row per
+        maximal same-speaker run (i.e. per turn), in order."""
+        if self._runs is None:
+            first, last = self.turn_bounds()
+            runs = np.empty(len(first), dtype=RUN_DTYPE)
+            runs['speaker'] = self.speaker[first]
+            runs['first'] = first
+            runs['last'] = last
+            runs['start'] = self.start[first]
+            runs['end'] = self.end[last]
+            runs['duration'] = np.add.reduceat(self.duration, first) if len(first) else 0.0
+            self._runs = runs
+        return self._runs
+
+    def turn_texts(self):
+        """Cleaned text of each turn (aligned with turn_bounds), fillers excluded. Built once."""
+        if self._turn_texts is None:
+            first, last = self.turn_bounds()
+            self._turn_texts = [
+                ' '.join([clean_text(self.text(i)) for i in range(a, b + 1) if not self.filler[i]])
+                for a, b in zip(first.tolist(), last.tolist())
+            ]
+        return self._turn_texts
+
+    def text(self, i):
+        """Return the raw text of segment i."""
+        return self.text_buffer[self.text_offsets[i]:self.text_offsets[i + 1]]
+
+    def speaker_names(self, codes):
+        """Map an array of speaker codes back to speaker labels."""
+        return [self.speakers[c] for c in codes]
+
+def transcript_cache_key(filepath):
+    """Hash the transcript bytes together with the cache format version and the source of
+    the parser (stream_segments, speaker resolution, filler rule, table construction, word
+    collection), so
+    editing the file, the parser or the cache layout invalidates cached tables."""
+    h = hashlib.sha256(f'segment-table-v{CACHE_FORMAT_VERSION}'.encode())
+    for rule in (stream_segments, get_speaker, is_filler, SegmentTable.from_records, SegmentTable.__init__,
+                 _WordIntervals.add, _recode_words):
+        h.update(inspect.getsource(rule).encode('utf-8'))
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def save_segment_cache(table, entry):
+    """Write a SegmentTable (with its turn boundaries and word intervals, if collected) as
+    .npy arrays plus metadata.
+    The entry directory is written under a temporary name and renamed into place,
+    replacing any stale or corrupt entry already stored under the same key."""
+    parent = os.path.dirname(entry) or '.'
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=parent, prefix='.tmp-')
+    try:
+        turn_first, turn_last = table.turn_bounds()
+        arrays = {
+            'start': table.start,
+            'end': table.end,
+            'speaker': table.speaker,
+            'filler': table.filler,
+            'text_offsets': table.text_offsets,
+            'turn_first': turn_first,
+            'turn_last': turn_last
+        }
+        meta = {'version': CACHE_FORMAT_VERSION, 'speakers': table.speakers}
+        if table._word_intervals is not None:
+            arrays['words'], meta['word_speakers'], meta['word_speaker_order'] = table._word_intervals
+        for name, values in arrays.items():
+            np.save(os.path.join(tmp, f'{name}.npy'), values)
+        with open(os.path.join(tmp, 'text.txt'), 'w', encoding='utf-8', newline='') as f:
+            f.write(table.text_buffer)
+        with open(os.path.join(tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        if os.path.isdir(entry):
+            # An existing entry failed to load: move it aside, since a directory cannot be
+            # renamed onto a non-empty one
+            stale = tempfile.mkdtemp(dir=parent, prefix='.stale-')
+            os.replace(entry, os.path.join(stale, 'entry'))
+            shutil.rmtree(stale, ignore_errors=True)
+        os.replace(tmp, entry)
+    except OSError:
+        # Another process may have populated the entry first; the cache is best-effort
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def load_segment_cache(entry):
+    """Open a cached SegmentTable with its arrays memory-mapped read-only."""
+    with open(os.path.join(entry, 'meta.json'), 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('version') != CACHE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported cache version in {entry}")
+    with open(os.path.join(entry, 'text.txt'), 'r', encoding='utf-8', newline='') as f:
+        text_buffer = f.read()
+
+    def mapped(name):
+        return np.load(os.path.join(entry, f'{name}.npy'), mmap_mode='r')
+
+    table = SegmentTable(mapped('start'), mapped('end'), mapped('speaker'), meta['speakers'],
+                         mapped('filler'), text_buffer, mapped('text_offsets'))
+    table._turn_bounds = (mapped('turn_first'), mapped('turn_last'))
+    if 'word_speakers' in meta:
+        table._word_intervals = (mapped('words'), meta['word_speakers'], meta['word_speaker_order'])
+    return table
+
+def as_segment_table(segments):
+    """Return segments as a SegmentTable, building one if given raw dicts."""
+    return SegmentTable.from_segments(segments)
+
+def _first_seen_order(codes):
+    """Unique codes ordered by first occurrence (matches dict insertion order of a Python loop)."""
+    unique, first_idx = np.unique(codes, return_index=True)
+    return unique[np.argsort(first_idx, kind='stable')]
+
+def _table_turn_rows(table, turns):
+    """Positions of turns within table.turn_bounds(), or None if they don't come from this table."""
+    if not turns or not all('first_segment' in t for t in turns):
+        return None
+    first, last = table.turn_bounds()
+    turn_first = [t['first_segment'] for t in turns]
+    idx = np.minimum(np.searchsorted(first, turn_first), len(first) - 1)
+    if np.array_equal(first[idx], turn_first) and np.array_equal(last[idx], [t['last_segment'] for t in turns]):
+        return idx
+    return None
+
+def get_turn_texts(segments, turns):
+    """Return the cleaned text of each turn, aligned with turns.
+    Turns from compute_turn_taking carry their segment range, so their texts come
+    from the table's shared per-turn cache; other turn lists fall back to a scan."""
+    shared = _shared_turn_data(turns, 'turn_texts')
+    if shared is not None:
+        return list(shared)
+    table = as_segment_table(segments)
+    rows = _table_turn_rows(table, turns)
+    if rows is not None:
+        texts = table.turn_texts()
+        return [texts[k] for k in rows.tolist()]
+
+    turn_texts = []
+    for turn in turns:
+        code = table.speaker_index.get(turn['speaker'], -1)
+        in_turn = np.flatnonzero((table.speaker == code) & (table.start >= turn['start']) &
+                                 (table.start <= turn['end']) & ~table.filler)
+        turn_texts.append(' '.join([clean_text(table.text(i)) for i in in_turn]))
+    return turn_texts
+
+# searchsorted sides for the lower and upper bound of each window inclusivity
+_WINDOW_SIDES = {
+    'neither': ('right', 'left'),
+    'both': ('left', 'right'),
+    'left': ('left', 'left'),
+    'right': ('right', 'right')
+}
+
+class TimeIndex:
+    """Sorted start/end arrays over turns and segments for time-window queries.
+
+    Each query is a binary search plus work proportional to its result, instead
+    of a filter over every turn or segment. Turn and overlap queries return
+    index arrays in original list order, so callers get exactly the elements a
+    list comprehension over the same condition would have produced.
+    """
+
+    def __init__(self, segments, turns):
+        table = as_segment_table(segments)
+
+        turn_start = np.array([t['start'] for t in turns], dtype=np.float64)
+        self._turn_order = np.argsort(turn_start, kind='stable')
+        self._turn_start = turn_start[self._turn_order]
+        # Smallest original turn index at or after each sorted position
+        self._turn_first = np.minimum.accumulate(self._turn_order[::-1])[::-1]
+
+        self._seg_order = np.argsort(table.start, kind='stable')
+        self._seg_start = table.start[self._seg_order]
+        self._seg_end = table.end[self._seg_order]
+        self._max_seg_duration = float(table.duration.max()) if len(table) else 0.0
+
+        # Per-speaker segment indices ordered by start time
+        by_speaker = np.lexsort((table.start, table.speaker))
+        counts = np.bincount(table.speaker, minlength=len(table.speakers))
+        self._speaker_index = table.speaker_index
+        self._speaker_segments = np.split(by_speaker, np.cumsum(counts)[:-1])
+        self._speaker_starts = [table.start[idx] for idx in self._speaker_segments]
+
+    def turns_between(self, t0, t1=np.inf, inclusive='neither'):
+        """Indices of turns whose start lies between t0 and t1.
+        inclusive is one of 'neither', 'both', 'left' or 'right'."""
+        lower_side, upper_side = _WINDOW_SIDES[inclusive]
+        lo = np.searchsorted(self._turn_start, t0, side=lower_side)
+        hi = np.searchsorted(self._turn_start, t1, side=upper_side)
+        return np.sort(self._turn_order[lo:max(lo, hi)])
+
+    def turns_between_many(self, t0, t1, inclusive='neither'):
+        """Batched turns_between over arrays of window bounds.
+        Returns (window, turn) index pairs grouped by window, turns in list order within each."""
+        lower_side, upper_side = _WINDOW_SIDES[inclusive]
+        lo = np.searchsorted(self._turn_start, t0, side=lower_side)
+        hi = np.maximum(np.searchsorted(self._turn_start, t1, side=upper_side), lo)
+        counts = hi - lo
+        window = np.repeat(np.arange(len(lo)), counts)
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        turn_idx = self._turn_order[np.repeat(lo, counts) + within]
+        order = np.lexsort((turn_idx, window))
+        return window[order], turn_idx[order]
+
+    def first_turn_after(self, t):
+        """Index of the first turn (in list order) starting strictly after t, or None."""
+        lo = np.searchsorted(self._turn_start, t, side='right')
+        return int(self._turn_first[lo]) if lo < len(self._turn_first) else None
+
+    def segments_overlapping(self, t0, t1):
+        """Indices of segments whose interval overlaps (t0, t1).
+        Only segments starting within one maximum segment duration before t0 can reach past it."""
+        lo = np.searchsorted(self._seg_start, t0 - self._max_seg_duration, side='left')
+        hi = np.searchsorted(self._seg_start, t1, side='left')
+        if hi <= lo:
+            return np.empty(0, dtype=np.int64)
+        hits = self._seg_end[lo:hi] > t0
+        return np.sort(self._seg_order[lo:hi][hits])
+
+    def speaker_segments_after(self, speaker, t, inclusive=False):
+        """Indices of the speaker's segments starting after t, ordered by start time."""
+        code = self._speaker_index.get(speaker)
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        lo = np.searchsorted(self._speaker_starts[code], t, side='left' if inclusive else 'right')
+        return self._speaker_segments[code][lo:]
+
+    def speaker_segments_between(self, speaker, t0, t1):
+        """Indices of the speaker's segments starting in (t0, t1], ordered by start time."""
+        code = self._speaker_index.get(speaker)
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        lo = np.searchsorted(self._speaker_starts[code], t0, side='right')
+        hi = np.searchsorted(self._speaker_starts[code], t1, side='right')
+        return self._speaker_segments[code][lo:max(lo, hi)]
+
 def compute_speaking_time(segments):
     """Compute total speaking time per speaker."""
-    speaker_times = defaultdict(float)
-    total_meeting_time = 0
-    
-    for seg in segments:
-        start = seg['start']
-        end = seg['end']
-        speaker = get_speaker(seg)
-        duration = end - start
-        
-        # Only count non-filler segments for speaking time
-        if not is_filler(seg['text']):
-            speaker_times[speaker] += duration
-        
-        # Track total meeting time (from first to last timestamp)
-        if end > total_meeting_time:
-            total_meeting_time = end
-    
-    return dict(speaker_times), total_meeting_time
+    table = as_segment_table(segments)
+
+    # Only count non-filler segments for speaking time
+    speech = ~table.filler
+    codes = table.speaker[speech]
+    totals = np.bincount(codes, weights=table.duration[speech], minlength=len(table.speakers))
+    speaker_times = {table.speakers[c]: float(totals[c]) for c in _first_seen_order(codes)}
+
+    # Track total meeting time (from first to last timestamp)
+    total_meeting_time = max(0, float(table.end.max())) if len(table) else 0
+
+    return speaker_times, total_meeting_time
+
+def speaker_runs(segments):
+    """Run-length encoded speaker sequence (RUN_DTYPE array) of a segment list or table."""
+    return as_segment_table(segments).speaker_runs()
 
 def compute_turn_taking(segments):
     """Analyze turn-taking structure."""
-    turns = []
-    current_speaker = None
-    current_turn_start = None
-    current_turn_end = None
-    
-    for seg in segments:
-        speaker = get_speaker(seg)
-        start = seg['start']
-        end = seg['end']
-        
-        if speaker != current_speaker:
-            # New turn
-            if current_speaker is not None:
-                turns.append({
-                    'speaker': current_speaker,
-                    'start': current_turn_start,
-                    'end': current_turn_end,
-                    'duration': current_turn_end - current_turn_start
-                })
-            current_speaker = speaker
-            current_turn_start = start
-            current_turn_end = end
-        else:
-            # Same speaker continues
-            current_turn_end = end
-    
-    # Add last turn
-    if current_speaker is not None:
-        turns.append({
-            'speaker': current_speaker,
-            'start': current_turn_start,
-            'end': current_turn_end,
-            'duration': current_turn_end - current_turn_start
-        })
-    
+    table = as_segment_table(segments)
+    runs = table.speaker_runs()
+    first, last = runs['first'], runs['last']
+
+    turn_codes = runs['speaker']
+    turn_start = runs['start']
+    turn_end = runs['end']
+    turn_duration = turn_end - turn_start
+
+    # Each turn records the inclusive segment index range it spans
+    turns = [
+        {'speaker': table.speakers[code], 'start': start, 'end': end, 'duration': duration,
+         'first_segment': a, 'last_segment': b}
+        for code, start, end, duration, a, b in zip(turn_codes.tolist(), turn_start.tolist(),
+                                                    turn_end.tolist(), turn_duration.tolist(),
+                                                    first.tolist(), last.tolist())
+    ]
+
     # Aggregate by speaker
-    turn_stats = defaultdict(lambda: {'count': 0, 'total_duration': 0, 'durations': []})
-    for turn in turns:
-        speaker = turn['speaker']
-        turn_stats[speaker]['count'] += 1
-        turn_stats[speaker]['total_duration'] += turn['duration']
-        turn_stats[speaker]['durations'].append(turn['duration'])
-    
-    # Calculate averages
-    for speaker in turn_stats:
-        count = turn_stats[speaker]['count']
-        turn_stats[speaker]['avg_duration'] = turn_stats[speaker]['total_duration'] / count if count > 0 else 0
-    
-    return turns, dict(turn_stats)
+    counts = np.bincount(turn_codes, minlength=len(table.speakers))
+    totals = np.bincount(turn_codes, weights=turn_duration, minlength=len(table.speakers))
+    order = np.argsort(turn_codes, kind='stable')
+    split_at = np.cumsum(counts)[:-1]
+    durations_by_code = np.split(turn_duration[order], split_at)
 
-def detect_interruptions(segments, threshold=0.5):
-    """Detect potential interruptions and overlaps."""
-    interruptions = []
-    overlaps = []
-    
-    for i in range(len(segments) - 1):
-        current = segments[i]
-        next_seg = segments[i + 1]
-        
-        current_end = current['end']
-        next_start = next_seg['start']
-        current_speaker = get_speaker(current)
-        next_speaker = get_speaker(next_seg)
+    turn_stats = {}
+    for code in _first_seen_order(turn_codes):
+        count = int(counts[code])
+        total_duration = float(totals[code])
+        turn_stats[table.speakers[code]] = {
+            'count': count,
+            'total_duration': total_duration,
+            'durations': durations_by_code[code].tolist(),
+            'avg_duration': total_duration / count if count > 0 else 0
+        }
+
+    return turns, turn_stats
+
+AdjacentPairs = namedtuple('AdjacentPairs', ['current_code', 'next_code', 'current_end', 'next_start', 'gap'])
+
+def adjacent_pairs(segments):
+    """Arrays over each pair of consecutive segments (i, i + 1): speaker codes, end/start times and gap."""
+    table = as_segment_table(segments)
+    current_end = table.end[:-1]
+    next_start = table.start[1:]
+    return AdjacentPairs(table.speaker[:-1], table.speaker[1:], current_end, next_start, next_start - current_end)
+
+# Structured event tables: speaker fields are SegmentTable speaker codes and
+# 'segment' is the index i of the first segment of the (i, i + 1) pair
+INTERRUPTION_DTYPE = np.dtype([('interrupted', np.int32), ('interrupter', np.int32),
+                               ('gap', np.float64), ('time', np.float64), ('segment', np.int64)])
+OVERLAP_DTYPE = np.dtype([('speaker1', np.int32), ('speaker2', np.int32),
+                          ('overlap_duration', np.float64), ('time', np.float64), ('segment', np.int64)])
+TRANSITION_DTYPE = np.dtype([('source', np.int32), ('target', np.int32),
+                             ('gap', np.float64), ('time', np.float64), ('segment', np.int64)])
+
+def _event_table(dtype, idx, first_code, second_code, value, time):
+    events = np.empty(len(idx), dtype=dtype)
+    names = dtype.names
+    events[names[0]] = first_code[idx]
+    events[names[1]] = second_code[idx]
+    events[names[2]] = value
+    events[names[3]] = time[idx]
+    events['segment'] = idx
+    return events
+
+def interruption_table(segments, threshold=0.5, pairs=None):
+    """Rapid speaker changes (gap < threshold) as an INTERRUPTION_DTYPE array."""
+    if pairs is None:
+        pairs = adjacent_pairs(segments)
+    idx = np.flatnonzero((pairs.current_code != pairs.next_code) & (pairs.gap < threshold))
+    return _event_table(INTERRUPTION_DTYPE, idx, pairs.current_code, pairs.next_code,
+                        pairs.gap[idx], pairs.current_end)
+
+def overlap_table(segments, pairs=None):
+    """Consecutive segments that overlap in time, as an OVERLAP_DTYPE array."""
+    if pairs is None:
+        pairs = adjacent_pairs(segments)
+    idx = np.flatnonzero(pairs.gap < 0)
+    return _event_table(OVERLAP_DTYPE, idx, pairs.current_code, pairs.next_code,
+                        -pairs.gap[idx], pairs.current_end)
+
+def transition_table(segments, pairs=None):
+    """Speaker changes between consecutive segments, as a TRANSITION_DTYPE array."""
+    if pairs is None:
+        pairs = adjacent_pairs(segments)
+    idx = np.flatnonzero(pairs.current_code != pairs.next_code)
+    return _event_table(TRANSITION_DTYPE, idx, pairs.current_code, pairs.next_code,
+                        pairs.gap[idx], pairs.current_end)
+
+def transition_count_matrix(transitions, n_speakers):
+    """Speaker x speaker transition counts (rows source, columns target, by speaker code)."""
+    flat = transitions['source'].astype(np.int64) * n_speakers + transitions['target']
+    return np.bincount(flat, minlength=n_speakers * n_speakers).reshape(n_speakers, n_speakers)
+
+def interruption_records(events, speakers):
+    """Dict-shaped interruptions (as returned by detect_interruptions) from an INTERRUPTION_DTYPE array."""
+    return [
+        {'interrupted': speakers[a], 'interrupter': speakers[b], 'gap': g, 'time': time}
+        for a, b, g, time in zip(events['interrupted'].tolist(), events['interrupter'].tolist(),
+                                 events['gap'].tolist(), events['time'].tolist())
+    ]
+
+def overlap_records(events, speakers):
+    """Dict-shaped overlaps (as returned by detect_interruptions) from an OVERLAP_DTYPE array."""
+    return [
+        {'speaker1': speakers[a], 'speaker2': speakers[b], 'overlap_duration': duration, 'time': time}
+        for a, b, duration, time in zip(events['speaker1'].tolist(), events['speaker2'].tolist(),
+                                        events['overlap_duration'].tolist(), events['time'].tolist())
+    ]
+
+def transition_graph(events, speakers):
+    """Transition counts and gap lists per (source, target) edge, in first-seen order,
+    from a TRANSITION_DTYPE array (as returned by build_interaction_graph)."""
+    if len(events) == 0:
+        return {}, {}
+
+    n_speakers = len(speakers)
+    edge_codes = events['source'].astype(np.int64) * n_speakers + events['target']
+    edges, inverse, counts = np.unique(edge_codes, return_inverse=True, return_counts=True)
+    order = np.argsort(inverse, kind='stable')
+    gaps_by_edge = np.split(events['gap'][order], np.cumsum(counts)[:-1])
+
+    transitions = {}
+    transition_durations = {}
+    for e in _first_seen_order(inverse):
+        source, target = divmod(int(edges[e]), n_speakers)
+        edge = (speakers[source], speakers[target])
+        transitions[edge] = int(counts[e])
+        transition_durations[edge] = gaps_by_edge[e].tolist()
+
+    return transitions, transition_durations
+
+def detect_word_overlaps(words, speakers, min_duration=0.0):
+    """Detect simultaneous speech from word timings with a sweep line.
+    Word intervals are turned into start/end events and sorted once (O(W log W));
+    a single sweep tracks which speakers have a word in progress. An overlap
+    episode is a maximal stretch with two or more distinct speakers active.
+    Returns (episodes, matrix): episode dicts with start, end, duration and
+    participants, and a symmetric speakers x speakers matrix of seconds each
+    pair spent speaking at the same time (indexed by speaker code)."""
+    n_speakers = len(speakers)
+    matrix = np.zeros((n_speakers, n_speakers))
+    timed = words[words['end'] > words['start']]
+    if len(timed) == 0:
+        return [], matrix
+    
+    # Events sorted by time. All events at one timestamp are applied before the
+    # episode is updated, so words that merely touch do not overlap, and a speaker
+    # whose consecutive words touch stays active across the boundary
+    times = np.concatenate([timed['start'], timed['end']])
+    deltas = np.concatenate([np.ones(len(timed), dtype=np.int64), -np.ones(len(timed), dtype=np.int64)])
+    event_speakers = np.concatenate([timed['speaker'], timed['speaker']]).astype(np.int64)
+    order = np.argsort(times, kind='stable')
+    times, deltas, event_speakers = times[order].tolist(), deltas[order].tolist(), event_speakers[order].tolist()
+    
+    active = np.zeros(n_speakers, dtype=np.int64)
+    active_set = set()
+    episodes = []
+    episode_start = None
+    participants = set()
+    previous_time = None
+    
+    for k, (t, delta, speaker) in enumerate(zip(times, deltas, event_speakers)):
+        if len(active_set) >= 2 and t > previous_time:
+            # Credit the elapsed stretch to every pair speaking during it
+            members = sorted(active_set)
+            dt = t - previous_time
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    matrix[a, b] += dt
+                    matrix[b, a] += dt
+        previous_time = t
         
-        # Check for overlap
-        if current['end'] > next_seg['start']:
-            overlap_duration = current['end'] - next_seg['start']
-            overlaps.append({
-                'speaker1': current_speaker,
-                'speaker2': next_speaker,
-                'overlap_duration': overlap_duration,
-                'time': current['end']
-            })
+        active[speaker] += delta
+        if active[speaker] == 0:
+            active_set.discard(speaker)
+        else:
+            active_set.add(speaker)
+        if k + 1 < len(times) and times[k + 1] == t:
+            continue  # More events at this timestamp
         
-        # Check for rapid turn-taking (potential interruption)
-        if current_speaker != next_speaker:
-            gap = next_start - current_end
-            if gap < threshold:
-                interruptions.append({
-                    'interrupted': current_speaker,
-                    'interrupter': next_speaker,
-                    'gap': gap,
-                    'time': current_end
+        if len(active_set) >= 2:
+            if episode_start is None:
+                episode_start = t
+            participants.update(active_set)
+        elif episode_start is not None:
+            if t - episode_start >= min_duration and t > episode_start:
+                episodes.append({
+                    'start': episode_start,
+                    'end': t,
+                    'duration': t - episode_start,
+                    'participants': [speakers[code] for code in sorted(participants)]
                 })
+            episode_start = None
+            participants = set()
     
+    return episodes, matrix
+
+def word_overlap_summary(episodes, matrix, speakers):
+    """Report/export form of detect_word_overlaps: totals, per-speaker overlap time and the
+    overlap matrix restricted to speakers who overlapped at all."""
+    involved = np.flatnonzero(matrix.sum(axis=1) > 0)
+    names = [speakers[code] for code in involved.tolist()]
+    return {
+        'total_episodes': len(episodes),
+        'total_duration': float(sum(e['duration'] for e in episodes)),
+        'overlap_time_by_speaker': {name: float(matrix[code].sum()) for name, code in zip(names, involved.tolist())},
+        'overlap_matrix': {
+            'speakers': names,
+            'matrix': matrix[np.ix_(involved, involved)].tolist()
+        }
+    }
+
+def detect_interruptions(segments, threshold=0.5, pairs=None):
+    """Detect potential interruptions and overlaps."""
+    table = as_segment_table(segments)
+    if pairs is None:
+        pairs = adjacent_pairs(table)
+    interruptions = interruption_records(interruption_table(table, threshold, pairs), table.speakers)
+    overlaps = overlap_records(overlap_table(table, pairs), table.speakers)
     return interruptions, overlaps
 
-def build_interaction_graph(segments):
+def build_interaction_graph(segments, pairs=None):
     """Build directed graph of speaker transitions."""
-    transitions = defaultdict(int)
-    transition_durations = defaultdict(list)
-    
-    for i in range(len(segments) - 1):
-        current = segments[i]
-        next_seg = segments[i + 1]
-        
-        current_speaker = get_speaker(current)
-        next_speaker = get_speaker(next_seg)
-        
-        if current_speaker != next_speaker:
-            edge = (current_speaker, next_speaker)
-            transitions[edge] += 1
-            transition_durations[edge].append(next_seg['start'] - current['end'])
-    
-    return dict(transitions), dict(transition_durations)
+    table = as_segment_table(segments)
+    return transition_graph(transition_table(table, pairs), table.speakers)
 
-def build_response_oriented_graph(segments, turns):
+def build_response_oriented_graph(segments, turns=None):
     """Build graph where edges represent responses, showing who orients to whom.
     Edge weight encodes duration of response chains, capturing capacity to elicit extended uptake."""
-    responses = defaultdict(lambda: {'count': 0, 'total_duration': 0, 'durations': []})
+    table = as_segment_table(segments)
+    runs = table.speaker_runs()
+    if len(runs) < 2:
+        return {}
     
-    # Map segments to turns
-    turn_map = {}
-    for turn in turns:
-        for seg in segments:
-            seg_speaker = get_speaker(seg)
-            if seg_speaker == turn['speaker'] and seg['start'] >= turn['start'] and seg['end'] <= turn['end']:
-                turn_map[id(seg)] = turn
-    
-    # Find response chains: when speaker B responds to speaker A
-    for i in range(len(segments) - 1):
-        current = segments[i]
-        next_seg = segments[i + 1]
-        
-        current_speaker = get_speaker(current)
-        next_speaker = get_speaker(next_seg)
-        
-        if current_speaker != next_speaker:
-            # This is a response: B responds to A
-            edge = (current_speaker, next_speaker)
-            
-            # Calculate response chain duration: how long does B's response continue?
-            response_duration = 0
-            j = i + 1
-            while j < len(segments):
-                seg = segments[j]
-                if get_speaker(seg) == next_speaker:
-                    response_duration += seg['end'] - seg['start']
-                    j += 1
-                else:
-                    break
-            
-            responses[edge]['count'] += 1
-            responses[edge]['total_duration'] += response_duration
-            responses[edge]['durations'].append(response_duration)
+    # Every speaker change starts a response: B (run k + 1) responds to A (run k).
+    # The response chain is B's whole same-speaker run of segments.
+    chain_duration = runs['duration'][1:]
+    n_speakers = len(table.speakers)
+    edge_codes = runs['speaker'][:-1].astype(np.int64) * n_speakers + runs['speaker'][1:]
+    
+    edges, inverse, counts = np.unique(edge_codes, return_inverse=True, return_counts=True)
+    totals = np.bincount(inverse, weights=chain_duration, minlength=len(edges))
+    longest = np.full(len(edges), -np.inf)
+    np.maximum.at(longest, inverse, chain_duration)
     
     # Calculate average response chain duration
     response_graph = {}
-    for edge, data in responses.items():
-        response_graph[edge] = {
-            'frequency': data['count'],
-            'total_duration': data['total_duration'],
-            'avg_duration': data['total_duration'] / data['count'] if data['count'] > 0 else 0,
-            'max_duration': max(data['durations']) if data['durations'] else 0
+    for e in _first_seen_order(inverse):
+        source, target = divmod(int(edges[e]), n_speakers)
+        count = int(counts[e])
+        response_graph[(table.speakers[source], table.speakers[target])] = {
+            'frequency': count,
+            'total_duration': float(totals[e]),
+            'avg_duration': float(totals[e]) / count if count > 0 else 0,
+            'max_duration': float(longest[e])
         }
     
     return response_graph
 
-def detect_failed_interruptions(segments, interruptions, turns):
+class StructuralMetrics:
+    """Segment-level structural measures of a meeting, computed together.
+
+    Speaker codes, the adjacent-segment arrays and the speaker runs are derived
+    once from the segment table and shared by every measure, instead of each
+    analysis walking the segment list and resolving speakers again. Attributes
+    hold exactly what the corresponding functions return; plotting and export
+    functions accept the object in place of recomputing. The *_events
+    attributes are the underlying structured arrays, and transition_counts is
+    the speaker x speaker matrix indexed by speaker code.
+    """
+
+    def __init__(self, segments, interruption_threshold=0.5, silence_threshold=2.0):
+        self.segments = as_segment_table(segments)
+        self.pairs = adjacent_pairs(self.segments)
+
+        self.speaker_times, self.total_time = compute_speaking_time(self.segments)
+        self._participation = {}
+        self.turns, self.turn_stats = compute_turn_taking(self.segments)
+        speakers = self.segments.speakers
+        self.interruption_events = interruption_table(self.segments, interruption_threshold, self.pairs)
+        self.overlap_events = overlap_table(self.segments, self.pairs)
+        self.transition_events = transition_table(self.segments, self.pairs)
+        self.transition_counts = transition_count_matrix(self.transition_events, len(speakers))
+        self.interruptions = interruption_records(self.interruption_events, speakers)
+        self.overlaps = overlap_records(self.overlap_events, speakers)
+        self.transitions, self.transition_durations = transition_graph(self.transition_events, speakers)
+        self.runs = self.segments.speaker_runs()
+        self.response_graph = build_response_oriented_graph(self.segments)
+        self.attractor_scores = identify_conversational_attractors(self.response_graph, self.speaker_times,
+                                                                   self.runs, self.segments.speakers)
+
+        self.agenda_introductions = _agenda_introductions(self.runs['speaker'], self.runs['start'],
+                                                          self.runs['end'], self.segments.speakers,
+                                                          silence_threshold)
+
+        # Non-negative gaps between consecutive segments, with transition type and time
+        gap = self.pairs.gap
+        kept = np.flatnonzero(gap >= 0)
+        self.gaps = gap[kept]
+        self.gap_same_speaker = (self.pairs.current_code == self.pairs.next_code)[kept]
+        self.gap_times = self.pairs.current_end[kept]
+        self.gap_stats = gap_statistics(gap, self.pairs.current_code == self.pairs.next_code)
+
+    def participation(self, n_bins=20, bin_width=None):
+        """Cached participation_matrix for this meeting, shared by the heatmap and the export."""
+        key = (n_bins, bin_width) if bin_width is None else (None, bin_width)
+        if key not in self._participation:
+            self._participation[key] = participation_matrix(self.segments, self.total_time, n_bins, bin_width)
+        return self._participation[key]
+
+    def timeline_records(self):
+        """Non-filler segments as speaker/start/end/duration records."""
+        table = self.segments
+        idx = np.flatnonzero(~table.filler)
+        return [
+            {'speaker': table.speakers[code], 'start': start, 'end': end, 'duration': end - start}
+            for code, start, end in zip(table.speaker[idx].tolist(), table.start[idx].tolist(),
+                                        table.end[idx].tolist())
+        ]
+
+    def gap_records(self):
+        """Non-negative gaps as gap/type/time records."""
+        return [
+            {'gap': gap, 'type': 'same_speaker' if same else 'speaker_change', 'time': time}
+            for gap, same, time in zip(self.gaps.tolist(), self.gap_same_speaker.tolist(), self.gap_times.tolist())
+        ]
+
+class _RunningMedian:
+    """Median of a growing multiset of numbers: a max-heap holds the lower half and a
+    min-heap the upper half, so an insert is O(log n) and the median O(1). An even
+    count averages the two middle values, as np.median does."""
+
+    __slots__ = ('_lower', '_upper')
+
+    def __init__(self):
+        self._lower = []  # Negated, so heap[0] is the largest of the lower half
+        self._upper = []
+
+    def __len__(self):
+        return len(self._lower) + len(self._upper)
+
+    def add(self, value):
+        if self._lower and value > -self._lower[0]:
+            heapq.heappush(self._upper, value)
+        else:
+            heapq.heappush(self._lower, -value)
+        if len(self._lower) > len(self._upper) + 1:
+            heapq.heappush(self._upper, -heapq.heappop(self._lower))
+        elif len(self._upper) > len(self._lower):
+            heapq.heappush(self._lower, -heapq.heappop(self._upper))
+
+    def median(self):
+        if len(self._lower) > len(self._upper):
+            return -self._lower[0]
+        return (-self._lower[0] + self._upper[0]) / 2
+
+class _ListView(Sequence):
+    """Read-only view of an append-only list as it was when the view was taken.
+    Later appends are not seen, and the last item is pinned so that replacing the
+    list's last slot (as an extended turn does) does not show through either."""
+
+    __slots__ = ('_items', '_length', '_last')
+
+    def __init__(self, items):
+        self._items = items
+        self._length = len(items)
+        self._last = items[-1] if items else None
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('view index out of range')
+        return self._last if index == self._length - 1 else self._items[index]
+
+    def __eq__(self, other):
+        return isinstance(other, Sequence) and len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return f'_ListView({list(self)!r})'
+
+class IncrementalAnalyzer:
+    """Structural metrics of a meeting that is still in progress.
+
+    Segments are fed in arrival order with add_segment() or add_segments();
+    each update does a constant amount of work (appends, counter updates and
+    O(log n) running-median inserts), keeping the open turn, the previous
+    segment and running per-speaker totals. snapshot() assembles the current
+    metrics in the shapes StructuralMetrics and main() use, so after the last
+    segment of a transcript it reproduces the batch results. A snapshot costs
+    time proportional to the number of speakers and speaker pairs, not to the
+    length of the meeting: gap summaries are kept up to date as gaps arrive,
+    and the growing lists are returned as read-only views (_ListView).
+    """
+
+    def __init__(self, interruption_threshold=0.5, silence_threshold=2.0):
+        self.interruption_threshold = interruption_threshold
+        self.silence_threshold = silence_threshold
+        self.n_segments = 0
+        self.speaker_times = {}
+        self.total_time = 0
+        self.turns = []
+        self.interruptions = []
+        self.overlaps = []
+        self.transitions = {}
+        self.transition_durations = {}
+        self.agenda_introductions = []
+        # Every consecutive-segment gap (overlaps included) and whether the speaker stayed
+        self.gaps = array('d')
+        self.gap_same_speaker = array('b')
+        # Running summaries of the non-negative gaps, typed as _split_gaps does: the k-th
+        # non-negative gap takes the transition type of the k-th gap overall
+        self._gap_sum = 0.0
+        self._gap_medians = {'all': _RunningMedian(), 'same_speaker': _RunningMedian(),
+                             'speaker_change': _RunningMedian()}
+        self._gap_stats = None  # Cached until the next non-negative gap
+        # Per-speaker turn statistics in order of first turn; count and total cover closed
+        # turns, durations also holds the open turn's duration in its last slot
+        self._turn_stats = {}
+        self._previous = None
+
+    def add_segment(self, seg):
+        """Add one transcript segment (a dict with start, end, text and speaker or words)."""
+        speaker = get_speaker(seg)
+        start, end = float(seg['start']), float(seg['end'])
+        index = self.n_segments
+        self.n_segments += 1
+
+        # Only count non-filler segments for speaking time
+        if not is_filler(seg.get('text', '')):
+            self.speaker_times[speaker] = self.speaker_times.get(speaker, 0.0) + (end - start)
+        self.total_time = max(self.total_time, end)
+
+        previous = self._previous
+        if previous is not None:
+            previous_speaker, previous_end = previous
+            gap = start - previous_end
+            self.gaps.append(gap)
+            self.gap_same_speaker.append(previous_speaker == speaker)
+            if gap < 0:
+                self.overlaps.append({'speaker1': previous_speaker, 'speaker2': speaker,
+                                      'overlap_duration': -gap, 'time': previous_end})
+            else:
+                self._add_gap(gap)
+            if previous_speaker != speaker:
+                if gap < self.interruption_threshold:
+                    self.interruptions.append({'interrupted': previous_speaker, 'interrupter': speaker,
+                                               'gap': gap, 'time': previous_end})
+                edge = (previous_speaker, speaker)
+                self.transitions[edge] = self.transitions.get(edge, 0) + 1
+                self.transition_durations.setdefault(edge, []).append(gap)
+        self._previous = (speaker, end)
+
+        if self.turns and self.turns[-1]['speaker'] == speaker:
+            # Replace rather than mutate the open turn, so views taken earlier keep theirs
+            turn = self.turns[-1]
+            self.turns[-1] = {**turn, 'end': end, 'duration': end - turn['start'], 'last_segment': index}
+            self._turn_stats[speaker]['durations'][-1] = end - turn['start']
+            return
+
+        if self.turns:
+            self._close_turn(self.turns[-1])
+            silence = start - self.turns[-1]['end']
+        else:
+            # First turn is always an introduction
+            silence = start
+        if not self.turns or silence >= self.silence_threshold:
+            self.agenda_introductions.append({'speaker': speaker, 'time': start, 'preceding_silence': silence})
+        self.turns.append({'speaker': speaker, 'start': start, 'end': end, 'duration': end - start,
+                           'first_segment': index, 'last_segment': index})
+        stats = self._turn_stats.setdefault(speaker, {'count': 0, 'total_duration': 0.0, 'durations': []})
+        stats['durations'].append(end - start)
+
+    def add_segments(self, segments):
+        """Add a batch of segments in order."""
+        for seg in segments:
+            self.add_segment(seg)
+
+    def _add_gap(self, gap):
+        same = self.gap_same_speaker[len(self._gap_medians['all'])]
+        self._gap_sum += gap
+        self._gap_medians['all'].add(gap)
+        self._gap_medians['same_speaker' if same else 'speaker_change'].add(gap)
+        self._gap_stats = None
+
+    def _close_turn(self, turn):
+        stats = self._turn_stats[turn['speaker']]
+        stats['count'] += 1
+        stats['total_duration'] += turn['duration']
+
+    def gap_stats(self):
+        """Gap summaries as gap_statistics returns them ({} before the first non-negative gap)."""
+        medians = self._gap_medians
+        if self._gap_stats is None and len(medians['all']):
+            self._gap_stats = {
+                'median_gap': medians['all'].median(),
+                'mean_gap': self._gap_sum / len(medians['all']),
+                'same_speaker_median': medians['same_speaker'].median() if len(medians['same_speaker']) else 0,
+                'speaker_change_median': medians['speaker_change'].median() if len(medians['speaker_change']) else 0
+            }
+        return dict(self._gap_stats or {})
+
+    def turn_stats(self):
+        """Per-speaker turn statistics including the open turn, as compute_turn_taking returns them."""
+        open_speaker = self.turns[-1]['speaker'] if self.turns else None
+        turn_stats = {}
+        for speaker, stats in self._turn_stats.items():
+            count, total = stats['count'], stats['total_duration']
+            if speaker == open_speaker:
+                count += 1
+                total += self.turns[-1]['duration']
+            turn_stats[speaker] = {'count': count, 'total_duration': total,
+                                   'durations': _ListView(stats['durations']), 'avg_duration': total / count}
+        return turn_stats
+
+    def snapshot(self):
+        """Current metrics, safe to keep while segments keep arriving. Per-speaker and
+        per-pair mappings are fresh dicts; the growing sequences (turns, interruptions,
+        overlaps, introductions, durations) are read-only _ListView snapshots."""
+        return {
+            'segments': self.n_segments,
+            'speaker_times': dict(self.speaker_times),
+            'total_time': self.total_time,
+            'turns': _ListView(self.turns),
+            'turn_stats': self.turn_stats(),
+            'interruptions': _ListView(self.interruptions),
+            'overlaps': _ListView(self.overlaps),
+            'transitions': dict(self.transitions),
+            'transition_durations': {edge: _ListView(gaps) for edge, gaps in self.transition_durations.items()},
+            'agenda_introductions': _ListView(self.agenda_introductions),
+            'gap_stats': self.gap_stats(),
+            'inequality_metrics': calculate_inequality_metrics(self.speaker_times)
+        }
+
+def detect_failed_interruptions(segments, interruptions, turns, continuation_window=2.0):
     """Detect failed interruptions: interruption attempts where floor is maintained.
-    Interruption tolerance = who is interrupted without losing the floor."""
+    Interruption tolerance = who is interrupted without losing the floor.
+    Both lookups per interruption - the interrupted turn and the interrupted
+    speaker's continuation - are binary searches over per-speaker sorted arrays.
+    Each record carries the interruption_id (index into interruptions) it describes."""
+    table = as_segment_table(segments)
+    time_index = TimeIndex(table, [])
+    
+    # Turn interval index: per speaker, turns in start order with a running max of their ends,
+    # so the first turn (in start order) still open at time t is one binary search away
+    turn_start = np.array([turn['start'] for turn in turns], dtype=np.float64)
+    turn_end = np.array([turn['end'] for turn in turns], dtype=np.float64)
+    turn_order = np.argsort(turn_start, kind='stable')
+    turns_by_speaker = defaultdict(list)
+    for k in turn_order.tolist():
+        turns_by_speaker[turns[k]['speaker']].append(k)
+    turn_index = {}
+    for speaker, ks in turns_by_speaker.items():
+        ks = np.array(ks, dtype=np.int64)
+        turn_index[speaker] = (turn_start[ks], np.maximum.accumulate(turn_end[ks]), ks)
+    
     failed_interruptions = []
     interruption_tolerance = defaultdict(lambda: {'attempts': 0, 'maintained_floor': 0})
     
-    # Create turn timeline
-    turn_timeline = sorted(turns, key=lambda x: x['start'])
-    
-    for inter in interruptions:
+    for interruption_id, inter in enumerate(interruptions):
         inter_time = inter['time']
         interrupted_speaker = inter['interrupted']
         interrupter = inter['interrupter']
         
-        # Find the turn that was interrupted
-        interrupted_turn = None
-        for turn in turn_timeline:
-            if turn['speaker'] == interrupted_speaker and turn['start'] <= inter_time <= turn['end']:
-                interrupted_turn = turn
-                break
+        # Find the turn that was interrupted: the first one with start <= t <= end
+        if interrupted_speaker not in turn_index:
+            continue
+        starts, running_end, ks = turn_index[interrupted_speaker]
+        opened = np.searchsorted(starts, inter_time, side='right')
+        first_open = np.searchsorted(running_end, inter_time, side='left')
+        if first_open >= opened:
+            continue
+        interrupted_end = turn_end[ks[first_open]]
         
-        if interrupted_turn:
-            # Check if interrupted speaker continues after interruption
-            # Look for next segment by interrupted speaker after interruption
-            continued = False
-            continuation_time = None
-            
-            for seg in segments:
-                seg_speaker = get_speaker(seg)
-                if seg_speaker == interrupted_speaker and seg['start'] > inter_time:
-                    # Check if this is continuation of same turn or new turn
-                    if interrupted_turn['end'] > seg['start'] or (seg['start'] - interrupted_turn['end']) < 2.0:
-                        continued = True
-                        continuation_time = seg['start']
-                        break
-            
-            interruption_tolerance[interrupted_speaker]['attempts'] += 1
-            
-            if continued:
-                failed_interruptions.append({
-                    'interrupted': interrupted_speaker,
-                    'interrupter': interrupter,
-                    'time': inter_time,
-                    'maintained_floor': True,
-                    'continuation_time': continuation_time,
-                    'gap': continuation_time - inter_time if continuation_time else None
-                })
-                interruption_tolerance[interrupted_speaker]['maintained_floor'] += 1
-            else:
-                failed_interruptions.append({
-                    'interrupted': interrupted_speaker,
-                    'interrupter': interrupter,
-                    'time': inter_time,
-                    'maintained_floor': False
-                })
+        # Check if interrupted speaker continues after interruption: the first segment
+        # (in list order) starting after t that continues the turn or follows it within the window
+        continuation_time = None
+        # One ulp of slack so the exact test below decides boundary cases
+        horizon = np.nextafter(interrupted_end + continuation_window, np.inf)
+        candidates = time_index.speaker_segments_between(interrupted_speaker, inter_time, horizon)
+        if len(candidates):
+            cand_start = table.start[candidates]
+            continues = (interrupted_end > cand_start) | ((cand_start - interrupted_end) < continuation_window)
+            if continues.any():
+                continuation_time = float(table.start[candidates[continues].min()])
+        continued = continuation_time is not None
+        
+        interruption_tolerance[interrupted_speaker]['attempts'] += 1
+        
+        if continued:
+            failed_interruptions.append({
+                'interruption_id': interruption_id,  # Position in the interruptions list
+                'interrupted': interrupted_speaker,
+                'interrupter': interrupter,
+                'time': inter_time,
+                'maintained_floor': True,
+                'continuation_time': continuation_time,
+                'gap': continuation_time - inter_time if continuation_time else None
+            })
+            interruption_tolerance[interrupted_speaker]['maintained_floor'] += 1
+        else:
+            failed_interruptions.append({
+                'interruption_id': interruption_id,  # Position in the interruptions list
+                'interrupted': interrupted_speaker,
+                'interrupter': interrupter,
+                'time': inter_time,
+                'maintained_floor': False
+            })
     
     # Calculate tolerance rates
     tolerance_rates = {}
@@ -294,47 +1179,94 @@ def detect_failed_interruptions(segments, interruptions, turns):
     
     return failed_interruptions, tolerance_rates
 
+def _latency_summary(latencies):
+    latencies = np.asarray(latencies, dtype=np.float64)
+    if len(latencies) == 0:
+        return {'count': 0}
+    p25, median, p75, p90 = np.percentile(latencies, [25, 50, 75, 90]).tolist()
+    return {
+        'count': int(len(latencies)),
+        'mean': float(latencies.mean()),
+        'median': median,
+        'p25': p25,
+        'p75': p75,
+        'p90': p90,
+        'min': float(latencies.min()),
+        'max': float(latencies.max())
+    }
+
+def floor_recovery_latency(failed_interruptions, bins=(0, 0.5, 1, 2, 5, 10, 30, np.inf)):
+    """Distribution of the delay between an interruption and the interrupted speaker's
+    continuation, overall and per interrupted speaker (maintained-floor cases only)."""
+    latencies = defaultdict(list)
+    for f in failed_interruptions:
+        if f['maintained_floor'] and f.get('gap') is not None:
+            latencies[f['interrupted']].append(f['gap'])
+    
+    all_latencies = [gap for gaps in latencies.values() for gap in gaps]
+    counts, edges = np.histogram(all_latencies, bins=np.asarray(bins, dtype=np.float64))
+    return {
+        'overall': _latency_summary(all_latencies),
+        'histogram': {
+            'bin_edges': [edge if np.isfinite(edge) else None for edge in edges.tolist()],
+            'counts': counts.tolist()
+        },
+        'by_speaker': {speaker: _latency_summary(gaps) for speaker, gaps in latencies.items()}
+    }
+
 def create_floor_holding_timeline(segments, interruptions, failed_interruptions, speaker_times):
     """Create timeline showing floor holding with interruption attempts marked.
-    Shows uninterrupted stretches in relation to attempted interruptions."""
-    top_speakers = sorted(speaker_times.items(), key=lambda x: x[1], reverse=True)[:10]
-    top_speaker_set = set([s[0] for s in top_speakers])
+    Shows uninterrupted stretches in relation to attempted interruptions.
+    Covers every speaker; markers are joined to their failed-interruption record by interruption_id."""
+    table = as_segment_table(segments)
     
     # Create timeline data with interruption markers
-    timeline_data = []
-    interruption_markers = []
+    speech = np.flatnonzero(~table.filler)
+    timeline_data = [
+        {'speaker': table.speakers[code], 'start': start, 'end': end, 'duration': end - start}
+        for code, start, end in zip(table.speaker[speech].tolist(), table.start[speech].tolist(),
+                                    table.end[speech].tolist())
+    ]
     
-    for seg in segments:
-        speaker = get_speaker(seg)
-        if speaker in top_speaker_set and not is_filler(seg['text']):
-            timeline_data.append({
-                'speaker': speaker,
-                'start': seg['start'],
-                'end': seg['end'],
-                'duration': seg['end'] - seg['start']
-            })
+    # Index failed-interruption records by the interruption they describe. Records
+    # without an id (e.g. loaded from an older export) are bucketed by speaker and time.
+    failed_by_id = {}
+    failed_by_bucket = defaultdict(list)
+    for f in failed_interruptions:
+        if 'interruption_id' in f:
+            failed_by_id.setdefault(f['interruption_id'], f)
+        else:
+            failed_by_bucket[(f['interrupted'], int(np.floor(f['time'] / 0.1)))].append(f)
     
     # Mark interruptions
-    for inter in interruptions:
+    interruption_markers = []
+    for k, inter in enumerate(interruptions):
         interrupted = inter['interrupted']
-        if interrupted in top_speaker_set:
-            # Check if floor was maintained
-            failed = next((f for f in failed_interruptions if 
-                          f['interrupted'] == interrupted and 
-                          abs(f['time'] - inter['time']) < 0.1), None)
-            
-            interruption_markers.append({
-                'time': inter['time'],
-                'interrupted': interrupted,
-                'interrupter': inter['interrupter'],
-                'maintained': failed['maintained_floor'] if failed else False
-            })
+        # Check if floor was maintained
+        failed = failed_by_id.get(k)
+        if failed is None and failed_by_bucket:
+            bucket = int(np.floor(inter['time'] / 0.1))
+            nearby = [f for b in (bucket - 1, bucket, bucket + 1) for f in failed_by_bucket.get((interrupted, b), [])
+                      if abs(f['time'] - inter['time']) < 0.1]
+            failed = nearby[0] if nearby else None
+        
+        interruption_markers.append({
+            'time': inter['time'],
+            'interrupted': interrupted,
+            'interrupter': inter['interrupter'],
+            'maintained': failed['maintained_floor'] if failed else False
+        })
     
     return timeline_data, interruption_markers
 
-def identify_conversational_attractors(response_graph, speaker_times):
+def identify_conversational_attractors(response_graph, speaker_times, runs=None, speakers=None):
     """Identify conversational attractors: speakers who elicit extended responses.
-    Based on response chain duration, not just frequency."""
+    Based on response chain duration, not just frequency.
+    Given the speaker runs (and speaker names for their codes), scores are taken
+    directly from consecutive runs instead of the aggregated response graph."""
+    if runs is not None:
+        return _attractors_from_runs(runs, speakers)
+    
     attractor_scores = defaultdict(lambda: {'incoming_responses': 0, 'total_response_duration': 0, 
                                             'avg_response_duration': 0, 'max_response_duration': 0})
     
@@ -352,34 +1284,86 @@ def identify_conversational_attractors(response_graph, speaker_times):
     
     return dict(attractor_scores)
 
+def _attractors_from_runs(runs, speakers):
+    # Run k + 1 is a response to run k's speaker; its duration is the response chain
+    source = runs['speaker'][:-1]
+    chain_duration = runs['duration'][1:]
+    n_speakers = len(speakers)
+    counts = np.bincount(source, minlength=n_speakers)
+    totals = np.bincount(source, weights=chain_duration, minlength=n_speakers)
+    longest = np.zeros(n_speakers)
+    np.maximum.at(longest, source, chain_duration)
+    
+    attractor_scores = {}
+    for code in _first_seen_order(source):
+        count = int(counts[code])
+        attractor_scores[speakers[code]] = {
+            'incoming_responses': count,
+            'total_response_duration': float(totals[code]),
+            'avg_response_duration': float(totals[code]) / count if count > 0 else 0,
+            'max_response_duration': float(longest[code])
+        }
+    return attractor_scores
+
 def extract_text_from_segment(seg):
     """Extract clean text from segment."""
-    text = seg.get('text', '').strip()
+    return clean_text(seg.get('text', ''))
+
+def clean_text(text):
+    """Strip and normalize raw segment text."""
+    text = text.strip()
     # Remove excessive punctuation and normalize
     text = re.sub(r'\.{3,}', '...', text)
     text = re.sub(r'\s+', ' ', text)
     return text
 
+def word_set_matrix(texts):
+    """Sparse binary document-term matrix over each text's lowercased whitespace tokens."""
+    vocabulary = {}
+    indices = []
+    indptr = [0]
+    for text in texts:
+        words = set(text.lower().split()) if text else set()
+        indices.extend(vocabulary.setdefault(word, len(vocabulary)) for word in words)
+        indptr.append(len(indices))
+    data = np.ones(len(indices))
+    return sparse.csr_matrix((data, np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+                             shape=(len(texts), len(vocabulary)))
+
+def jaccard_pairs(words, first, second):
+    """Word-overlap (Jaccard) similarity of row pairs (first[k], second[k]) of a word_set_matrix.
+    Pairs where either text has no words score 0."""
+    first = np.asarray(first, dtype=np.int64)
+    second = np.asarray(second, dtype=np.int64)
+    intersection = np.asarray(words[first].multiply(words[second]).sum(axis=1)).ravel()
+    sizes = words.getnnz(axis=1)
+    union = sizes[first] + sizes[second] - intersection
+    return np.divide(intersection, union, out=np.zeros(len(first)),
+                     where=(sizes[first] > 0) & (sizes[second] > 0))
+
+def jaccard_similarity_matrix(texts):
+    """Word-overlap (Jaccard) similarity between every pair of texts.
+    Intersections come from one sparse product of the binary document-term matrix and
+    unions from its row sums. Texts without words are similar only to themselves."""
+    words = word_set_matrix(texts)
+    intersection = (words @ words.T).toarray()
+    sizes = np.asarray(words.sum(axis=1)).ravel()
+    union = sizes[:, None] + sizes[None, :] - intersection
+    similarity_matrix = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+    np.fill_diagonal(similarity_matrix, 1.0)
+    return similarity_matrix
+
 def compute_semantic_similarity(texts, similarity_threshold=0.3):
     """Compute semantic similarity matrix using TF-IDF and cosine similarity."""
     if len(texts) < 2:
         return np.array([[1.0]])
     
     # Filter out empty texts
-    filtered_texts = [t for t in texts if t and len(t.strip()) > 0]
+    keep = np.array([bool(t and len(t.strip()) > 0) for t in texts])
+    filtered_texts = [t for t, kept in zip(texts, keep) if kept]
     if len(filtered_texts) < 2:
         # Fallback: simple word overlap
-        similarity_matrix = np.zeros((len(texts), len(texts)))
-        for i, text1 in enumerate(texts):
-            words1 = set(text1.lower().split()) if text1 else set()
-            for j, text2 in enumerate(texts):
-                words2 = set(text2.lower().split()) if text2 else set()
-                if words1 and words2:
-                    overlap = len(words1 & words2) / len(words1 | words2) if (words1 | words2) else 0
-                    similarity_matrix[i, j] = overlap
-                elif i == j:
-                    similarity_matrix[i, j] = 1.0
-        return similarity_matrix
+        return jaccard_similarity_matrix(texts)
     
     # Use TF-IDF vectorization
     try:
@@ -390,141 +1374,435 @@ def compute_semantic_similarity(texts, similarity_threshold=0.3):
         
         # Map back to original indices if some texts were filtered
         if len(filtered_texts) < len(texts):
+            rows = np.flatnonzero(keep)
             full_matrix = np.zeros((len(texts), len(texts)))
-            filtered_idx = 0
-            for i, text in enumerate(texts):
-                if text and len(text.strip()) > 0:
-                    full_idx = 0
-                    for j, text2 in enumerate(texts):
-                        if text2 and len(text2.strip()) > 0:
-                            full_matrix[i, j] = similarity_matrix[filtered_idx, full_idx]
-                            full_idx += 1
-                    filtered_idx += 1
+            full_matrix[np.ix_(rows, rows)] = similarity_matrix
             return full_matrix
         
         return similarity_matrix
     except Exception as e:
         # Fallback: simple word overlap
-        similarity_matrix = np.zeros((len(texts), len(texts)))
-        for i, text1 in enumerate(texts):
-            words1 = set(text1.lower().split()) if text1 else set()
-            for j, text2 in enumerate(texts):
-                words2 = set(text2.lower().split()) if text2 else set()
-                if words1 and words2:
-                    overlap = len(words1 & words2) / len(words1 | words2) if (words1 | words2) else 0
-                    similarity_matrix[i, j] = overlap
-                elif i == j:
-                    similarity_matrix[i, j] = 1.0
-        return similarity_matrix
+        return jaccard_similarity_matrix(texts)
+
+class TurnVectorSpace:
+    """Meeting-level vector space fitted once over all turn texts.
+
+    Every turn is a row of an L2-normalized sparse matrix, so a pairwise or
+    windowed similarity is a sparse row dot product rather than a new
+    vectorizer fit. Rows come from a similarity backend (TF-IDF by default,
+    see similarity_backends). Queries may be row indices or free text, which
+    is projected into the same space. When neither side has any term (e.g.
+    stop-word-only turns) the word-overlap (Jaccard) fallback is used instead,
+    computed from a sparse binary word matrix (see jaccard_pairs).
+    """
+
+    def __init__(self, texts, max_features=None, backend=None):
+        self.texts = list(texts)
+        self.backend = backend if backend is not None else TfidfBackend(max_features)
+        self.encoder = self.backend.fit(self.texts)
+        self.matrix = self.encoder.transform(self.texts)
+        self._no_terms = self.matrix.getnnz(axis=1) == 0
+        self._word_matrix = None
+        self._lagged = None
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def query_matrix(self, queries):
+        """Stack queries (row indices or free text) into one sparse matrix.
+        Returns (matrix, has_terms, texts); all free-text queries are projected in one transform."""
+        is_text = np.array([isinstance(q, str) for q in queries], dtype=bool)
+        row_idx = np.array([q for q in queries if not isinstance(q, str)], dtype=np.int64)
+        free_text = [q for q in queries if isinstance(q, str)]
+
+        stacked = self.matrix[row_idx]
+        if free_text:
+            projected = self.encoder.transform(free_text)
+            stacked = sparse.vstack([stacked, projected], format='csr')
+            # Restore query order: row-index queries were stacked first, then texts
+            order = np.argsort(np.concatenate([np.flatnonzero(~is_text), np.flatnonzero(is_text)]),
+                               kind='stable')
+            stacked = stacked[order]
+
+        texts = [q if isinstance(q, str) else self.texts[q] for q in queries]
+        return stacked, stacked.getnnz(axis=1) > 0, texts
+
+    def word_matrix(self):
+        """Binary word matrix of the turn texts (word_set_matrix), built on first use."""
+        if self._word_matrix is None:
+            self._word_matrix = word_set_matrix(self.texts)
+        return self._word_matrix
+
+    def lagged_similarities(self, max_lag):
+        """Banded similarity matrix: entry [i, lag - 1] is the similarity of row i to row i - lag
+        (NaN where i - lag < 0). Built from max_lag shifted row-wise dot products and cached,
+        so any window up to the largest lag computed so far needs no recomputation."""
+        if self._lagged is None or self._lagged.shape[1] < max_lag:
+            n = len(self)
+            lagged = np.full((n, max_lag), np.nan)
+            for lag in range(1, min(max_lag, n - 1) + 1):
+                products = self.matrix[lag:].multiply(self.matrix[:-lag])
+                lagged[lag:, lag - 1] = np.asarray(products.sum(axis=1)).ravel()
+                # Pairs with no vocabulary on either side use the word-overlap fallback
+                fallback = np.flatnonzero(self._no_terms[lag:] & self._no_terms[:-lag]) + lag
+                if len(fallback):
+                    lagged[fallback, lag - 1] = jaccard_pairs(self.word_matrix(), fallback, fallback - lag)
+            self._lagged = lagged
+        return self._lagged[:, :max_lag]
+
+    def max_similarity_to_preceding(self, window_size):
+        """For every row i, the max similarity to rows i - window_size .. i - 1 (-inf for row 0)."""
+        band = self.lagged_similarities(window_size)
+        return np.where(np.isnan(band), -np.inf, band).max(axis=1, initial=-np.inf)
+
+    def pair_similarities(self, queries, owner, rows):
+        """Cosine similarity for a batch of (query, row) pairs: pair k scores queries[owner[k]]
+        against row rows[k]. Only the requested pairs are computed, as one row-wise sparse
+        product of the gathered query and row matrices."""
+        owner = np.asarray(owner, dtype=np.int64)
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) == 0:
+            return np.zeros(0)
+        query_rows, has_terms, texts = self.query_matrix(queries)
+        sims = np.asarray(query_rows[owner].multiply(self.matrix[rows]).sum(axis=1)).ravel()
+
+        # Word-overlap fallback for pairs with no vocabulary on either side, over one
+        # word matrix of the queries and rows involved
+        fallback = np.flatnonzero(~has_terms[owner] & self._no_terms[rows])
+        if len(fallback):
+            fallback_queries, query_pos = np.unique(owner[fallback], return_inverse=True)
+            fallback_rows, row_pos = np.unique(rows[fallback], return_inverse=True)
+            words = word_set_matrix([texts[q] for q in fallback_queries.tolist()] +
+                                    [self.texts[r] for r in fallback_rows.tolist()])
+            sims[fallback] = jaccard_pairs(words, query_pos, len(fallback_queries) + row_pos)
+        return sims
 
-def detect_topic_proposals(segments, turns, similarity_threshold=0.25, window_size=5):
-    """Detect topic proposals: turns that introduce new lexical clusters not present in preceding turns."""
+    def similar_pairs(self, queries, threshold):
+        """All query pairs i < j with similarity >= threshold, as (i, j, similarity) arrays
+        sorted by (i, j). Computed as one upper-triangular sparse Q @ Q.T product pruned at
+        the threshold, so pairs without shared vocabulary are never materialized."""
+        query_rows, has_terms, texts = self.query_matrix(queries)
+        products = query_rows @ query_rows.T
+        if threshold > 0:
+            scores = sparse.triu(products, k=1).tocoo()
+            i, j, sims = scores.row.astype(np.int64), scores.col.astype(np.int64), scores.data
+        else:
+            # Non-positive threshold: every pair qualifies, including zero-similarity ones
+            i, j = np.triu_indices(len(texts), k=1)
+            sims = np.asarray(products.todense())[i, j] if len(texts) else np.zeros(0)
+        keep = sims >= threshold
+
+        # Word-overlap fallback for pairs with no vocabulary on either side
+        no_terms = np.flatnonzero(~has_terms)
+        if len(no_terms):
+            # Those pairs' dot products (zero) are superseded by the fallback scores
+            keep &= has_terms[i] | has_terms[j]
+        i, j, sims = i[keep], j[keep], sims[keep]
+        if len(no_terms) > 1:
+            words = word_set_matrix([texts[q] for q in no_terms.tolist()])
+            if threshold > 0:
+                # Only pairs sharing a word can score above zero
+                shared = sparse.triu(words @ words.T, k=1).tocoo()
+                a, b = shared.row.astype(np.int64), shared.col.astype(np.int64)
+            else:
+                a, b = np.triu_indices(len(no_terms), k=1)
+            fallback_sims = jaccard_pairs(words, a, b)
+            hit = fallback_sims >= threshold
+            i = np.concatenate([i, no_terms[a[hit]]])
+            j = np.concatenate([j, no_terms[b[hit]]])
+            sims = np.concatenate([sims, fallback_sims[hit]])
+
+        order = np.lexsort((j, i))
+        return i[order], j[order], sims[order]
+
+    def similarities(self, query, rows):
+        """Cosine similarity between a query (row index or text) and each of the given rows."""
+        return self.pair_similarities([query], np.zeros(len(rows), dtype=np.int64), rows)
+
+    def similarity(self, a, b):
+        """Cosine similarity between two queries, each a row index or free text."""
+        vectors, has_terms, texts = self.query_matrix([a, b])
+        if not has_terms.any():
+            return float(jaccard_pairs(word_set_matrix(texts), [0], [1])[0])
+        return float(vectors[0].multiply(vectors[1]).sum())
+
+def configure_similarity_backend(name='tfidf', **options):
+    """Select the similarity backend used by the topic functions.
+    Options are passed to similarity_backends.make_similarity_backend (e.g. cache_path, model_path)."""
+    global SIMILARITY_BACKEND
+    if name == 'tfidf':
+        SIMILARITY_BACKEND = make_similarity_backend(name, **options) if options else None
+    else:
+        options.setdefault('cache_path', EMBEDDING_CACHE_PATH)
+        SIMILARITY_BACKEND = make_similarity_backend(name, **options)
+    return SIMILARITY_BACKEND
+
+def get_turn_vector_space(segments, turns, backend=None):
+    """Return the TurnVectorSpace for these turns, shared through the table when possible.
+    backend defaults to the configured SIMILARITY_BACKEND."""
+    if backend is None:
+        backend = SIMILARITY_BACKEND
+    shared = _shared_turn_data(turns, 'vector_space')
+    if shared is not None and shared[0] is backend:
+        return shared[1]
+    table = as_segment_table(segments)
+    rows = _table_turn_rows(table, turns)
+    if rows is not None and np.array_equal(rows, np.arange(len(rows))) and len(rows) == len(table.turn_bounds()[0]):
+        if backend not in table._turn_spaces:
+            table._turn_spaces[backend] = TurnVectorSpace(table.turn_texts(), backend=backend)
+        return table._turn_spaces[backend]
+    return TurnVectorSpace(get_turn_texts(segments, turns), backend=backend)
+
+def _topic_query(topic, space):
+    """Row index of a topic's proposing turn in the space, or its text if it cannot be located."""
+    text = topic.get('text', topic.get('text_sample', ''))
+    turn_index = topic.get('turn_index')
+    if turn_index is not None and 0 <= turn_index < len(space) and space.texts[turn_index] == text:
+        return turn_index
+    return text
+
+def detect_topic_proposals(segments, turns, similarity_threshold=0.25, window_size=5, method='window',
+                           vector_space=None):
+    """Detect topic proposals: turns that introduce new lexical clusters not present in preceding turns.
+    method='texttiling' segments the meeting with detect_topic_proposals_texttiling instead
+    (window_size is then the block size and similarity_threshold is not used)."""
+    if method == 'texttiling':
+        return detect_topic_proposals_texttiling(segments, turns, block_size=window_size,
+                                                 vector_space=vector_space)
+    if method != 'window':
+        raise ValueError(f"Unknown topic detection method: {method!r}")
     topic_proposals = []
     
     # Get turn texts with full content
-    turn_texts = []
-    turn_full_texts = []  # Store full text for each turn
-    for turn in turns:
-        # Collect all segment texts for this turn
-        turn_segments = [s for s in segments if 
-                        get_speaker(s) == turn['speaker'] and
-                        turn['start'] <= s['start'] <= turn['end']]
-        turn_text = ' '.join([extract_text_from_segment(s) for s in turn_segments 
-                              if not is_filler(s.get('text', ''))])
-        turn_texts.append(turn_text)
-        turn_full_texts.append(turn_text)  # Store full text
-    
-    # Compare each turn with preceding window
-    for i, turn in enumerate(turns):
-        if i < window_size:
-            # Early turns: compare with all preceding
-            preceding_texts = turn_texts[:i]
-        else:
-            # Later turns: compare with window
-            preceding_texts = turn_texts[i-window_size:i]
-        
-        if not preceding_texts or not turn_texts[i]:
+    turn_texts = get_turn_texts(segments, turns)
+    turn_full_texts = turn_texts  # Store full text for each turn
+    space = vector_space if vector_space is not None else get_turn_vector_space(segments, turns)
+    
+    # Max similarity of each turn to its preceding window (early turns: all preceding),
+    # from one banded pass over the shared turn matrix
+    similarity_to_preceding = space.max_similarity_to_preceding(window_size)
+    word_counts = np.array([len(text.split()) for text in turn_texts], dtype=np.int64)
+    
+    # If similarity is low, this is a potential topic proposal
+    is_proposal = (similarity_to_preceding < similarity_threshold) & (word_counts > 3)
+    is_proposal[:1] = False  # The first turn has nothing to compare with
+    
+    for i in np.flatnonzero(is_proposal).tolist():
+        turn = turns[i]
+        topic_proposals.append({
+            'topic_id': f'TOPIC_{len(topic_proposals)}',
+            'proposer': turn['speaker'],
+            'start_time': turn['start'],
+            'end_time': turn['end'],
+            'text': turn_full_texts[i],  # FULL TEXT, not truncated
+            'text_sample': turn_full_texts[i][:200],  # Sample for display
+            'similarity_to_preceding': float(similarity_to_preceding[i]),
+            'turn_index': i
+        })
+    
+    return topic_proposals
+
+def _block_similarity_scores(matrix, block_size):
+    """TextTiling gap scores: cosine similarity between the summed rows of the block_size rows
+    before and after each gap (gap i separates row i - 1 from row i, for i = 1 .. n - 1;
+    blocks are truncated at the ends). Block dot products and norms are sums of row dot
+    products over a band of lags, each read off a per-lag cumulative sum, so all gaps
+    cost O(n * block_size) in total."""
+    n = matrix.shape[0]
+    if n < 2:
+        return np.zeros(0)
+    k = block_size
+    max_lag = min(2 * k - 1, n - 1)
+    
+    # band[b, d] = x_b . x_(b - d); cumulative[b, d] = sum of band[:b, d]
+    band = np.zeros((n, max_lag + 1))
+    band[:, 0] = np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel()
+    for lag in range(1, max_lag + 1):
+        band[lag:, lag] = np.asarray(matrix[lag:].multiply(matrix[:-lag]).sum(axis=1)).ravel()
+    cumulative = np.vstack([np.zeros(max_lag + 1), np.cumsum(band, axis=0)])
+    
+    def lag_sum(d, lo, hi):
+        # Sum of x_b . x_(b - d) over b in [lo, hi), per gap
+        lo = np.minimum(lo, n)
+        hi = np.clip(hi, lo, n)
+        return cumulative[hi, d] - cumulative[lo, d]
+    
+    gaps = np.arange(1, n)
+    left_start = np.maximum(gaps - k, 0)
+    right_end = np.minimum(gaps + k, n)
+    
+    cross = np.zeros(len(gaps))
+    left_norm_sq = lag_sum(0, left_start, gaps)
+    right_norm_sq = lag_sum(0, gaps, right_end)
+    for d in range(1, max_lag + 1):
+        # Pairs (b - d, b) with b - d in the left block and b in the right block
+        cross += lag_sum(d, np.maximum(gaps, left_start + d), np.minimum(right_end, gaps + d))
+        if d < k:
+            left_norm_sq += 2 * lag_sum(d, left_start + d, gaps)
+            right_norm_sq += 2 * lag_sum(d, gaps + d, right_end)
+    
+    norms = np.sqrt(left_norm_sq * right_norm_sq)
+    return np.divide(cross, norms, out=np.zeros_like(cross), where=norms > 0)
+
+def _depth_scores(scores):
+    """TextTiling depth of each gap: how far its score lies below the peaks reached by climbing
+    left and right while scores keep rising. Each climb is one linear pass."""
+    left_peak = scores.copy()
+    right_peak = scores.copy()
+    for i in range(1, len(scores)):
+        if scores[i - 1] > scores[i]:
+            left_peak[i] = left_peak[i - 1]
+    for i in range(len(scores) - 2, -1, -1):
+        if scores[i + 1] > scores[i]:
+            right_peak[i] = right_peak[i + 1]
+    return (left_peak - scores) + (right_peak - scores)
+
+def detect_topic_proposals_texttiling(segments, turns, block_size=5, depth_cutoff=None, vector_space=None):
+    """Detect topic proposals by TextTiling over the sequence of turn vectors.
+    Gaps between turns are scored by the similarity of the blocks of block_size turns on
+    either side, and a topic boundary is placed at each gap whose depth score is a local
+    maximum above depth_cutoff (default: mean - std / 2 of all depths). The first
+    substantive turn (more than 3 words) after each boundary is the proposal, with the
+    block similarity at the boundary as its similarity_to_preceding."""
+    topic_proposals = []
+    turn_texts = get_turn_texts(segments, turns)
+    space = vector_space if vector_space is not None else get_turn_vector_space(segments, turns)
+    n = len(turn_texts)
+    
+    scores = _block_similarity_scores(space.matrix, block_size)
+    if len(scores) == 0:
+        return topic_proposals
+    depth = _depth_scores(scores)
+    if depth_cutoff is None:
+        depth_cutoff = depth.mean() - depth.std() / 2
+    
+    padded = np.concatenate([[-np.inf], depth, [-np.inf]])
+    is_peak = (depth >= padded[:-2]) & (depth >= padded[2:]) & (depth > 0)
+    boundaries = np.flatnonzero(is_peak & (depth > depth_cutoff)) + 1  # Turn index after each gap
+    
+    # First substantive turn at or after each boundary, kept if it precedes the next boundary
+    word_counts = np.array([len(text.split()) for text in turn_texts], dtype=np.int64)
+    candidates = np.where(word_counts > 3, np.arange(n), n)
+    next_substantive = np.minimum.accumulate(candidates[::-1])[::-1]
+    segment_end = np.append(boundaries[1:], n)
+    
+    for boundary, end in zip(boundaries.tolist(), segment_end.tolist()):
+        i = int(next_substantive[boundary])
+        if i >= end:
             continue
-        
-        # Compute similarity with preceding turns
-        comparison_texts = preceding_texts + [turn_texts[i]]
-        similarity_matrix = compute_semantic_similarity(comparison_texts)
-        
-        # Check if current turn is similar to any preceding turn
-        current_idx = len(comparison_texts) - 1
-        max_similarity = max([similarity_matrix[current_idx, j] 
-                             for j in range(len(preceding_texts))]) if preceding_texts else 0
-        
-        # If similarity is low, this is a potential topic proposal
-        if max_similarity < similarity_threshold and len(turn_texts[i].split()) > 3:
-            topic_proposals.append({
-                'topic_id': f'TOPIC_{len(topic_proposals)}',
-                'proposer': turn['speaker'],
-                'start_time': turn['start'],
-                'end_time': turn['end'],
-                'text': turn_full_texts[i],  # FULL TEXT, not truncated
-                'text_sample': turn_full_texts[i][:200],  # Sample for display
-                'similarity_to_preceding': max_similarity,
-                'turn_index': i
-            })
+        turn = turns[i]
+        topic_proposals.append({
+            'topic_id': f'TOPIC_{len(topic_proposals)}',
+            'proposer': turn['speaker'],
+            'start_time': turn['start'],
+            'end_time': turn['end'],
+            'text': turn_texts[i],  # FULL TEXT, not truncated
+            'text_sample': turn_texts[i][:200],  # Sample for display
+            'similarity_to_preceding': float(scores[boundary - 1]),
+            'turn_index': i
+        })
     
     return topic_proposals
 
-def check_topic_stabilization(topic_proposal, segments, turns, similarity_threshold=0.3, response_window=30):
+def benchmark_topic_detectors(segments, turns, similarity_threshold=0.25, window_size=5, repeats=5):
+    """Time the window and TextTiling topic detectors on the same fitted turn vector space
+    (best of repeats, caches cleared between runs) and report how many proposals each
+    makes and how many proposal turns they share."""
+    texts = get_turn_texts(segments, turns)
+    results = {}
+    for method in ('window', 'texttiling'):
+        best = np.inf
+        for _ in range(repeats):
+            space = TurnVectorSpace(texts, backend=SIMILARITY_BACKEND)
+            started = perf_counter()
+            proposals = detect_topic_proposals(segments, turns, similarity_threshold, window_size,
+                                               method=method, vector_space=space)
+            best = min(best, perf_counter() - started)
+        results[method] = {'seconds': best, 'proposals': len(proposals),
+                           'turns': {p['turn_index'] for p in proposals}}
+    
+    shared = results['window']['turns'] & results['texttiling']['turns']
+    for result in results.values():
+        result['turns'] = sorted(result['turns'])
+    results['shared_proposal_turns'] = len(shared)
+    return results
+
+def check_topic_stabilization(topic_proposal, segments, turns, similarity_threshold=0.3, response_window=30,
+                              turn_texts=None, time_index=None, vector_space=None):
     """Check if topic is stabilized: at least one other speaker responds with semantic overlap."""
-    proposal_text = topic_proposal['text']
-    proposal_time = topic_proposal['start_time']
-    proposer = topic_proposal['proposer']
-    
-    # Find turns after proposal within response window
-    subsequent_turns = [t for t in turns 
-                       if t['start'] > proposal_time and 
-                       t['start'] < proposal_time + response_window and
-                       t['speaker'] != proposer]
-    
-    if not subsequent_turns:
-        return {'stabilized': False, 'reason': 'no_response', 'responders': []}
-    
-    # Get texts of subsequent turns WITH FULL CONTENT
-    subsequent_texts = []
-    for turn in subsequent_turns:
-        turn_segments = [s for s in segments if 
-                        get_speaker(s) == turn['speaker'] and
-                        turn['start'] <= s['start'] <= turn['end']]
-        turn_text = ' '.join([extract_text_from_segment(s) for s in turn_segments 
-                              if not is_filler(s.get('text', ''))])
-        subsequent_texts.append((turn, turn_text))
-    
-    # Check semantic overlap
-    responders = []
-    for turn, text in subsequent_texts:
-        if not text:
+    return check_topic_stabilization_batch([topic_proposal], segments, turns, similarity_threshold,
+                                           response_window, turn_texts, time_index, vector_space)[0]
+
+def check_topic_stabilization_batch(proposals, segments, turns, similarity_threshold=0.3, response_window=30,
+                                    turn_texts=None, time_index=None, vector_space=None):
+    """Stabilization check for all proposals at once.
+
+    The response windows become one sparse proposals x turns candidate mask
+    (other speakers' non-empty turns starting within response_window of each
+    proposal), and every candidate pair is scored in a single sparse product.
+    Returns one result per proposal, as check_topic_stabilization would.
+    """
+    if time_index is None:
+        time_index = TimeIndex(segments, turns)
+    if turn_texts is None:
+        turn_texts = get_turn_texts(segments, turns)
+    if vector_space is None:
+        vector_space = get_turn_vector_space(segments, turns)
+    
+    # Candidate mask: turns after each proposal within the response window, by other speakers
+    proposal_times = np.array([p['start_time'] for p in proposals], dtype=np.float64)
+    owner, candidate = time_index.turns_between_many(proposal_times, proposal_times + response_window)
+    speaker_codes = {}
+    turn_speaker = np.array([speaker_codes.setdefault(t['speaker'], len(speaker_codes)) for t in turns],
+                            dtype=np.int64)
+    proposer = np.array([speaker_codes.get(p['proposer'], -1) for p in proposals], dtype=np.int64)
+    other = turn_speaker[candidate] != proposer[owner]
+    owner, candidate = owner[other], candidate[other]
+    has_response = np.bincount(owner, minlength=len(proposals)) > 0
+    
+    # Responses need text to be compared against
+    has_text = np.array([bool(text) for text in turn_texts], dtype=bool)
+    keep = has_text[candidate]
+    owner, candidate = owner[keep], candidate[keep]
+    
+    queries = [_topic_query(p, vector_space) for p in proposals]
+    similarities = vector_space.pair_similarities(queries, owner, candidate).tolist()
+    bounds = np.searchsorted(owner, np.arange(len(proposals) + 1)).tolist()
+    candidate = candidate.tolist()
+    
+    results = []
+    for p, topic_proposal in enumerate(proposals):
+        if not has_response[p]:
+            results.append({'stabilized': False, 'reason': 'no_response', 'responders': []})
             continue
-        comparison_texts = [proposal_text, text]
-        similarity_matrix = compute_semantic_similarity(comparison_texts)
-        similarity = similarity_matrix[0, 1]
+        proposal_time = topic_proposal['start_time']
         
-        if similarity >= similarity_threshold:
-            responders.append({
-                'speaker': turn['speaker'],
-                'time': turn['start'],
-                'similarity': similarity,
-                'response_delay': turn['start'] - proposal_time,
-                'response_text': text,  # FULL RESPONSE TEXT
-                'response_duration': turn['duration']
-            })
-        else:
-            # Also track non-uptake responses for analysis
-            responders.append({
-                'speaker': turn['speaker'],
-                'time': turn['start'],
-                'similarity': similarity,
-                'response_delay': turn['start'] - proposal_time,
-                'response_text': text,
-                'response_duration': turn['duration'],
-                'uptake': False  # Mark as non-uptake
-            })
-    
+        responders = [
+            _topic_response(turns[candidate[k]], turn_texts[candidate[k]], similarities[k], proposal_time,
+                            similarity_threshold)
+            for k in range(bounds[p], bounds[p + 1])
+        ]
+        results.append(_stabilization_result(responders, similarity_threshold))
+    
+    return results
+
+def _topic_response(turn, text, similarity, proposal_time, similarity_threshold):
+    """Response record of a turn answering a topic proposal."""
+    response = {
+        'speaker': turn['speaker'],
+        'time': turn['start'],
+        'similarity': similarity,
+        'response_delay': turn['start'] - proposal_time,
+        'response_text': text,  # FULL RESPONSE TEXT
+        'response_duration': turn['duration']
+    }
+    if similarity < similarity_threshold:
+        # Also track non-uptake responses for analysis
+        response['uptake'] = False
+    return response
+
+def _stabilization_result(responders, similarity_threshold):
+    """Stabilization verdict from a proposal's responses (other speakers' turns with text)."""
     # Filter to only uptake responses for stabilization check
     uptake_responders = [r for r in responders if r.get('similarity', 0) >= similarity_threshold]
     
@@ -537,50 +1815,283 @@ def check_topic_stabilization(topic_proposal, segments, turns, similarity_thresh
             'first_response_time': min([r['time'] for r in uptake_responders]),
             'first_response_delay': min([r['response_delay'] for r in uptake_responders])
         }
-    else:
-        return {
-            'stabilized': False,
-            'reason': 'no_semantic_overlap',
-            'responders': [],
-            'all_responses': responders  # Track all responses even if no uptake
-        }
+    return {
+        'stabilized': False,
+        'reason': 'no_semantic_overlap',
+        'responders': [],
+        'all_responses': responders  # Track all responses even if no uptake
+    }
 
-def analyze_topic_lifecycle(segments, turns, similarity_threshold=0.25, stabilization_threshold=0.3):
-    """Analyze complete topic lifecycle: emergence, stabilization, decay."""
-    # Detect topic proposals
-    proposals = detect_topic_proposals(segments, turns, similarity_threshold)
+def _topic_status(proposal, stabilization, next_turn_start):
+    """Lifecycle status of a proposal, given the start of the first turn after it (or None)."""
+    if stabilization['stabilized']:
+        return 'stabilized'
+    # Check if followed by silence, interruption, or unrelated speech
+    if next_turn_start is None or (next_turn_start - proposal['end_time']) > 5.0:
+        return 'failed_silence'
+    return 'failed_no_uptake'
+
+def _lifecycle_topic(proposal, status, stabilization):
+    """Topic record of analyze_topic_lifecycle for a proposal and its outcome."""
+    return {
+        'topic_id': proposal['topic_id'],
+        'proposer': proposal['proposer'],
+        'start_time': proposal['start_time'],
+        'end_time': proposal['end_time'],
+        'status': status,
+        'stabilization': stabilization,
+        'text': proposal['text'],  # FULL TEXT
+        'text_sample': proposal.get('text_sample', proposal['text'][:200]),
+        'similarity_to_preceding': proposal.get('similarity_to_preceding', 0),
+        'turn_index': proposal['turn_index']
+    }
+
+def _topic_shard_worker(task):
+    function, start, stop, options = task
+    state = _TOPIC_SHARD_STATE
+    return function(state['topics'][start:stop], state['segments'], state['turns'], **options)
+
+def topic_workers():
+    """Worker count from the TOPIC_WORKERS environment variable, or the TOPIC_WORKERS
+    constant if unset. An invalid value is reported and the topic detectors run serially."""
+    value = os.getenv('TOPIC_WORKERS', '').strip()
+    if not value:
+        return TOPIC_WORKERS
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        print(f"Warning: TOPIC_WORKERS must be a positive integer, got {value!r}; running serially")
+        return 1
+    return workers
+
+def _shared_turn_data(turns, key):
+    """Per-turn data map_topic_shards built in the parent, if turns are the sharded run's turns."""
+    if _TOPIC_SHARD_STATE.get('turns') is turns:
+        return _TOPIC_SHARD_STATE.get(key)
+    return None
+
+def map_topic_shards(function, topics, segments, turns, workers, **options):
+    """Run function(topic_shard, segments, turns, **options) over contiguous shards of topics
+    in a pool of workers processes, returning the shard results in topic order.
+    Workers are forked after the turn texts and vector space are built, so they share the
+    parent's segment, turn and vector data copy-on-write; each task carries only its shard
+    bounds. The texts and space are also kept in the shard state, where get_turn_texts and
+    get_turn_vector_space find them even for turns that are not cached on the table.
+    Runs serially (one shard) when workers <= 1 or fork is unavailable."""
+    if workers <= 1 or len(topics) < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+        return [function(topics, segments, turns, **options)]
+    
+    # Build the shared per-turn data once, before forking
+    turn_texts = get_turn_texts(segments, turns)
+    vector_space = get_turn_vector_space(segments, turns)
+    
+    bounds = np.linspace(0, len(topics), min(workers, len(topics)) + 1).astype(int).tolist()
+    tasks = [(function, start, stop, options) for start, stop in zip(bounds[:-1], bounds[1:])]
+    _TOPIC_SHARD_STATE.update(topics=topics, segments=segments, turns=turns, turn_texts=turn_texts,
+                              vector_space=(SIMILARITY_BACKEND, vector_space))
+    try:
+        with multiprocessing.get_context('fork').Pool(len(tasks)) as pool:
+            return pool.map(_topic_shard_worker, tasks, chunksize=1)
+    finally:
+        _TOPIC_SHARD_STATE.clear()
+
+def _resolve_topic_proposals(proposals, segments, turns, stabilization_threshold=0.3):
+    """Stabilization and status of each proposal, as topic records (the per-topic part of
+    analyze_topic_lifecycle)."""
+    turn_texts = get_turn_texts(segments, turns)
+    time_index = TimeIndex(segments, turns)
+    vector_space = get_turn_vector_space(segments, turns)
+    
+    # Check stabilization for every proposal in one batch
+    stabilizations = check_topic_stabilization_batch(proposals, segments, turns, stabilization_threshold,
+                                                     turn_texts=turn_texts, time_index=time_index,
+                                                     vector_space=vector_space)
     
     topics = []
-    for proposal in proposals:
-        # Check stabilization
-        stabilization = check_topic_stabilization(proposal, segments, turns, stabilization_threshold)
-        
+    for proposal, stabilization in zip(proposals, stabilizations):
         # Determine topic status
-        if stabilization['stabilized']:
-            status = 'stabilized'
-        else:
-            # Check if followed by silence, interruption, or unrelated speech
-            subsequent_turns = [t for t in turns if t['start'] > proposal['end_time']]
-            if not subsequent_turns or (subsequent_turns[0]['start'] - proposal['end_time']) > 5.0:
-                status = 'failed_silence'
-            else:
-                status = 'failed_no_uptake'
-        
-        topic = {
-            'topic_id': proposal['topic_id'],
-            'proposer': proposal['proposer'],
-            'start_time': proposal['start_time'],
-            'end_time': proposal['end_time'],
-            'status': status,
-            'stabilization': stabilization,
-            'text': proposal['text'],  # FULL TEXT
-            'text_sample': proposal.get('text_sample', proposal['text'][:200]),
-            'similarity_to_preceding': proposal.get('similarity_to_preceding', 0)
-        }
-        topics.append(topic)
+        next_turn = time_index.first_turn_after(proposal['end_time'])
+        next_turn_start = turns[next_turn]['start'] if next_turn is not None else None
+        status = _topic_status(proposal, stabilization, next_turn_start)
+        topics.append(_lifecycle_topic(proposal, status, stabilization))
     
     return topics
 
+def analyze_topic_lifecycle(segments, turns, similarity_threshold=0.25, stabilization_threshold=0.3,
+                            method='window', workers=1):
+    """Analyze complete topic lifecycle: emergence, stabilization, decay.
+    method selects the topic detector ('window' or 'texttiling', see detect_topic_proposals);
+    with workers > 1 the proposals are resolved in parallel (see map_topic_shards)."""
+    # Detect topic proposals
+    proposals = detect_topic_proposals(segments, turns, similarity_threshold, method=method)
+    shards = map_topic_shards(_resolve_topic_proposals, proposals, segments, turns, workers,
+                              stabilization_threshold=stabilization_threshold)
+    return [topic for shard in shards for topic in shard]
+
+def _row_similarity(a, b):
+    """Dot product of two sparse rows, summed in the order TurnVectorSpace sums its pairs
+    (elementwise product, then a row sum), so stream and batch scores agree bit for bit."""
+    return float(a.multiply(b).sum(axis=1)[0, 0])
+
+class IncrementalTopicDetector:
+    """Topic emergence and stabilization for a meeting that is still in progress.
+
+    Segments are fed in arrival order; a turn is processed when the next
+    speaker starts (or at flush()). Turn texts are vectorized with a
+    HashingVectorizer, so nothing is refitted as the meeting grows, and each
+    turn is compared with the window_size preceding turns, as in the window
+    detector of detect_topic_proposals. Proposals wait for their
+    response_window: later turns by other speakers are scored against them,
+    and once no unprocessed turn can still start inside the window the
+    proposal is resolved with the same status rules as analyze_topic_lifecycle.
+    Per-turn work is bounded by the window size and the number of proposals
+    still inside their response window.
+
+    add_segment(), advance() and flush() return the events they produce:
+    {'event': 'proposal', 'time', 'topic'} when a turn proposes a topic
+    (topic in the detect_topic_proposals shape), and {'event': 'stabilized'
+    or 'failed', 'time', 'topic'} when its response window has elapsed (topic
+    in the analyze_topic_lifecycle shape). Similarities come from hashed term
+    frequencies rather than a meeting-wide TF-IDF fit, so results approximate
+    the batch pipeline; pass vectorizer to use another fitted encoder. Scores
+    are summed as TurnVectorSpace sums them, so with the meeting's own encoder
+    (get_turn_vector_space(...).encoder) they are bit-identical to the batch
+    scores, except that pairs without any vocabulary score 0 here rather than
+    their word overlap.
+    """
+
+    def __init__(self, similarity_threshold=0.25, stabilization_threshold=0.3, window_size=5,
+                 response_window=30, n_features=2 ** 18, vectorizer=None):
+        self.similarity_threshold = similarity_threshold
+        self.stabilization_threshold = stabilization_threshold
+        self.response_window = response_window
+        self.vectorizer = vectorizer if vectorizer is not None else HashingVectorizer(
+            n_features=n_features, stop_words='english', ngram_range=(1, 2), token_pattern=r'\b\w+\b',
+            alternate_sign=False, norm='l2')
+        self.n_turns = 0
+        self.proposals = []
+        self.topics = []
+        self._window = deque(maxlen=window_size)
+        self._pending = []
+        self._open = None
+
+    def add_segment(self, seg):
+        """Add one transcript segment; returns the events it triggers."""
+        speaker = get_speaker(seg)
+        start, end = float(seg['start']), float(seg['end'])
+        text = seg.get('text', '')
+        
+        if self._open is not None and self._open['speaker'] == speaker:
+            self._open['end'] = end
+        else:
+            events = self._close_turn()
+            self._open = {'speaker': speaker, 'start': start, 'end': end, 'texts': []}
+            events.extend(self._resolve(start))
+            if not is_filler(text):
+                self._open['texts'].append(clean_text(text))
+            return events
+        if not is_filler(text):
+            self._open['texts'].append(clean_text(text))
+        return []
+
+    def add_segments(self, segments):
+        """Add a batch of segments in order; returns the events they trigger."""
+        events = []
+        for seg in segments:
+            events.extend(self.add_segment(seg))
+        return events
+
+    def advance(self, now):
+        """Resolve proposals whose response window has passed by meeting time now, for use
+        when no speech is arriving. A turn still in progress holds back proposals it may answer."""
+        if self._open is not None:
+            now = min(now, self._open['start'])
+        return self._resolve(now)
+
+    def flush(self):
+        """End of meeting: process the open turn and resolve every pending proposal."""
+        events = self._close_turn()
+        events.extend(self._resolve(np.inf))
+        return events
+
+    def _close_turn(self):
+        if self._open is None:
+            return []
+        turn = self._open
+        self._open = None
+        turn['text'] = ' '.join(turn.pop('texts'))
+        turn['duration'] = turn['end'] - turn['start']
+        return self._add_turn(turn)
+
+    def _add_turn(self, turn):
+        index = self.n_turns
+        self.n_turns += 1
+        vector = self.vectorizer.transform([turn['text']])
+        
+        # Score the turn as a response to proposals still inside their window
+        for pending in self._pending:
+            proposal = pending['proposal']
+            if pending['next_turn_start'] is None and turn['start'] > proposal['end_time']:
+                pending['next_turn_start'] = turn['start']
+            if (proposal['start_time'] < turn['start'] < proposal['start_time'] + self.response_window
+                    and turn['speaker'] != proposal['proposer']):
+                pending['has_response'] = True
+                if turn['text']:
+                    similarity = _row_similarity(pending['vector'], vector)
+                    pending['responders'].append(_topic_response(turn, turn['text'], similarity,
+                                                                 proposal['start_time'],
+                                                                 self.stabilization_threshold))
+        
+        events = []
+        if self._window:
+            # Max similarity to the preceding window; the first turn has nothing to compare with
+            similarity_to_preceding = max(_row_similarity(previous, vector) for previous in self._window)
+            if similarity_to_preceding < self.similarity_threshold and len(turn['text'].split()) > 3:
+                proposal = {
+                    'topic_id': f'TOPIC_{len(self.proposals)}',
+                    'proposer': turn['speaker'],
+                    'start_time': turn['start'],
+                    'end_time': turn['end'],
+                    'text': turn['text'],
+                    'text_sample': turn['text'][:200],
+                    'similarity_to_preceding': similarity_to_preceding,
+                    'turn_index': index
+                }
+                self.proposals.append(proposal)
+                self._pending.append({'proposal': proposal, 'vector': vector, 'responders': [],
+                                      'has_response': False, 'next_turn_start': None})
+                events.append({'event': 'proposal', 'time': turn['end'], 'topic': proposal})
+        self._window.append(vector)
+        return events
+
+    def _resolve(self, known_time):
+        """Resolve proposals that no turn starting at or after known_time can still affect."""
+        events = []
+        still_pending = []
+        for pending in self._pending:
+            proposal = pending['proposal']
+            deadline = proposal['start_time'] + self.response_window
+            next_turn_start = pending['next_turn_start']
+            if next_turn_start is None and self._open is not None and self._open['start'] > proposal['end_time']:
+                next_turn_start = self._open['start']
+            if known_time < deadline or (next_turn_start is None and known_time <= proposal['end_time'] + 5.0):
+                still_pending.append(pending)
+                continue
+            
+            if pending['has_response']:
+                stabilization = _stabilization_result(pending['responders'], self.stabilization_threshold)
+            else:
+                stabilization = {'stabilized': False, 'reason': 'no_response', 'responders': []}
+            status = _topic_status(proposal, stabilization, next_turn_start)
+            topic = _lifecycle_topic(proposal, status, stabilization)
+            self.topics.append(topic)
+            events.append({'event': 'stabilized' if status == 'stabilized' else 'failed',
+                           'time': deadline, 'topic': topic})
+        self._pending = still_pending
+        return events
+
 def analyze_speaker_orientation_to_topics(topics, segments, turns, similarity_threshold=0.3):
     """Analyze how speakers orient to topics: uptake, redirection, monopolization."""
     speaker_orientations = defaultdict(lambda: {
@@ -590,6 +2101,7 @@ def analyze_speaker_orientation_to_topics(topics, segments, turns, similarity_th
         'redirections': [],
         'monopolizations': []
     })
+    time_index = TimeIndex(segments, turns)
     
     for topic in topics:
         proposer = topic['proposer']
@@ -611,12 +2123,10 @@ def analyze_speaker_orientation_to_topics(topics, segments, turns, similarity_th
         # Check for monopolization (proposer extends own topic without others)
         if topic['status'] == 'stabilized':
             # Count how many times proposer speaks about this topic
-            topic_turns = [t for t in turns if 
-                          t['speaker'] == proposer and
-                          topic['start_time'] <= t['start'] <= topic['end_time'] + 30]
-            other_turns = [t for t in turns if
-                          t['speaker'] != proposer and
-                          topic['start_time'] <= t['start'] <= topic['end_time'] + 30]
+            window = [turns[j] for j in time_index.turns_between(
+                topic['start_time'], topic['end_time'] + 30, inclusive='both').tolist()]
+            topic_turns = [t for t in window if t['speaker'] == proposer]
+            other_turns = [t for t in window if t['speaker'] != proposer]
             
             if len(topic_turns) > len(other_turns) * 2:
                 speaker_orientations[proposer]['monopolizations'].append(topic['topic_id'])
@@ -803,12 +2313,13 @@ def create_topic_trajectory(topics, segments, turns):
     if n_topics == 1:
         axes = [axes]
     
+    time_index = TimeIndex(segments, turns)
     for idx, topic in enumerate(all_topics[:n_topics]):  # Show ALL topics up to limit
         ax = axes[idx] if n_topics > 1 else axes[0]
         
         # Get all turns related to this topic
-        topic_turns = [t for t in turns if 
-                      topic['start_time'] <= t['start'] <= topic['end_time'] + 30]
+        topic_turns = [turns[j] for j in time_index.turns_between(
+            topic['start_time'], topic['end_time'] + 30, inclusive='both').tolist()]
         
         # Track speaker sequence
         speaker_sequence = []
@@ -967,59 +2478,54 @@ def create_topic_content_visualization(topics, speaker_times):
     plt.savefig('topic_content_table.png', dpi=300, bbox_inches='tight')
     plt.close()
 
-def detect_topic_closure_authority(topics, segments, turns, similarity_threshold=0.3):
+def detect_topic_closure_authority(topics, segments, turns, similarity_threshold=0.3, workers=1):
     """Detect topic closure authority: who can end topics without contest.
-    Power is visible in who shifts away from ongoing theme and others follow without repair."""
+    Power is visible in who shifts away from ongoing theme and others follow without repair.
+    With workers > 1 topics are processed in parallel (see map_topic_shards)."""
+    if workers > 1:
+        shards = map_topic_shards(detect_topic_closure_authority, topics, segments, turns, workers,
+                                  similarity_threshold=similarity_threshold)
+        return [closure for shard in shards for closure in shard]
     closures = []
+    turn_texts = get_turn_texts(segments, turns)
+    time_index = TimeIndex(segments, turns)
+    space = get_turn_vector_space(segments, turns)
     
     # For each topic, check what happens after it ends
     for topic in topics:
         topic_end = topic['end_time']
-        topic_text = topic.get('text', topic.get('text_sample', ''))
         
         # Find turns after topic ends (within 60 seconds)
-        subsequent_turns = [t for t in turns if 
-                           t['start'] > topic_end and 
-                           t['start'] < topic_end + 60]
+        subsequent_idx = time_index.turns_between(topic_end, topic_end + 60).tolist()
         
-        if not subsequent_turns:
+        if not subsequent_idx:
             continue
         
         # Check if next speaker shifts topic (low similarity)
-        first_subsequent = subsequent_turns[0]
+        first_subsequent = turns[subsequent_idx[0]]
         first_speaker = first_subsequent['speaker']
         
         # Get text of first subsequent turn
-        first_turn_segments = [s for s in segments if
-                              get_speaker(s) == first_speaker and
-                              first_subsequent['start'] <= s['start'] <= first_subsequent['end']]
-        first_turn_text = ' '.join([extract_text_from_segment(s) for s in first_turn_segments
-                                   if not is_filler(s.get('text', ''))])
+        first_turn_text = turn_texts[subsequent_idx[0]]
         
         if not first_turn_text:
             continue
         
         # Check semantic similarity
-        comparison_texts = [topic_text, first_turn_text]
-        similarity_matrix = compute_semantic_similarity(comparison_texts)
-        similarity = similarity_matrix[0, 1] if similarity_matrix.shape[0] > 1 else 0
+        topic_query = _topic_query(topic, space)
+        similarity = space.similarity(topic_query, subsequent_idx[0])
         
         # If similarity is low, topic was closed/shifted
         if similarity < similarity_threshold:
             # Check if others follow (no repair/resistance)
             followers = []
-            for turn in subsequent_turns[1:5]:  # Check next 4 turns
-                turn_segments = [s for s in segments if
-                               get_speaker(s) == turn['speaker'] and
-                               turn['start'] <= s['start'] <= turn['end']]
-                turn_text = ' '.join([extract_text_from_segment(s) for s in turn_segments
-                                     if not is_filler(s.get('text', ''))])
+            for j in subsequent_idx[1:5]:  # Check next 4 turns
+                turn = turns[j]
+                turn_text = turn_texts[j]
                 
                 if turn_text:
                     # Check if they continue new topic or return to old
-                    turn_comparison = [topic_text, turn_text]
-                    turn_sim_matrix = compute_semantic_similarity(turn_comparison)
-                    turn_similarity = turn_sim_matrix[0, 1] if turn_sim_matrix.shape[0] > 1 else 0
+                    turn_similarity = space.similarity(topic_query, j)
                     
                     if turn_similarity < similarity_threshold:
                         followers.append({
@@ -1042,133 +2548,194 @@ def detect_topic_closure_authority(topics, segments, turns, similarity_threshold
     
     return closures
 
+# Dialogue-act cue phrases, matched case-insensitively on word boundaries.
+# Each act gets one bit of the per-turn mask, in this order.
+DIALOGUE_ACT_CUES = {
+    'clarification': ['what do you mean', 'can you clarify', 'what does that mean',
+                      'can you explain', 'i don\'t understand', 'what are you saying',
+                      'could you elaborate', 'what do you expect'],
+    'justification': ['why', 'how do you know', 'what makes you think',
+                      'on what basis', 'what evidence', 'how can you say'],
+    'evidence_request': ['show me', 'prove it', 'where is the evidence', 'can you show',
+                         'do you have proof', 'what proof'],
+    'question': ['?'],
+    'agreement': ['i agree', 'agreed', 'exactly', 'absolutely', 'that\'s right', 'that\'s true',
+                  'you\'re right', 'good point', 'makes sense', 'sounds good', 'fair enough'],
+    'disagreement': ['i disagree', 'i don\'t agree', 'i don\'t think so', 'that\'s not true',
+                     'that\'s wrong', 'not necessarily', 'on the contrary', 'i object']
+}
+
+def _bounded_pattern(phrase):
+    """Regex for a phrase, anchored on word boundaries where it starts/ends with a word character."""
+    pattern = re.escape(phrase)
+    if re.match(r'\w', phrase[0]):
+        pattern = r'\b' + pattern
+    if re.match(r'\w', phrase[-1]):
+        pattern = pattern + r'\b'
+    return pattern
+
+class LexiconMatcher:
+    """Multi-pattern phrase matcher compiled into a single regular expression.
+
+    Labels of a {label: phrases} lexicon get one bit each, in order; match()
+    scans a text once and returns the OR of the bits of every phrase found.
+    The scan tries the longest phrase at each position, so each phrase's mask
+    also carries the bits of the shorter phrases it contains.
+    """
+
+    def __init__(self, lexicon):
+        self.bits = {label: 1 << i for i, label in enumerate(lexicon)}
+        masks = defaultdict(int)
+        for label, phrases in lexicon.items():
+            for phrase in phrases:
+                masks[self.normalize(phrase)] |= self.bits[label]
+
+        patterns = {phrase: re.compile(_bounded_pattern(phrase)) for phrase in masks}
+        self.masks = {}
+        for phrase in masks:
+            self.masks[phrase] = 0
+            for other, other_mask in masks.items():
+                if patterns[other].search(phrase):
+                    self.masks[phrase] |= other_mask
+
+        # Zero-width lookahead so overlapping occurrences are all reported
+        alternatives = '|'.join(_bounded_pattern(p) for p in sorted(masks, key=len, reverse=True))
+        self.pattern = re.compile(f'(?=({alternatives}))')
+
+    @staticmethod
+    def normalize(text):
+        return text.lower().replace('’', "'")
+
+    def match(self, text):
+        """Bitmask of the labels whose phrases occur in text."""
+        mask = 0
+        for m in self.pattern.finditer(self.normalize(text)):
+            mask |= self.masks[m.group(1)]
+        return mask
+
+    def match_many(self, texts):
+        """match() over a list of texts, as an integer array."""
+        return np.fromiter((self.match(text) for text in texts), dtype=np.int64, count=len(texts))
+
+DIALOGUE_ACT_MATCHER = LexiconMatcher(DIALOGUE_ACT_CUES)
+
+def dialogue_act_flags(segments, turns):
+    """Dialogue-act bitmask of each turn (bits in DIALOGUE_ACT_MATCHER.bits), one scan per turn text."""
+    return DIALOGUE_ACT_MATCHER.match_many(get_turn_texts(segments, turns))
+
 def detect_asymmetric_topical_accountability(topics, segments, turns):
     """Detect asymmetric topical accountability: who is asked to clarify/justify vs who isn't.
-    Uneven demand for elaboration signals differential epistemic standing."""
-    accountability_patterns = defaultdict(lambda: {
-        'topics_proposed': [],
-        'clarification_requests': 0,
-        'justification_requests': 0,
-        'evidence_requests': 0,
-        'total_accountability_demands': 0
-    })
-    
-    # Keywords/phrases indicating accountability demands
-    clarification_indicators = ['what do you mean', 'can you clarify', 'what does that mean',
-                               'can you explain', 'I don\'t understand', 'what are you saying',
-                               'could you elaborate', 'what do you expect']
-    justification_indicators = ['why', 'how do you know', 'what makes you think',
-                               'on what basis', 'what evidence', 'how can you say']
-    evidence_indicators = ['show me', 'prove it', 'where is the evidence', 'can you show',
-                          'do you have proof', 'what proof']
-    
+    Uneven demand for elaboration signals differential epistemic standing.
+    Each turn is scanned once for dialogue-act cues; a topic's responses (other speakers'
+    turns within 30 seconds of it) are then counted by proposer from those flags."""
+    accountability_patterns = {}
     for topic in topics:
         proposer = topic['proposer']
+        if proposer not in accountability_patterns:
+            accountability_patterns[proposer] = {
+                'topics_proposed': [],
+                'clarification_requests': 0,
+                'justification_requests': 0,
+                'evidence_requests': 0,
+                'total_accountability_demands': 0,
+                'question_responses': 0,
+                'agreement_responses': 0,
+                'disagreement_responses': 0
+            }
         accountability_patterns[proposer]['topics_proposed'].append(topic['topic_id'])
+    
+    if topics and turns:
+        flags = dialogue_act_flags(segments, turns)
+        time_index = TimeIndex(segments, turns)
         
-        topic_start = topic['start_time']
-        topic_end = topic['end_time']
+        proposers = list(accountability_patterns)
+        proposer_code = {speaker: code for code, speaker in enumerate(proposers)}
+        topic_owner = np.array([proposer_code[topic['proposer']] for topic in topics], dtype=np.int64)
+        turn_owner = np.array([proposer_code.get(turn['speaker'], -1) for turn in turns], dtype=np.int64)
         
-        # Find responses within 30 seconds after topic
-        responses = [t for t in turns if
-                    t['start'] > topic_start and
-                    t['start'] < topic_end + 30 and
-                    t['speaker'] != proposer]
+        # Responses: turns within 30 seconds after each topic, by someone other than the proposer
+        window, turn_idx = time_index.turns_between_many(
+            np.array([topic['start_time'] for topic in topics], dtype=np.float64),
+            np.array([topic['end_time'] for topic in topics], dtype=np.float64) + 30)
+        responses = turn_owner[turn_idx] != topic_owner[window]
+        owner = topic_owner[window[responses]]
+        response_flags = flags[turn_idx[responses]]
         
-        for response_turn in responses:
-            # Get response text
-            response_segments = [s for s in segments if
-                               get_speaker(s) == response_turn['speaker'] and
-                               response_turn['start'] <= s['start'] <= response_turn['end']]
-            response_text = ' '.join([extract_text_from_segment(s) for s in response_segments
-                                     if not is_filler(s.get('text', ''))]).lower()
-            
-            # Check for accountability demands
-            if any(indicator in response_text for indicator in clarification_indicators):
-                accountability_patterns[proposer]['clarification_requests'] += 1
-                accountability_patterns[proposer]['total_accountability_demands'] += 1
-            
-            if any(indicator in response_text for indicator in justification_indicators):
-                accountability_patterns[proposer]['justification_requests'] += 1
-                accountability_patterns[proposer]['total_accountability_demands'] += 1
-            
-            if any(indicator in response_text for indicator in evidence_indicators):
-                accountability_patterns[proposer]['evidence_requests'] += 1
-                accountability_patterns[proposer]['total_accountability_demands'] += 1
+        bits = DIALOGUE_ACT_MATCHER.bits
+        for key, act in [('clarification_requests', 'clarification'),
+                         ('justification_requests', 'justification'),
+                         ('evidence_requests', 'evidence_request'),
+                         ('question_responses', 'question'),
+                         ('agreement_responses', 'agreement'),
+                         ('disagreement_responses', 'disagreement')]:
+            counts = np.bincount(owner[(response_flags & bits[act]) > 0], minlength=len(proposers))
+            for code, count in enumerate(counts.tolist()):
+                accountability_patterns[proposers[code]][key] = count
     
     # Calculate rates
     for speaker, data in accountability_patterns.items():
+        data['total_accountability_demands'] = (data['clarification_requests'] + data['justification_requests'] +
+                                                data['evidence_requests'])
         topic_count = len(data['topics_proposed'])
         if topic_count > 0:
             data['accountability_rate'] = data['total_accountability_demands'] / topic_count
         else:
             data['accountability_rate'] = 0
     
-    return dict(accountability_patterns)
+    return accountability_patterns
+
+def _top_k_pairs(first, second, similarities, k):
+    """Keep each first index's k most similar pairs (ties broken by position), preserving (i, j) order."""
+    order = np.lexsort((second, -similarities, first))
+    starts = np.searchsorted(first[order], first[order], side='left')
+    rank = np.arange(len(order)) - starts
+    keep = np.sort(order[rank < k])
+    return first[keep], second[keep], similarities[keep]
 
-def detect_topic_recycling(topics, segments, turns, similarity_threshold=0.4):
+def detect_topic_recycling(topics, segments, turns, similarity_threshold=0.4, top_k=None):
     """Detect topic recycling: topics initially ignored that gain traction when reintroduced by different speaker.
-    Reveals authority as relational rather than propositional."""
+    Reveals authority as relational rather than propositional.
+    top_k, if set, limits each original topic to its k most similar recycling candidates."""
     recycled_topics = []
-    
-    # Compare all topic pairs
-    for i, topic1 in enumerate(topics):
-        topic1_text = topic1.get('text', topic1.get('text_sample', ''))
-        topic1_status = topic1['status']
-        topic1_proposer = topic1['proposer']
-        
-        # Skip if first topic was successful
-        if topic1_status == 'stabilized':
-            continue
-        
-        # Look for similar topics later by different speakers
-        for j, topic2 in enumerate(topics[i+1:], start=i+1):
-            topic2_text = topic2.get('text', topic2.get('text_sample', ''))
-            topic2_proposer = topic2['proposer']
-            topic2_status = topic2['status']
-            
-            # Must be different speaker
-            if topic1_proposer == topic2_proposer:
-                continue
-            
-            # Check semantic similarity
-            comparison_texts = [topic1_text, topic2_text]
-            similarity_matrix = compute_semantic_similarity(comparison_texts)
-            similarity = similarity_matrix[0, 1] if similarity_matrix.shape[0] > 1 else 0
-            
-            # If similar and second topic succeeded where first failed
-            if similarity >= similarity_threshold:
-                # Check if second topic had better outcome
-                if topic2_status == 'stabilized' and topic1_status != 'stabilized':
-                    recycled_topics.append({
-                        'original_topic': topic1['topic_id'],
-                        'original_proposer': topic1_proposer,
-                        'original_status': topic1_status,
-                        'recycled_topic': topic2['topic_id'],
-                        'recycled_proposer': topic2_proposer,
-                        'recycled_status': topic2_status,
-                        'similarity': similarity,
-                        'time_gap': topic2['start_time'] - topic1['end_time'],
-                        'power_shift': True  # Authority shifted through speaker change
-                    })
-                elif topic2_status != 'stabilized' and topic2.get('stabilization', {}).get('responders'):
-                    # Even if not fully stabilized, check if it got more responses
-                    topic1_responses = len(topic1.get('stabilization', {}).get('all_responses', []))
-                    topic2_responses = len(topic2.get('stabilization', {}).get('all_responses', []))
-                    
-                    if topic2_responses > topic1_responses:
-                        recycled_topics.append({
-                            'original_topic': topic1['topic_id'],
-                            'original_proposer': topic1_proposer,
-                            'original_status': topic1_status,
-                            'recycled_topic': topic2['topic_id'],
-                            'recycled_proposer': topic2_proposer,
-                            'recycled_status': topic2_status,
-                            'similarity': similarity,
-                            'time_gap': topic2['start_time'] - topic1['end_time'],
-                            'power_shift': True,
-                            'response_increase': topic2_responses - topic1_responses
-                        })
+    space = get_turn_vector_space(segments, turns)
+    
+    # Compare all topic pairs at once; only pairs above the threshold survive
+    queries = [_topic_query(topic, space) for topic in topics]
+    first, second, similarities = space.similar_pairs(queries, similarity_threshold)
+    
+    speaker_codes = {}
+    proposer = np.array([speaker_codes.setdefault(t['proposer'], len(speaker_codes)) for t in topics], dtype=np.int64)
+    stabilized = np.array([t['status'] == 'stabilized' for t in topics], dtype=bool)
+    has_responders = np.array([bool(t.get('stabilization', {}).get('responders')) for t in topics], dtype=bool)
+    n_responses = np.array([len(t.get('stabilization', {}).get('all_responses', [])) for t in topics], dtype=np.int64)
+    
+    # Candidates: failed original, later topic by a different speaker with a better outcome
+    candidate = (~stabilized[first]) & (proposer[first] != proposer[second])
+    # Either the second topic succeeded where the first failed, or (not fully
+    # stabilized) it got responders and more responses than the first
+    gained_responses = has_responders[second] & (n_responses[second] > n_responses[first])
+    candidate &= stabilized[second] | gained_responses
+    first, second, similarities = first[candidate], second[candidate], similarities[candidate]
+    # top_k ranks only the pairs that qualify as recycling
+    if top_k is not None:
+        first, second, similarities = _top_k_pairs(first, second, similarities, top_k)
+    
+    for i, j, similarity in zip(first.tolist(), second.tolist(), similarities.tolist()):
+        topic1, topic2 = topics[i], topics[j]
+        record = {
+            'original_topic': topic1['topic_id'],
+            'original_proposer': topic1['proposer'],
+            'original_status': topic1['status'],
+            'recycled_topic': topic2['topic_id'],
+            'recycled_proposer': topic2['proposer'],
+            'recycled_status': topic2['status'],
+            'similarity': similarity,
+            'time_gap': topic2['start_time'] - topic1['end_time'],
+            'power_shift': True  # Authority shifted through speaker change
+        }
+        if not stabilized[j]:
+            record['response_increase'] = int(n_responses[j] - n_responses[i])
+        recycled_topics.append(record)
     
     return recycled_topics
 
@@ -1593,6 +3160,8 @@ def create_fine_grained_topic_power_report(topic_closures, accountability_patter
         report_lines.append(f"    Evidence Requests: {data['evidence_requests']}")
         report_lines.append(f"    Total Accountability Demands: {data['total_accountability_demands']}")
         report_lines.append(f"    Accountability Rate: {data['accountability_rate']:.2f} per topic")
+        report_lines.append(f"    Responses: {data['question_responses']} questions, "
+                            f"{data['agreement_responses']} agreeing, {data['disagreement_responses']} disagreeing")
         report_lines.append("")
     
     # High vs Low accountability
@@ -1767,30 +3336,26 @@ def create_speaker_topic_engagement_matrix(topics, speaker_orientations, speaker
     plt.savefig('speaker_topic_engagement_matrix.png', dpi=300, bbox_inches='tight')
     plt.close()
 
+def _agenda_introductions(turn_codes, turn_start, turn_end, speakers, silence_threshold):
+    silence = np.empty(len(turn_start))
+    if len(turn_start):
+        # First turn is always an introduction
+        silence[0] = turn_start[0]
+        silence[1:] = turn_start[1:] - turn_end[:-1]
+    idx = np.flatnonzero(silence >= silence_threshold)
+    if len(turn_start):
+        idx = np.union1d([0], idx)
+    return [
+        {'speaker': speakers[code], 'time': time, 'preceding_silence': gap}
+        for code, time, gap in zip(turn_codes[idx].tolist(), turn_start[idx].tolist(), silence[idx].tolist())
+    ]
+
 def identify_agenda_control(segments, turns, silence_threshold=2.0):
     """Identify speakers who introduce new topics after silence."""
-    agenda_introductions = []
-    
-    for i, turn in enumerate(turns):
-        if i == 0:
-            # First turn is always an introduction
-            agenda_introductions.append({
-                'speaker': turn['speaker'],
-                'time': turn['start'],
-                'preceding_silence': turn['start']
-            })
-        else:
-            prev_turn = turns[i - 1]
-            silence = turn['start'] - prev_turn['end']
-            
-            if silence >= silence_threshold:
-                agenda_introductions.append({
-                    'speaker': turn['speaker'],
-                    'time': turn['start'],
-                    'preceding_silence': silence
-                })
-    
-    return agenda_introductions
+    speakers = [turn['speaker'] for turn in turns]
+    turn_start = np.array([turn['start'] for turn in turns], dtype=np.float64)
+    turn_end = np.array([turn['end'] for turn in turns], dtype=np.float64)
+    return _agenda_introductions(np.arange(len(turns)), turn_start, turn_end, speakers, silence_threshold)
 
 def create_network_graph(speaker_times, transitions):
     """Create network visualization of speaker interactions."""
@@ -2071,28 +3636,29 @@ def create_interruption_network(interruptions, speaker_times):
     plt.savefig('interruption_network.png', dpi=300, bbox_inches='tight')
     plt.close()
 
-def create_gap_analysis(segments):
-    """Analyze gaps (silence) between speaker transitions."""
-    gaps = []
-    gap_types = []
-    
-    for i in range(len(segments) - 1):
-        current = segments[i]
-        next_seg = segments[i + 1]
-        current_speaker = get_speaker(current)
-        next_speaker = get_speaker(next_seg)
-        
-        gap = next_seg['start'] - current['end']
-        gaps.append(gap)
-        
-        if current_speaker == next_speaker:
-            gap_types.append('Same Speaker')
-        else:
-            gap_types.append('Speaker Change')
-    
-    gaps = np.array(gaps)
+def _split_gaps(gaps, same_speaker):
+    """Drop negative gaps (overlaps) and split the rest into same-speaker and speaker-change gaps."""
     gaps = gaps[gaps >= 0]  # Remove negative gaps (overlaps)
-    
+    # Transition types are indexed by position in the filtered gap array
+    type_mask = same_speaker[:len(gaps)]
+    return gaps, gaps[type_mask].tolist(), gaps[~type_mask].tolist()
+
+def gap_statistics(gaps, same_speaker):
+    """Median/mean gap overall and by transition type, from consecutive-segment gaps."""
+    gaps, same_speaker_gaps, speaker_change_gaps = _split_gaps(gaps, same_speaker)
+    return {
+        'median_gap': np.median(gaps),
+        'mean_gap': np.mean(gaps),
+        'same_speaker_median': np.median(same_speaker_gaps) if same_speaker_gaps else 0,
+        'speaker_change_median': np.median(speaker_change_gaps) if speaker_change_gaps else 0
+    }
+
+def create_gap_analysis(segments, metrics=None):
+    """Analyze gaps (silence) between speaker transitions."""
+    pairs = metrics.pairs if metrics is not None else adjacent_pairs(segments)
+    same_speaker = pairs.current_code == pairs.next_code
+    gaps, same_speaker_gaps, speaker_change_gaps = _split_gaps(pairs.gap, same_speaker)
+
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
     
     # Histogram of gaps
@@ -2107,9 +3673,6 @@ def create_gap_analysis(segments):
     ax1.grid(alpha=0.3)
     
     # Box plot by gap type
-    same_speaker_gaps = [gaps[i] for i in range(len(gaps)) if i < len(gap_types) and gap_types[i] == 'Same Speaker']
-    speaker_change_gaps = [gaps[i] for i in range(len(gaps)) if i < len(gap_types) and gap_types[i] == 'Speaker Change']
-    
     ax2.boxplot([same_speaker_gaps, speaker_change_gaps], 
                 labels=['Same Speaker', 'Speaker Change'], vert=True)
     ax2.set_ylabel('Gap Duration (seconds)', fontsize=12)
@@ -2120,42 +3683,60 @@ def create_gap_analysis(segments):
     plt.savefig('gap_analysis.png', dpi=300, bbox_inches='tight')
     plt.close()
     
-    return {
-        'median_gap': np.median(gaps),
-        'mean_gap': np.mean(gaps),
-        'same_speaker_median': np.median(same_speaker_gaps) if same_speaker_gaps else 0,
-        'speaker_change_median': np.median(speaker_change_gaps) if speaker_change_gaps else 0
-    }
+    return metrics.gap_stats if metrics is not None else gap_statistics(pairs.gap, same_speaker)
+
+def participation_matrix(segments, total_time=None, n_bins=20, bin_width=None):
+    """Non-filler speaking time of every speaker in each time bin.
+    Bins split [0, total_time) into n_bins equal parts, or into bin_width-second bins
+    when bin_width is given. Each segment interval is split across the bins it spans
+    (bins found with searchsorted) and accumulated with np.add.at in one pass.
+    Returns (speakers x bins matrix indexed by speaker code, bin edges)."""
+    table = as_segment_table(segments)
+    if total_time is None:
+        total_time = max(0, float(table.end.max())) if len(table) else 0
+    if bin_width is not None:
+        n_bins = max(1, int(np.ceil(total_time / bin_width)))
+    else:
+        bin_width = total_time / n_bins
+    edges = np.arange(n_bins + 1) * float(bin_width)
+    matrix = np.zeros((len(table.speakers), n_bins))
+    
+    speech = np.flatnonzero(~table.filler & (table.end > table.start))
+    start, end = table.start[speech], table.end[speech]
+    first_bin = np.clip(np.searchsorted(edges, start, side='right') - 1, 0, n_bins - 1)
+    last_bin = np.clip(np.searchsorted(edges, end, side='left') - 1, 0, n_bins - 1)
+    span = np.maximum(last_bin - first_bin + 1, 0)
+    
+    # One (segment, bin) piece per bin each segment touches, in segment order
+    piece = np.repeat(np.arange(len(speech)), span)
+    piece_bin = first_bin[piece] + (np.arange(span.sum()) - np.repeat(np.cumsum(span) - span, span))
+    overlap = np.minimum(end[piece], edges[piece_bin + 1]) - np.maximum(start[piece], edges[piece_bin])
+    keep = overlap > 0
+    np.add.at(matrix, (table.speaker[speech][piece][keep], piece_bin[keep]), overlap[keep])
+    return matrix, edges
 
-def create_participation_heatmap(segments, speaker_times, total_time, n_segments=20):
+def _participation_rows(segments, matrix, speakers):
+    """Rows of a participation matrix for the given speaker names (zeros for unknown speakers)."""
+    table = as_segment_table(segments)
+    rows = np.zeros((len(speakers), matrix.shape[1]))
+    for i, speaker in enumerate(speakers):
+        code = table.speaker_index.get(speaker)
+        if code is not None:
+            rows[i] = matrix[code]
+    return rows
+
+def create_participation_heatmap(segments, speaker_times, total_time, n_segments=20, metrics=None):
     """Create heatmap showing speaker participation across time segments."""
     # Get top speakers
     top_speakers = sorted(speaker_times.items(), key=lambda x: x[1], reverse=True)[:15]
-    top_speaker_set = set([s[0] for s in top_speakers])
-    
-    # Create time segments
-    segment_duration = total_time / n_segments
-    time_segments = [(i * segment_duration, (i + 1) * segment_duration) 
-                     for i in range(n_segments)]
-    
-    # Calculate speaking time per segment per speaker
-    heatmap_data = []
     speaker_list = [s[0] for s in top_speakers]
     
-    for speaker in speaker_list:
-        row = []
-        for seg_start, seg_end in time_segments:
-            time_in_segment = 0
-            for seg in segments:
-                if get_speaker(seg) == speaker and not is_filler(seg['text']):
-                    overlap_start = max(seg['start'], seg_start)
-                    overlap_end = min(seg['end'], seg_end)
-                    if overlap_start < overlap_end:
-                        time_in_segment += overlap_end - overlap_start
-            row.append(time_in_segment)
-        heatmap_data.append(row)
-    
-    heatmap_array = np.array(heatmap_data)
+    # Calculate speaking time per segment per speaker
+    if metrics is not None:
+        matrix, _ = metrics.participation(n_bins=n_segments)
+    else:
+        matrix, _ = participation_matrix(segments, total_time, n_bins=n_segments)
+    heatmap_array = _participation_rows(segments, matrix, speaker_list)
     
     plt.figure(figsize=(16, 10))
     sns.heatmap(heatmap_array, 
@@ -2181,9 +3762,8 @@ def calculate_inequality_metrics(speaker_times):
     if n == 0 or sum(times) == 0:
         return {}
     
-    # Gini coefficient
-    cumsum = np.cumsum(times)
-    gini = (2 * np.sum((np.arange(1, n + 1)) * times)) / (n * np.sum(times)) - (n + 1) / n
+    # Gini coefficient (0 = equal, towards 1 = concentrated); times are ranked largest first
+    gini = (n + 1) / n - (2 * np.sum((np.arange(1, n + 1)) * times)) / (n * np.sum(times))
     
     # Top 10% share
     top_10_pct_count = max(1, int(n * 0.1))
@@ -2208,6 +3788,150 @@ def calculate_inequality_metrics(speaker_times):
         'max_possible_entropy': max_entropy
     }
 
+def bootstrap_confidence_intervals(metrics, failed_interruptions, n_replicates=2000, block_length=None,
+                                   confidence=0.95, seed=0):
+    """Bootstrap confidence intervals for the inequality metrics, average turn length and tolerance rate.
+    Speaking-time inequality resamples non-filler segments, turn lengths resample turns and
+    tolerance rates resample interruptions, each in time order. With block_length=None a circular
+    block bootstrap is used with default_block_length(n) per unit type; block_length=1 resamples
+    i.i.d. All replicates are evaluated as batched array operations (see bootstrap_intervals)."""
+    rng = np.random.default_rng(seed)
+    table = metrics.segments
+    speakers = table.speakers
+    
+    def blocks(n):
+        return default_block_length(n) if block_length is None else block_length
+    
+    # Speaking time: speakers are those heard outside fillers, as in compute_speaking_time
+    speech = np.flatnonzero(~table.filler)
+    present, speech_codes = np.unique(table.speaker[speech], return_inverse=True)
+    inequality = bootstrap_inequality(speech_codes, table.duration[speech], len(present), n_replicates,
+                                      blocks(len(speech)), confidence, rng)
+    
+    runs = metrics.runs
+    turn_lengths = bootstrap_group_means(runs['speaker'], runs['end'] - runs['start'], len(speakers),
+                                         n_replicates, blocks(len(runs)), confidence, rng)
+    
+    interrupted = np.array([table.speaker_index[f['interrupted']] for f in failed_interruptions], dtype=np.int64)
+    maintained = np.array([f['maintained_floor'] for f in failed_interruptions], dtype=np.float64)
+    tolerance = bootstrap_group_means(interrupted, maintained, len(speakers), n_replicates,
+                                      blocks(len(failed_interruptions)), confidence, rng)
+    
+    return {
+        'method': 'bootstrap' if block_length == 1 else 'circular_block_bootstrap',
+        'replicates': n_replicates,
+        'confidence': confidence,
+        'block_length': {'segments': blocks(len(speech)), 'turns': blocks(len(runs)),
+                         'interruptions': blocks(len(failed_interruptions))},
+        'inequality_metrics': inequality,
+        'average_turn_length': {speakers[code]: ci for code, ci in turn_lengths.items()},
+        'tolerance_rate': {speakers[code]: ci for code, ci in tolerance.items()}
+    }
+
+def compute_rolling_power_metrics(segments, interruptions=None, window=300, step=30, metrics=None):
+    """Gini, normalized entropy, top-3 share and interruption rate over sliding windows.
+    Per-speaker speaking time is binned at the step width and prefix-summed once, so each
+    window is a difference of two cumulative columns (O(speakers)) rather than a rescan of
+    segments. The window is rounded to a whole number of steps. As in
+    calculate_inequality_metrics, only speakers active in a window are counted."""
+    table = as_segment_table(segments)
+    if metrics is not None:
+        binned, edges = metrics.participation(bin_width=step)
+    else:
+        binned, edges = participation_matrix(table, bin_width=step)
+    n_bins = binned.shape[1]
+    width = min(max(1, int(round(window / step))), n_bins)
+    
+    # cumulative[:, k] = speaking time per speaker before edges[k]
+    cumulative = np.zeros((binned.shape[0], n_bins + 1))
+    np.cumsum(binned, axis=1, out=cumulative[:, 1:])
+    starts = np.arange(n_bins - width + 1)
+    window_times = cumulative[:, starts + width] - cumulative[:, starts]
+    window_start = edges[starts]
+    window_end = edges[starts + width]
+    
+    # Inequality per window over the active speakers, largest first
+    ranked = -np.sort(-window_times, axis=0)
+    totals = ranked.sum(axis=0)
+    active = (ranked > 0).sum(axis=0)
+    ranks = np.arange(1, ranked.shape[0] + 1)[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Same Gini as calculate_inequality_metrics, per window
+        gini = (active + 1) / active - (2 * (ranks * ranked).sum(axis=0)) / (active * totals)
+        top_3_share = np.where(active >= 3, ranked[:3].sum(axis=0) / totals * 100, 100.0)
+        proportions = ranked / totals
+        entropy = -np.where(ranked > 0, proportions * np.log2(np.where(ranked > 0, proportions, 1)), 0).sum(axis=0)
+        max_entropy = np.log2(np.maximum(active, 1))
+        normalized_entropy = np.where(max_entropy > 0, entropy / max_entropy, 0.0)
+    silent = totals <= 0
+    gini[silent] = np.nan
+    top_3_share[silent] = np.nan
+    normalized_entropy[silent] = np.nan
+    
+    # Interruptions per minute, counted with two binary searches per window
+    if interruptions is not None:
+        inter_times = np.sort(np.array([i['time'] for i in interruptions], dtype=np.float64))
+    elif metrics is not None:
+        inter_times = np.sort(metrics.interruption_events['time'])
+    else:
+        inter_times = np.sort(interruption_table(table)['time'])
+    inter_counts = (np.searchsorted(inter_times, window_end, side='left')
+                    - np.searchsorted(inter_times, window_start, side='left'))
+    minutes = (window_end - window_start) / 60
+    interruption_rate = np.divide(inter_counts, minutes, out=np.zeros(len(starts)), where=minutes > 0)
+    
+    def value(x):
+        return None if np.isnan(x) else x
+    
+    series = [
+        {'start': t0, 'end': t1, 'center': (t0 + t1) / 2, 'speaking_time': total,
+         'active_speakers': n_active, 'gini_coefficient': value(g), 'normalized_entropy': value(h),
+         'top_3_share': value(top3), 'interruptions': count, 'interruption_rate': rate}
+        for t0, t1, total, n_active, g, h, top3, count, rate in zip(
+            window_start.tolist(), window_end.tolist(), totals.tolist(), active.tolist(), gini.tolist(),
+            normalized_entropy.tolist(), top_3_share.tolist(), inter_counts.tolist(), interruption_rate.tolist())
+    ]
+    return {'window': width * (edges[1] - edges[0]) if len(edges) > 1 else 0, 'step': step, 'series': series}
+
+def create_rolling_power_metrics_visualization(rolling_metrics, inequality_metrics=None):
+    """Time series of rolling inequality and interruption rate across the meeting."""
+    series = rolling_metrics['series']
+    if not series:
+        return
+    
+    minutes = np.array([w['center'] for w in series]) / 60
+    
+    def values(key):
+        return np.array([np.nan if w[key] is None else w[key] for w in series], dtype=np.float64)
+    
+    fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(16, 10), sharex=True)
+    
+    ax1.plot(minutes, values('gini_coefficient'), color='steelblue', linewidth=2, label='Gini coefficient')
+    ax1.plot(minutes, values('normalized_entropy'), color='seagreen', linewidth=2, label='Normalized entropy')
+    if inequality_metrics:
+        ax1.axhline(inequality_metrics['gini_coefficient'], color='steelblue', linestyle='--', alpha=0.5,
+                    label='Whole-meeting Gini')
+    ax1.set_ylim(0, 1)
+    ax1.set_ylabel('Index (0-1)', fontsize=12)
+    ax1.legend(loc='upper right')
+    ax1.grid(alpha=0.3)
+    
+    ax2.plot(minutes, values('top_3_share'), color='darkorange', linewidth=2)
+    ax2.set_ylim(0, 105)
+    ax2.set_ylabel('Top-3 share (%)', fontsize=12)
+    ax2.grid(alpha=0.3)
+    
+    ax3.plot(minutes, values('interruption_rate'), color='firebrick', linewidth=2)
+    ax3.set_ylabel('Interruptions / min', fontsize=12)
+    ax3.set_xlabel('Window center (minutes)', fontsize=12)
+    ax3.grid(alpha=0.3)
+    
+    ax1.set_title(f"Rolling Power Metrics ({rolling_metrics['window'] / 60:.0f}-min window, "
+                  f"{rolling_metrics['step']:.0f}s step)", fontsize=14, pad=15)
+    plt.tight_layout()
+    plt.savefig('rolling_power_metrics.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
 def create_response_oriented_network(response_graph, speaker_times):
     """Create network graph where edges represent responses, weighted by duration of response chains."""
     G = nx.DiGraph()
@@ -2443,8 +4167,11 @@ def export_d3_data(segments, speaker_times, turns, turn_stats, interruptions,
                   gap_stats, total_time, response_graph, failed_interruptions,
                   tolerance_rates, attractor_scores, timeline_data, interruption_markers,
                   topics, speaker_orientations, topic_closures=None, accountability_patterns=None,
-                  recycled_topics=None, topic_hijackings=None):
+                  recycled_topics=None, topic_hijackings=None, metrics=None, rolling_metrics=None,
+                  word_overlap=None):
     """Export data in D3-friendly JSON format for interactive visualizations."""
+    if metrics is None:
+        metrics = StructuralMetrics(segments)
     
     # Prepare network graph data
     nodes = []
@@ -2470,32 +4197,17 @@ def export_d3_data(segments, speaker_times, turns, turn_stats, interruptions,
     network_data = {'nodes': nodes, 'links': links}
     
     # Prepare timeline data (all segments)
-    all_timeline_data = []
-    for seg in segments:
-        speaker = get_speaker(seg)
-        if not is_filler(seg['text']):
-            all_timeline_data.append({
-                'speaker': speaker,
-                'start': seg['start'],
-                'end': seg['end'],
-                'duration': seg['end'] - seg['start']
-            })
+    all_timeline_data = metrics.timeline_records()
     
     # Prepare cumulative data
     cumulative_data = []
-    time_bins = np.linspace(0, total_time, 100)
     top_speakers = sorted(speaker_times.items(), key=lambda x: x[1], reverse=True)[:8]
-    top_speaker_set = set([s[0] for s in top_speakers])
     
     for speaker, _ in top_speakers:
-        cumulative = []
-        current_total = 0
-        for seg in segments:
-            if get_speaker(seg) == speaker and not is_filler(seg['text']):
-                current_total += seg['end'] - seg['start']
+        # Total non-filler speaking time, as computed for the speaker in one pass
         cumulative_data.append({
             'speaker': speaker,
-            'cumulative_time': current_total
+            'cumulative_time': metrics.speaker_times.get(speaker, 0)
         })
     
     # Prepare interruption network
@@ -2537,16 +4249,12 @@ def export_d3_data(segments, speaker_times, turns, turn_stats, interruptions,
     
     # Prepare transition matrix
     all_speakers = sorted(set(speaker_times.keys()))
-    transition_matrix = []
-    for source in all_speakers:
-        row = []
-        for target in all_speakers:
-            count = transitions.get((source, target), 0)
-            row.append(count)
-        transition_matrix.append({
-            'source': source,
-            'targets': row
-        })
+    codes = [metrics.segments.speaker_index[speaker] for speaker in all_speakers]
+    counts = metrics.transition_counts[np.ix_(codes, codes)]
+    transition_matrix = [
+        {'source': source, 'targets': row}
+        for source, row in zip(all_speakers, counts.tolist())
+    ]
     
     # Prepare turn length data
     turn_length_data = []
@@ -2557,47 +4265,26 @@ def export_d3_data(segments, speaker_times, turns, turn_stats, interruptions,
                 'duration': duration
             })
     
-    # Prepare participation heatmap data
+    # Prepare participation heatmap data: the default 20 segments, plus 1-minute bins
+    top_speakers_heatmap = [s[0] for s in sorted(speaker_times.items(), key=lambda x: x[1], reverse=True)[:15]]
+    
+    def heatmap_block(matrix, edges):
+        rows = _participation_rows(metrics.segments, matrix, top_speakers_heatmap)
+        return {
+            'n_segments': matrix.shape[1],
+            'segment_duration': float(edges[1] - edges[0]) if len(edges) > 1 else 0,
+            'data': [
+                {'speaker': speaker, 'segments': [{'segment': i, 'time': t} for i, t in enumerate(row)]}
+                for speaker, row in zip(top_speakers_heatmap, rows.tolist())
+            ]
+        }
+    
     n_segments = 20
-    segment_duration = total_time / n_segments
-    heatmap_data = []
-    top_speakers_heatmap = sorted(speaker_times.items(), key=lambda x: x[1], reverse=True)[:15]
-    
-    for speaker, _ in top_speakers_heatmap:
-        row = []
-        for i in range(n_segments):
-            seg_start = i * segment_duration
-            seg_end = (i + 1) * segment_duration
-            time_in_segment = 0
-            for seg in segments:
-                if get_speaker(seg) == speaker and not is_filler(seg['text']):
-                    overlap_start = max(seg['start'], seg_start)
-                    overlap_end = min(seg['end'], seg_end)
-                    if overlap_start < overlap_end:
-                        time_in_segment += overlap_end - overlap_start
-            row.append({
-                'segment': i,
-                'time': time_in_segment
-            })
-        heatmap_data.append({
-            'speaker': speaker,
-            'segments': row
-        })
+    participation_heatmap = heatmap_block(*metrics.participation(n_bins=n_segments))
+    participation_heatmap_by_minute = heatmap_block(*metrics.participation(bin_width=60))
     
     # Prepare gaps data
-    gaps_data = []
-    for i in range(len(segments) - 1):
-        current = segments[i]
-        next_seg = segments[i + 1]
-        current_speaker = get_speaker(current)
-        next_speaker = get_speaker(next_seg)
-        gap = next_seg['start'] - current['end']
-        if gap >= 0:
-            gaps_data.append({
-                'gap': gap,
-                'type': 'same_speaker' if current_speaker == next_speaker else 'speaker_change',
-                'time': current['end']
-            })
+    gaps_data = metrics.gap_records()
     
     # Prepare Lorenz curve data
     times = sorted(speaker_times.values(), reverse=True)
@@ -2677,15 +4364,14 @@ def export_d3_data(segments, speaker_times, turns, turn_stats, interruptions,
             'matrix': transition_matrix
         },
         'turn_lengths': turn_length_data,
-        'participation_heatmap': {
-            'n_segments': n_segments,
-            'segment_duration': segment_duration,
-            'data': heatmap_data
-        },
+        'participation_heatmap': participation_heatmap,
+        'participation_heatmap_by_minute': participation_heatmap_by_minute,
         'gaps': gaps_data,
         'lorenz_curve': lorenz_data,
         'inequality_metrics': inequality_metrics,
         'gap_statistics': gap_stats,
+        'rolling_power_metrics': rolling_metrics if rolling_metrics else {},
+        'word_overlap': word_overlap if word_overlap else {},
         'speaker_times': {k: float(v) for k, v in speaker_times.items()},
         'agenda_control': {
             'introductions': [
@@ -2819,39 +4505,40 @@ def generate_summary_report(speaker_times, total_time, turn_stats, interruptions
 
 def main():
     print("Loading transcript...")
-    segments = load_transcript('amuta_2026-01-12_1.json')
+    segments = load_transcript('amuta_2026-01-12_1.json', cache_dir=TRANSCRIPT_CACHE_DIR)
     print(f"Loaded {len(segments)} segments")
     
-    print("Computing speaking time...")
-    speaker_times, total_time = compute_speaking_time(segments)
-    
-    print("Analyzing turn-taking...")
-    turns, turn_stats = compute_turn_taking(segments)
-    
-    print("Detecting interruptions and overlaps...")
-    interruptions, overlaps = detect_interruptions(segments, threshold=0.5)
+    print("Computing structural metrics (speaking time, turns, interruptions, transitions, gaps)...")
+    metrics = StructuralMetrics(segments, interruption_threshold=0.5, silence_threshold=2.0)
+    speaker_times, total_time = metrics.speaker_times, metrics.total_time
+    turns, turn_stats = metrics.turns, metrics.turn_stats
+    interruptions, overlaps = metrics.interruptions, metrics.overlaps
+    transitions = metrics.transitions
+    response_graph = metrics.response_graph
     
-    print("Building interaction graph...")
-    transitions, transition_durations = build_interaction_graph(segments)
-    
-    print("Building response-oriented graph...")
-    response_graph = build_response_oriented_graph(segments, turns)
+    print("Detecting word-level overlaps...")
+    words, word_speakers = load_word_intervals('amuta_2026-01-12_1.json', segments.speakers,
+                                               cache_dir=TRANSCRIPT_CACHE_DIR)
+    overlap_episodes, overlap_matrix = detect_word_overlaps(words, word_speakers)
+    word_overlap = word_overlap_summary(overlap_episodes, overlap_matrix, word_speakers)
     
     print("Detecting failed interruptions and tolerance...")
     failed_interruptions, tolerance_rates = detect_failed_interruptions(segments, interruptions, turns)
+    recovery_latency = floor_recovery_latency(failed_interruptions)
     
     print("Identifying conversational attractors...")
-    attractor_scores = identify_conversational_attractors(response_graph, speaker_times)
+    attractor_scores = metrics.attractor_scores
     
     print("Creating floor holding timeline...")
     timeline_data, interruption_markers = create_floor_holding_timeline(
         segments, interruptions, failed_interruptions, speaker_times)
     
-    print("Identifying agenda control...")
-    agenda_introductions = identify_agenda_control(segments, turns, silence_threshold=2.0)
+    agenda_introductions = metrics.agenda_introductions
     
     print("Analyzing topic emergence and lifecycle...")
-    topics = analyze_topic_lifecycle(segments, turns, similarity_threshold=0.25, stabilization_threshold=0.3)
+    workers = topic_workers()
+    topics = analyze_topic_lifecycle(segments, turns, similarity_threshold=0.25, stabilization_threshold=0.3,
+                                     workers=workers)
     
     print("Analyzing speaker orientation to topics...")
     speaker_orientations = analyze_speaker_orientation_to_topics(topics, segments, turns, similarity_threshold=0.3)
@@ -2869,8 +4556,8 @@ def main():
     create_cumulative_speaking_time(segments, speaker_times, total_time)
     create_turn_length_distribution(turn_stats)
     create_interruption_network(interruptions, speaker_times)
-    gap_stats = create_gap_analysis(segments)
-    create_participation_heatmap(segments, speaker_times, total_time, n_segments=20)
+    gap_stats = create_gap_analysis(segments, metrics)
+    create_participation_heatmap(segments, speaker_times, total_time, n_segments=20, metrics=metrics)
     create_inequality_visualization(speaker_times)
     
     print("Generating relational interaction visualizations...")
@@ -2890,7 +4577,8 @@ def main():
     topic_engagement = analyze_topic_engagement_and_power(topics, speaker_orientations, speaker_times, total_time)
     
     print("Analyzing fine-grained topic-speaker relations...")
-    topic_closures = detect_topic_closure_authority(topics, segments, turns, similarity_threshold=0.3)
+    topic_closures = detect_topic_closure_authority(topics, segments, turns, similarity_threshold=0.3,
+                                                    workers=workers)
     accountability_patterns = detect_asymmetric_topical_accountability(topics, segments, turns)
     recycled_topics = detect_topic_recycling(topics, segments, turns, similarity_threshold=0.4)
     topic_hijackings = detect_topic_hijacking_vs_alignment(topics, segments, turns, similarity_threshold=0.3)
@@ -2899,8 +4587,13 @@ def main():
     create_fine_grained_topic_power_report(topic_closures, accountability_patterns, 
                                           recycled_topics, topic_hijackings, topics, speaker_times)
     
-    # Calculate inequality metrics
+    # Calculate inequality metrics, for the whole meeting and over sliding windows
     inequality_metrics = calculate_inequality_metrics(speaker_times)
+    rolling_metrics = compute_rolling_power_metrics(segments, window=300, step=30, metrics=metrics)
+    create_rolling_power_metrics_visualization(rolling_metrics, inequality_metrics)
+    
+    print("Bootstrapping confidence intervals...")
+    confidence_intervals = bootstrap_confidence_intervals(metrics, failed_interruptions)
     
     print("Generating summary report...")
     report = generate_summary_report(speaker_times, total_time, turn_stats, 
@@ -2910,6 +4603,9 @@ def main():
     # Add new metrics to report
     report['inequality_metrics'] = inequality_metrics
     report['gap_statistics'] = gap_stats
+    report['floor_recovery_latency'] = recovery_latency
+    report['word_overlap'] = word_overlap
+    report['confidence_intervals'] = confidence_intervals
     
     # Save report
     with open('power_dynamics_report.json', 'w', encoding='utf-8') as f:
@@ -2922,7 +4618,8 @@ def main():
                    gap_stats, total_time, response_graph, failed_interruptions, 
                    tolerance_rates, attractor_scores, timeline_data, interruption_markers,
                    topics, speaker_orientations, topic_closures, accountability_patterns,
-                   recycled_topics, topic_hijackings)
+                   recycled_topics, topic_hijackings, metrics=metrics, rolling_metrics=rolling_metrics,
+                   word_overlap=dict(word_overlap, episodes=overlap_episodes))
     
     # Print summary
     print("\n" + "="*80)
@@ -2953,11 +4650,18 @@ def main():
         for speaker, count in interrupter_counts.most_common(5):
             print(f"  {speaker}: {count}")
     
+    overall_latency = recovery_latency['overall']
+    if overall_latency['count']:
+        print(f"Floor recovered after {overall_latency['count']} interruptions: "
+              f"median {overall_latency['median']:.2f}s, p90 {overall_latency['p90']:.2f}s")
+    
     print("\n--- Overlap Patterns ---")
     print(f"Total overlaps: {len(overlaps)}")
     if overlaps:
         total_overlap_time = sum([o['overlap_duration'] for o in overlaps])
         print(f"Total overlap duration: {total_overlap_time:.2f}s")
+    print(f"Word-level overlap episodes: {word_overlap['total_episodes']} "
+          f"({word_overlap['total_duration']:.2f}s)")
     
     print("\n--- Interaction Graph ---")
     print(f"Total transitions: {sum(transitions.values())}")
@@ -3006,6 +4710,10 @@ def main():
     print("\n--- Inequality Metrics ---")
     if inequality_metrics:
         print(f"Gini Coefficient: {inequality_metrics['gini_coefficient']:.3f}")
+        gini_ci = confidence_intervals['inequality_metrics'].get('gini_coefficient')
+        if gini_ci and gini_ci['ci_low'] is not None:
+            print(f"  Gini {confidence_intervals['confidence']:.0%} CI: "
+                  f"[{gini_ci['ci_low']:.3f}, {gini_ci['ci_high']:.3f}]")
         print(f"Top 10% share: {inequality_metrics['top_10_percent_share']:.1f}%")
         print(f"Top 3 share: {inequality_metrics['top_3_share']:.1f}%")
         print(f"Normalized Entropy: {inequality_metrics['normalized_entropy']:.3f}")
@@ -3023,6 +4731,7 @@ def main():
     print("  - gap_analysis.png")
     print("  - participation_heatmap.png")
     print("  - inequality_lorenz_curve.png")
+    print("  - rolling_power_metrics.png")
     print("  - response_oriented_network.png")
     print("  - floor_holding_interruptions.png")
     print("  - interruption_tolerance.png")
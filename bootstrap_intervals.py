@@ -0,0 +1,228 @@
+"""
+Bootstrap confidence intervals for the structural power metrics.
+
+Replicates are drawn as index matrices with one row per replicate, and each
+statistic is evaluated on every row at once with NumPy (grouped sums via
+bincount, row-wise sorts and reductions), so thousands of replicates cost a
+handful of array operations. The matrices are drawn in chunks of at most
+DEFAULT_CHUNK_ELEMENTS indices, so peak memory does not grow with the number
+of replicates times the number of units. Resampling is i.i.d. by default. With a
+block_length above 1 it is a circular block bootstrap: contiguous runs of
+units are resampled together, preserving the short-range dependence between
+neighbouring turns or segments.
+"""
+
+import warnings
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_REPLICATES = 2000
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_CHUNK_ELEMENTS = 1 << 22
+
+
+def default_block_length(n: int) -> int:
+    """Block length for n time-ordered units: the usual n ** (1/3) rule, at least 1."""
+    return max(1, int(round(n ** (1 / 3))))
+
+
+def resample_indices(n: int, n_replicates: int = DEFAULT_REPLICATES, block_length: int = 1,
+                     rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Draw bootstrap resamples of n ordered units.
+
+    Args:
+        n: Number of units (turns, segments, ...)
+        n_replicates: Number of replicates
+        block_length: 1 for i.i.d. resampling; otherwise the length of the
+            contiguous blocks (wrapping around the end) that are resampled
+        rng: Random generator (a fresh default generator if None)
+
+    Returns:
+        Integer array of shape (n_replicates, n), each row one resample
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    if n == 0:
+        return np.empty((n_replicates, 0), dtype=np.int64)
+    if block_length <= 1:
+        return rng.integers(0, n, size=(n_replicates, n))
+
+    block_length = min(block_length, n)
+    n_blocks = -(-n // block_length)
+    starts = rng.integers(0, n, size=(n_replicates, n_blocks))
+    indices = (starts[:, :, None] + np.arange(block_length)).reshape(n_replicates, -1)[:, :n]
+    return indices % n
+
+
+def resample_chunks(n: int, n_replicates: int = DEFAULT_REPLICATES, block_length: int = 1,
+                    rng: Optional[np.random.Generator] = None,
+                    max_elements: int = DEFAULT_CHUNK_ELEMENTS) -> Iterator[np.ndarray]:
+    """
+    Draw the resamples of resample_indices a chunk of replicates at a time.
+
+    Args:
+        n: Number of units
+        n_replicates: Total number of replicates
+        block_length: Block length (1 for i.i.d. resampling)
+        rng: Random generator (a fresh default generator if None)
+        max_elements: Upper bound on the indices in one chunk (at least one row is drawn)
+
+    Yields:
+        Integer arrays of shape (rows, n), together n_replicates rows
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    rows = max(1, max_elements // max(n, 1))
+    for start in range(0, n_replicates, rows):
+        yield resample_indices(n, min(rows, n_replicates - start), block_length, rng)
+
+
+def grouped_sums(groups: np.ndarray, values: np.ndarray, indices: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Per-group sums of values under each resample.
+
+    Args:
+        groups: Group code (e.g. speaker code) of each unit
+        values: Value of each unit
+        indices: Resample matrix from resample_indices
+        n_groups: Number of group codes
+
+    Returns:
+        Array of shape (n_replicates, n_groups)
+    """
+    n_replicates = indices.shape[0]
+    flat = np.arange(n_replicates)[:, None] * n_groups + groups[indices]
+    sums = np.bincount(flat.ravel(), weights=values[indices].ravel(), minlength=n_replicates * n_groups)
+    return sums.reshape(n_replicates, n_groups)
+
+
+def inequality_rows(totals: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Inequality metrics of each row of per-speaker totals.
+
+    Uses the formulas of calculate_inequality_metrics in analyze_power_dynamics,
+    so the interval brackets the value the report prints.
+
+    Args:
+        totals: Array of shape (n_rows, n_speakers)
+
+    Returns:
+        Mapping from metric name to an array with one value per row
+    """
+    n = totals.shape[1]
+    ordered = -np.sort(-totals, axis=1)
+    sums = ordered.sum(axis=1)
+    # Row-wise reduction rather than a matrix-vector product, whose summation order (and so
+    # its last bits) would depend on how many rows are evaluated together
+    gini = (n + 1) / n - (2 * (ordered * np.arange(1, n + 1)).sum(axis=1)) / (n * sums)
+    top_3_share = ordered[:, :3].sum(axis=1) / sums * 100 if n >= 3 else np.full(len(totals), 100.0)
+
+    proportions = ordered / sums[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(proportions > 0, proportions * np.log2(proportions), 0.0)
+    entropy = -terms.sum(axis=1)
+    max_entropy = np.log2(n) if n > 0 else 0
+    normalized_entropy = entropy / max_entropy if max_entropy > 0 else np.zeros(len(totals))
+
+    return {
+        'gini_coefficient': gini,
+        'top_3_share': top_3_share,
+        'normalized_entropy': normalized_entropy
+    }
+
+
+def percentile_interval(replicates: np.ndarray, confidence: float = DEFAULT_CONFIDENCE) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Percentile interval along the replicate axis, ignoring NaN replicates.
+
+    Args:
+        replicates: Array whose first axis indexes replicates
+        confidence: Coverage of the interval
+
+    Returns:
+        (low, high) arrays; NaN where every replicate is NaN
+    """
+    alpha = (1 - confidence) / 2
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # All-NaN columns
+        low, high = np.nanpercentile(replicates, [100 * alpha, 100 * (1 - alpha)], axis=0)
+    return low, high
+
+
+def _interval(estimate, low, high) -> Dict[str, Optional[float]]:
+    def value(x):
+        return None if x is None or not np.isfinite(x) else float(x)
+    return {'estimate': value(estimate), 'ci_low': value(low), 'ci_high': value(high)}
+
+
+def bootstrap_inequality(groups: np.ndarray, values: np.ndarray, n_groups: int,
+                         n_replicates: int = DEFAULT_REPLICATES, block_length: int = 1,
+                         confidence: float = DEFAULT_CONFIDENCE, rng: Optional[np.random.Generator] = None,
+                         max_elements: int = DEFAULT_CHUNK_ELEMENTS) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Bootstrap intervals for the inequality of per-group totals.
+
+    Args:
+        groups: Group code of each unit, in time order
+        values: Value of each unit (e.g. segment duration)
+        n_groups: Number of groups; groups that draw no units in a replicate count as zero
+        n_replicates: Number of replicates
+        block_length: Block length (1 for i.i.d. resampling)
+        confidence: Interval coverage
+        rng: Random generator
+        max_elements: Resample indices drawn per chunk (see resample_chunks)
+
+    Returns:
+        Mapping from metric name to {'estimate', 'ci_low', 'ci_high'}
+    """
+    if len(values) == 0 or n_groups == 0:
+        return {}
+    estimates = inequality_rows(np.bincount(groups, weights=values, minlength=n_groups)[None, :])
+    chunks = [inequality_rows(grouped_sums(groups, values, indices, n_groups))
+              for indices in resample_chunks(len(values), n_replicates, block_length, rng, max_elements)]
+
+    intervals = {}
+    for name, estimate in estimates.items():
+        low, high = percentile_interval(np.concatenate([chunk[name] for chunk in chunks]), confidence)
+        intervals[name] = _interval(estimate[0], low, high)
+    return intervals
+
+
+def bootstrap_group_means(groups: np.ndarray, values: np.ndarray, n_groups: int,
+                          n_replicates: int = DEFAULT_REPLICATES, block_length: int = 1,
+                          confidence: float = DEFAULT_CONFIDENCE, rng: Optional[np.random.Generator] = None,
+                          max_elements: int = DEFAULT_CHUNK_ELEMENTS) -> Dict[int, Dict[str, Optional[float]]]:
+    """
+    Bootstrap intervals for the mean value of each group.
+
+    Replicates in which a group draws no units are left out of that group's
+    interval.
+
+    Args:
+        groups: Group code of each unit, in time order
+        values: Value of each unit (e.g. turn duration, or 1/0 for a maintained floor)
+        n_groups: Number of groups
+        n_replicates: Number of replicates
+        block_length: Block length (1 for i.i.d. resampling)
+        confidence: Interval coverage
+        rng: Random generator
+        max_elements: Resample indices drawn per chunk (see resample_chunks)
+
+    Returns:
+        Mapping from each group code present in the data to {'estimate', 'ci_low', 'ci_high'}
+    """
+    if len(values) == 0 or n_groups == 0:
+        return {}
+    ones = np.ones(len(values))
+    counts = np.bincount(groups, minlength=n_groups)
+    estimates = np.bincount(groups, weights=values, minlength=n_groups) / np.maximum(counts, 1)
+
+    chunks = []
+    for indices in resample_chunks(len(values), n_replicates, block_length, rng, max_elements):
+        sums = grouped_sums(groups, values, indices, n_groups)
+        draws = grouped_sums(groups, ones, indices, n_groups)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            chunks.append(np.where(draws > 0, sums / draws, np.nan))
+    low, high = percentile_interval(np.concatenate(chunks), confidence)
+
+    return {code: _interval(estimates[code], low[code], high[code]) for code in np.flatnonzero(counts).tolist()}
@@ -8,7 +8,8 @@ from integrate_llm_results import (
     export_llm_to_d3
 )
 from analyze_power_dynamics import (
-    load_transcript, compute_turn_taking, analyze_topic_lifecycle
+    load_transcript, compute_turn_taking, analyze_topic_lifecycle,
+    TRANSCRIPT_CACHE_DIR
 )
 
 def main():
@@ -19,7 +20,7 @@ def main():
     
     # Load structural analysis
     print("Loading structural analysis...")
-    segments = load_transcript('amuta_2026-01-12_1.json')
+    segments = load_transcript('amuta_2026-01-12_1.json', cache_dir=TRANSCRIPT_CACHE_DIR)
     turns, turn_stats = compute_turn_taking(segments)
     structural_topics = analyze_topic_lifecycle(segments, turns, 
                                                 similarity_threshold=0.25, 
@@ -175,10 +175,13 @@ Output format: JSON with the following structure:
         turn_contexts = []
         
         for i, turn in enumerate(turns):
-            # Get all segments for this turn
-            turn_segments = [s for s in segments if
-                           self._get_speaker(s) == turn['speaker'] and
-                           turn['start'] <= s['start'] <= turn['end']]
+            # Get all segments for this turn (turns from compute_turn_taking carry their segment range)
+            if 'first_segment' in turn:
+                turn_segments = [segments[j] for j in range(turn['first_segment'], turn['last_segment'] + 1)]
+            else:
+                turn_segments = [s for s in segments if
+                               self._get_speaker(s) == turn['speaker'] and
+                               turn['start'] <= s['start'] <= turn['end']]
             
             # Combine text
             text = ' '.join([s.get('text', '').strip() for s in turn_segments 
@@ -15,12 +15,12 @@ def load_structural_analysis_data():
     # Import structural analysis functions
     from analyze_power_dynamics import (
         load_transcript, compute_turn_taking, analyze_topic_lifecycle,
-        get_speaker
+        get_speaker, TRANSCRIPT_CACHE_DIR
     )
     
     # Load transcript
     print("  Loading transcript...")
-    segments = load_transcript('amuta_2026-01-12_1.json')
+    segments = load_transcript('amuta_2026-01-12_1.json', cache_dir=TRANSCRIPT_CACHE_DIR)
     
     # Compute turns
     print("  Computing turns...")
@@ -67,11 +67,12 @@ def main():
         print("\nGenerating structural analysis first...")
         # Import and run structural analysis
         from analyze_power_dynamics import (
-            load_transcript, compute_turn_taking, analyze_topic_lifecycle
+            load_transcript, compute_turn_taking, analyze_topic_lifecycle,
+            TRANSCRIPT_CACHE_DIR
         )
         
         print("Loading transcript...")
-        segments = load_transcript('amuta_2026-01-12_1.json')
+        segments = load_transcript('amuta_2026-01-12_1.json', cache_dir=TRANSCRIPT_CACHE_DIR)
         
         print("Computing turns...")
         turns, turn_stats = compute_turn_taking(segments)
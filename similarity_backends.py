@@ -0,0 +1,325 @@
+"""
+Pluggable text-similarity backends for the topic analysis.
+
+A backend is fitted on a meeting's turn texts and returns an encoder whose
+transform turns texts into L2-normalized sparse rows, so cosine similarity is
+a row dot product. TF-IDF, fitted per meeting, is the default. Two offline
+embedding backends are also provided: a hashed character n-gram vectorizer
+and a locally stored sentence-embedding model. Both run on the CPU and store
+vectors in a persistent cache keyed by a hash of the normalized text, so a
+turn is embedded once across re-runs and meetings.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+DEFAULT_BATCH_SIZE = 64
+
+
+def normalize_text(text: str) -> str:
+    """Unicode-normalize text and collapse whitespace, the form that is embedded and hashed."""
+    return ' '.join(unicodedata.normalize('NFKC', text).split())
+
+
+class TfidfBackend:
+    """TF-IDF over unigrams and bigrams, fitted on each meeting's own turns."""
+
+    name = 'tfidf'
+
+    def __init__(self, max_features: Optional[int] = None):
+        self.max_features = max_features
+
+    def fit(self, texts: Sequence[str]) -> 'TfidfEncoder':
+        """
+        Fit the vocabulary and IDF weights on texts.
+
+        Args:
+            texts: Texts defining the vector space (normally every turn)
+
+        Returns:
+            Encoder projecting texts into the fitted space
+        """
+        vectorizer = TfidfVectorizer(max_features=self.max_features, stop_words='english',
+                                     ngram_range=(1, 2), min_df=1, token_pattern=r'\b\w+\b')
+        try:
+            vectorizer.fit(texts)
+        except ValueError:
+            # Empty vocabulary: every text is stop words or blank
+            return TfidfEncoder(None)
+        return TfidfEncoder(vectorizer)
+
+
+class TfidfEncoder:
+    """A fitted TF-IDF space. Without a vectorizer (empty vocabulary) every row has zero columns."""
+
+    def __init__(self, vectorizer: Optional[TfidfVectorizer]):
+        self.vectorizer = vectorizer
+
+    def transform(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """Project texts into the fitted space as L2-normalized sparse rows."""
+        if self.vectorizer is None:
+            return sparse.csr_matrix((len(texts), 0))
+        return self.vectorizer.transform(texts).tocsr()
+
+
+class EmbeddingCache:
+    """
+    Persistent text-embedding store in a single SQLite file.
+
+    Entries are keyed by backend identity plus normalized-text hash. Reads
+    refresh an entry's last-used time, and the least recently used entries
+    are evicted once the stored vectors exceed max_bytes.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('CREATE TABLE IF NOT EXISTS embeddings ('
+                          'key TEXT PRIMARY KEY, dim INTEGER, vector BLOB, '
+                          'size INTEGER, last_used REAL)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)')
+        self.conn.commit()
+
+    @staticmethod
+    def key(backend_id: str, text: str) -> str:
+        """Cache key for an already-normalized text under a backend."""
+        return hashlib.sha256(f"{backend_id}\0{text}".encode('utf-8')).hexdigest()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up several keys at once.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping from each key found to its float32 vector
+        """
+        found = {}
+        keys = list(dict.fromkeys(keys))
+        # Stay below SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.conn.execute(f'SELECT key, dim, vector FROM embeddings WHERE key IN ({placeholders})',
+                                     chunk).fetchall()
+            for key, dim, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32, count=dim)
+        if found:
+            now = time.time()
+            self.conn.executemany('UPDATE embeddings SET last_used = ? WHERE key = ?',
+                                  [(now, key) for key in found])
+            self.conn.commit()
+        return found
+
+    def put_many(self, items: Iterable[tuple]):
+        """Store (key, vector) pairs, then evict down to max_bytes."""
+        now = time.time()
+        rows = []
+        for key, vector in items:
+            blob = np.ascontiguousarray(vector, dtype=np.float32).tobytes()
+            rows.append((key, len(vector), blob, len(blob), now))
+        self.conn.executemany('INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?)', rows)
+        self.conn.commit()
+        self.evict()
+
+    def size(self) -> int:
+        """Total bytes of stored vectors."""
+        return self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM embeddings').fetchone()[0]
+
+    def evict(self):
+        """Drop least recently used entries until the store fits in max_bytes."""
+        excess = self.size() - self.max_bytes
+        if excess <= 0:
+            return
+        doomed = []
+        for key, size in self.conn.execute('SELECT key, size FROM embeddings ORDER BY last_used'):
+            doomed.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self.conn.executemany('DELETE FROM embeddings WHERE key = ?', doomed)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+class EmbeddingBackend(ABC):
+    """
+    Base for fixed (not per-meeting) embedding backends.
+
+    Subclasses set name and identity and implement _embed_batch. Texts are
+    normalized and deduplicated, served from the cache when possible, and
+    only the misses are embedded, in batches of batch_size.
+    """
+
+    name = 'embedding'
+    identity = 'embedding'
+
+    def __init__(self, cache: Optional[EmbeddingCache] = None, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.cache = cache
+        self.batch_size = batch_size
+
+    @abstractmethod
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed a batch of normalized texts as dense rows (normalized by embed)."""
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts, using and filling the cache.
+
+        Args:
+            texts: Raw texts
+
+        Returns:
+            Dense float32 array, one L2-normalized row per text (all-zero rows
+            for texts with no features)
+        """
+        normalized = [normalize_text(text) for text in texts]
+        unique = list(dict.fromkeys(normalized))
+        keys = {text: EmbeddingCache.key(self.identity, text) for text in unique}
+        vectors = self.cache.get_many(list(keys.values())) if self.cache is not None else {}
+
+        missing = [text for text in unique if keys[text] not in vectors]
+        computed = []
+        for i in range(0, len(missing), self.batch_size):
+            batch = missing[i:i + self.batch_size]
+            embedded = np.asarray(self._embed_batch(batch), dtype=np.float32)
+            norms = np.linalg.norm(embedded, axis=1, keepdims=True)
+            embedded = np.divide(embedded, norms, out=np.zeros_like(embedded), where=norms > 0)
+            computed.extend(zip((keys[text] for text in batch), embedded))
+        vectors.update(computed)
+        if computed and self.cache is not None:
+            self.cache.put_many(computed)
+
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack([vectors[keys[text]] for text in normalized])
+
+    def fit(self, texts: Sequence[str]) -> 'EmbeddingBackend':
+        """Nothing is fitted per meeting; the backend is its own encoder."""
+        return self
+
+    def transform(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """Embed texts as sparse rows, so the similarity code can treat every backend alike."""
+        return sparse.csr_matrix(self.embed(texts))
+
+
+class HashedNgramBackend(EmbeddingBackend):
+    """
+    Hashed character n-gram vectors: no model or vocabulary to store, and
+    tolerant of inflection and spelling variants that defeat word TF-IDF.
+    """
+
+    name = 'hashed'
+
+    def __init__(self, n_features: int = 1024, ngram_range: tuple = (3, 5),
+                 cache: Optional[EmbeddingCache] = None, batch_size: int = DEFAULT_BATCH_SIZE):
+        super().__init__(cache, batch_size)
+        self.vectorizer = HashingVectorizer(analyzer='char_wb', ngram_range=ngram_range, n_features=n_features,
+                                            alternate_sign=False, norm='l2', lowercase=True)
+        self.identity = f"hashed-char_wb-{ngram_range[0]}-{ngram_range[1]}-{n_features}"
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        return self.vectorizer.transform(texts).toarray()
+
+
+def model_fingerprint(model_path: str) -> str:
+    """
+    Hash of every file under a model directory (relative path and contents, in sorted order).
+
+    Args:
+        model_path: Model directory
+
+    Returns:
+        Hex sha256 digest, changing whenever the weights or any configuration file change
+    """
+    h = hashlib.sha256()
+    for root, dirs, files in os.walk(model_path):
+        dirs.sort()
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+            h.update(os.path.relpath(path, model_path).encode('utf-8') + b'\0')
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    h.update(chunk)
+    return h.hexdigest()
+
+
+class SentenceEmbeddingBackend(EmbeddingBackend):
+    """
+    Sentence-embedding model loaded from a local directory, run on the CPU without network access.
+
+    The cache identity is the model's resolved path plus a fingerprint of its
+    files, so two models with the same directory name, or a model updated in
+    place, never share cached vectors.
+    """
+
+    name = 'sentence'
+
+    def __init__(self, model_path: str, cache: Optional[EmbeddingCache] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError("sentence-transformers library required for the sentence backend. "
+                              "Install with: pip install sentence-transformers")
+        super().__init__(cache, batch_size)
+        self.model = SentenceTransformer(model_path, device='cpu', local_files_only=True)
+        if os.path.isdir(model_path):
+            location, fingerprint = os.path.realpath(model_path), model_fingerprint(model_path)
+        else:
+            # Resolved by name from the local model cache: fingerprint the loaded modules and weights
+            h = hashlib.sha256(repr(self.model).encode('utf-8'))
+            for parameter, tensor in self.model.state_dict().items():
+                h.update(parameter.encode('utf-8'))
+                h.update(tensor.detach().cpu().numpy().tobytes())
+            location, fingerprint = model_path, h.hexdigest()
+        self.identity = f"sentence-{location}-{fingerprint}"
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        return self.model.encode(texts, batch_size=self.batch_size, convert_to_numpy=True,
+                                 show_progress_bar=False)
+
+
+def make_similarity_backend(name: str = 'tfidf', cache_path: Optional[str] = None,
+                            max_cache_bytes: int = DEFAULT_CACHE_BYTES, **options):
+    """
+    Build a backend by name.
+
+    Args:
+        name: 'tfidf', 'hashed' or 'sentence'
+        cache_path: SQLite file for the embedding cache (embedding backends only)
+        max_cache_bytes: Size bound of the embedding cache
+        **options: Backend constructor arguments (e.g. model_path for 'sentence')
+
+    Returns:
+        Backend instance
+    """
+    if name == 'tfidf':
+        return TfidfBackend(**options)
+    cache = EmbeddingCache(cache_path, max_cache_bytes) if cache_path else None
+    if name == 'hashed':
+        return HashedNgramBackend(cache=cache, **options)
+    if name == 'sentence':
+        return SentenceEmbeddingBackend(cache=cache, **options)
+    raise ValueError(f"Unknown similarity backend: {name!r}")
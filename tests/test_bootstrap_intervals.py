@@ -0,0 +1,58 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analyze_power_dynamics as apd
+import bootstrap_intervals as bi
+
+
+def sample(n=400, n_groups=6, seed=2):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, n_groups, n), rng.exponential(3.0, n), n_groups
+
+
+@pytest.mark.parametrize('block_length', [1, 7])
+def test_intervals_are_deterministic_and_independent_of_chunk_size(block_length):
+    groups, values, n_groups = sample()
+
+    def run(max_elements):
+        rng = np.random.default_rng(0)
+        return (bi.bootstrap_inequality(groups, values, n_groups, 500, block_length, rng=rng,
+                                        max_elements=max_elements),
+                bi.bootstrap_group_means(groups, values, n_groups, 500, block_length, rng=rng,
+                                         max_elements=max_elements))
+
+    whole = run(bi.DEFAULT_CHUNK_ELEMENTS)
+    assert run(bi.DEFAULT_CHUNK_ELEMENTS) == whole
+    assert run(4000) == whole
+    assert run(1) == whole  # One replicate per chunk
+
+
+def test_estimates_match_the_report_metrics():
+    groups, values, n_groups = sample()
+    intervals = bi.bootstrap_inequality(groups, values, n_groups, 300, rng=np.random.default_rng(1))
+    totals = {code: float(values[groups == code].sum()) for code in range(n_groups)}
+    expected = apd.calculate_inequality_metrics(totals)
+
+    for name in ('gini_coefficient', 'top_3_share', 'normalized_entropy'):
+        interval = intervals[name]
+        assert interval['estimate'] == pytest.approx(expected[name])
+        assert interval['ci_low'] <= interval['estimate'] <= interval['ci_high']
+
+    means = bi.bootstrap_group_means(groups, values, n_groups, 300, rng=np.random.default_rng(1))
+    for code, interval in means.items():
+        assert interval['estimate'] == pytest.approx(values[groups == code].mean())
+
+
+def test_block_resamples_are_contiguous_and_wrap():
+    indices = bi.resample_indices(10, 50, block_length=4, rng=np.random.default_rng(3))
+
+    assert indices.shape == (50, 10)
+    # Within each block of 4, indices step by one modulo n
+    steps = (indices[:, 1:] - indices[:, :-1]) % 10
+    within_block = np.arange(1, 10) % 4 != 0
+    assert (steps[:, within_block] == 1).all()
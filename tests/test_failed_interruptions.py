@@ -0,0 +1,80 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analyze_power_dynamics as apd
+
+
+def random_meeting(n_segments=300, seed=7):
+    rng = np.random.default_rng(seed)
+    segments, t = [], 0.0
+    for _ in range(n_segments):
+        # Mostly short gaps, some overlaps, occasional long pauses
+        t += rng.choice([-0.6, -0.2, 0.1, 0.3, 1.0, 3.0])
+        duration = rng.uniform(0.5, 6.0)
+        segments.append({'start': max(t, 0.0), 'end': max(t, 0.0) + duration,
+                         'speaker': f'SPEAKER_{rng.integers(0, 4)}', 'text': 'word ' * 5})
+        t = max(t, 0.0) + duration
+    return segments
+
+
+def linear_failed_interruptions(segments, interruptions, turns):
+    """The original per-interruption scan over all turns and segments."""
+    failed = []
+    turn_timeline = sorted(turns, key=lambda x: x['start'])
+    for interruption_id, inter in enumerate(interruptions):
+        interrupted = inter['interrupted']
+        interrupted_turn = next((turn for turn in turn_timeline if turn['speaker'] == interrupted
+                                 and turn['start'] <= inter['time'] <= turn['end']), None)
+        if interrupted_turn is None:
+            continue
+        continuation_time = None
+        for seg in segments:
+            if seg['speaker'] == interrupted and seg['start'] > inter['time']:
+                if interrupted_turn['end'] > seg['start'] or (seg['start'] - interrupted_turn['end']) < 2.0:
+                    continuation_time = seg['start']
+                    break
+        record = {'interruption_id': interruption_id, 'interrupted': interrupted,
+                  'interrupter': inter['interrupter'], 'time': inter['time'],
+                  'maintained_floor': continuation_time is not None}
+        if continuation_time is not None:
+            record.update(continuation_time=continuation_time, gap=continuation_time - inter['time'])
+        failed.append(record)
+    return failed
+
+
+def test_failed_interruptions_match_linear_scan():
+    segments = random_meeting()
+    table = apd.as_segment_table(segments)
+    interruptions, _ = apd.detect_interruptions(table)
+    turns, _ = apd.compute_turn_taking(table)
+
+    failed, tolerance = apd.detect_failed_interruptions(table, interruptions, turns)
+
+    expected = linear_failed_interruptions(segments, interruptions, turns)
+    assert len(interruptions) > 50 and any(f['maintained_floor'] for f in expected)
+    assert failed == expected
+    for speaker, rates in tolerance.items():
+        attempts = [f for f in expected if f['interrupted'] == speaker]
+        assert rates['attempts'] == len(attempts)
+        assert rates['maintained'] == sum(f['maintained_floor'] for f in attempts)
+
+
+def test_floor_recovery_latency_counts_maintained_floors_only():
+    failed = [
+        {'interrupted': 'A', 'maintained_floor': True, 'gap': 0.2},
+        {'interrupted': 'A', 'maintained_floor': True, 'gap': 1.5},
+        {'interrupted': 'B', 'maintained_floor': True, 'gap': 40.0},
+        {'interrupted': 'B', 'maintained_floor': False},
+    ]
+    latency = apd.floor_recovery_latency(failed)
+
+    assert latency['overall']['count'] == 3
+    assert latency['histogram']['bin_edges'][-1] is None
+    assert latency['histogram']['counts'] == [1, 0, 1, 0, 0, 0, 1]
+    assert latency['by_speaker']['A']['median'] == 0.85
+    assert latency['by_speaker']['B'] == {'count': 1, 'mean': 40.0, 'median': 40.0, 'p25': 40.0, 'p75': 40.0,
+                                          'p90': 40.0, 'min': 40.0, 'max': 40.0}
@@ -0,0 +1,75 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analyze_power_dynamics as apd
+
+
+def random_meeting(seed=5):
+    rng = np.random.default_rng(seed)
+    segments, t = [], 0.0
+    for _ in range(250):
+        t += rng.choice([-0.8, -0.1, 0.0, 0.2, 0.6, 2.5, 4.0])
+        duration = rng.uniform(0.3, 8.0)
+        text = '...' if rng.random() < 0.1 else 'some words here'
+        segments.append({'start': max(t, 0.0), 'end': max(t, 0.0) + duration,
+                         'speaker': f'SPEAKER_{rng.integers(0, 4)}', 'text': text})
+        t = max(t, 0.0) + duration
+    return segments
+
+
+def test_final_snapshot_equals_batch_metrics():
+    segments = random_meeting()
+    analyzer = apd.IncrementalAnalyzer()
+    analyzer.add_segments(segments)
+    snapshot = analyzer.snapshot()
+    batch = apd.StructuralMetrics(segments)
+
+    assert snapshot['segments'] == len(segments)
+    assert snapshot['speaker_times'] == pytest.approx(batch.speaker_times)
+    assert snapshot['total_time'] == batch.total_time
+    assert list(snapshot['turns']) == batch.turns
+    assert list(snapshot['interruptions']) == batch.interruptions
+    assert list(snapshot['overlaps']) == batch.overlaps
+    assert snapshot['transitions'] == batch.transitions
+    assert snapshot['transition_durations'] == batch.transition_durations
+    assert list(snapshot['agenda_introductions']) == batch.agenda_introductions
+    assert snapshot['gap_stats'] == pytest.approx(batch.gap_stats)
+
+    assert list(snapshot['turn_stats']) == list(batch.turn_stats)
+    for speaker, stats in batch.turn_stats.items():
+        live = snapshot['turn_stats'][speaker]
+        assert live['count'] == stats['count']
+        assert live['total_duration'] == pytest.approx(stats['total_duration'])
+        assert list(live['durations']) == stats['durations']
+
+
+def test_snapshot_is_not_changed_by_later_segments():
+    segments = random_meeting()
+    analyzer = apd.IncrementalAnalyzer()
+    analyzer.add_segments(segments[:100])
+    early = analyzer.snapshot()
+    frozen = (list(early['turns']), list(early['interruptions']), dict(early['gap_stats']),
+              {speaker: list(stats['durations']) for speaker, stats in early['turn_stats'].items()})
+
+    analyzer.add_segments(segments[100:])
+
+    assert (list(early['turns']), list(early['interruptions']), dict(early['gap_stats']),
+            {speaker: list(stats['durations']) for speaker, stats in early['turn_stats'].items()}) == frozen
+    assert len(analyzer.snapshot()['turns']) > len(early['turns'])
+
+
+def test_prefix_snapshots_match_batch_on_the_prefix():
+    segments = random_meeting()
+    analyzer = apd.IncrementalAnalyzer()
+    for n in (1, 2, 37, 120):
+        analyzer.add_segments(segments[analyzer.n_segments:n])
+        snapshot = analyzer.snapshot()
+        batch = apd.StructuralMetrics(segments[:n])
+        assert list(snapshot['turns']) == batch.turns
+        if n > 1:
+            assert snapshot['gap_stats'] == pytest.approx(batch.gap_stats)
@@ -0,0 +1,56 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analyze_power_dynamics as apd
+
+LINES = [
+    ('A', 'Good morning everyone, welcome to the board meeting.'),
+    ('B', 'Thanks. I want to raise the community garden budget for next season.'),
+    ('C', 'The garden budget needs a full report before we vote on it.'),
+    ('A', 'Agreed, the budget report for the garden should come first.'),
+    ('D', 'Separately, the website donation form has been broken since March.'),
+    ('B', 'okay'),
+    ('C', 'We also have to elect a new treasurer at the annual assembly.'),
+    ('A', 'The treasurer election needs candidates nominated by the assembly.'),
+    ('D', 'I can volunteer to look into the nomination process for treasurer.'),
+]
+
+
+def make_segments():
+    return [{'start': 12.0 * k, 'end': 12.0 * k + 10.0, 'speaker': speaker, 'text': text}
+            for k, (speaker, text) in enumerate(LINES)]
+
+
+def test_stream_reproduces_batch_topics_with_the_meeting_encoder():
+    segments = make_segments()
+    table = apd.as_segment_table(segments)
+    turns, _ = apd.compute_turn_taking(table)
+    batch = apd.analyze_topic_lifecycle(table, turns)
+
+    detector = apd.IncrementalTopicDetector(vectorizer=apd.get_turn_vector_space(table, turns).encoder)
+    events = detector.add_segments(segments) + detector.flush()
+    stream = sorted(detector.topics, key=lambda topic: int(topic['topic_id'].split('_')[1]))
+
+    assert batch and stream == batch
+    assert [e['topic']['topic_id'] for e in events if e['event'] == 'proposal'] == [t['topic_id'] for t in batch]
+
+
+def test_proposal_resolves_once_its_response_window_has_passed():
+    detector = apd.IncrementalTopicDetector(response_window=30)
+    proposed = {}
+    for seg in make_segments():
+        for event in detector.add_segment(seg):
+            topic_id = event['topic']['topic_id']
+            if event['event'] == 'proposal':
+                proposed[topic_id] = event['topic']['start_time']
+            else:
+                # Resolved by the first turn starting after the window, not earlier
+                assert seg['start'] >= proposed[topic_id] + 30
+                assert seg['start'] - 12.0 < proposed[topic_id] + 30
+    assert proposed and len(detector.topics) < len(proposed)
+    # flush() closes the last turn and resolves everything still pending
+    flushed = detector.flush()
+    proposed.update((e['topic']['topic_id'], e['topic']['start_time']) for e in flushed if e['event'] == 'proposal')
+    assert sorted(topic['topic_id'] for topic in detector.topics) == sorted(proposed)
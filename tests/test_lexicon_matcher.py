@@ -0,0 +1,54 @@
+import os
+import re
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analyze_power_dynamics as apd
+
+
+def naive_match(lexicon, bits, text):
+    """One bounded search per phrase, as the cue lists are meant to be read."""
+    text = text.lower().replace('’', "'")
+    mask = 0
+    for label, phrases in lexicon.items():
+        if any(re.search(apd._bounded_pattern(phrase), text) for phrase in phrases):
+            mask |= bits[label]
+    return mask
+
+
+def test_phrases_match_on_word_boundaries_only():
+    matcher = apd.DIALOGUE_ACT_MATCHER
+    bits = matcher.bits
+
+    assert matcher.match('Somewhy that slipped.') == 0
+    assert matcher.match('Why not?') == bits['justification'] | bits['question']
+    assert matcher.match('Exactly.') == bits['agreement']
+    assert matcher.match('inexactly') == 0
+    # Curly apostrophes are read as straight ones
+    assert matcher.match('I don’t agree') == bits['disagreement']
+
+
+def test_overlapping_and_nested_phrases_are_all_reported():
+    lexicon = {'a': ['show me'], 'b': ['me the'], 'c': ['the evidence'], 'd': ['evidence']}
+    matcher = apd.LexiconMatcher(lexicon)
+
+    assert matcher.match('show me the evidence') == 0b1111
+    assert matcher.match('the evidence') == matcher.bits['c'] | matcher.bits['d']
+
+
+def test_match_many_equals_naive_scan():
+    rng = np.random.default_rng(4)
+    words = ['why', 'somewhy', 'how', 'do', 'you', 'know', 'i', 'agree', 'disagree', 'don’t',
+             "don't", 'think', 'so', 'that\'s', 'right', 'wrong', 'show', 'me', 'proof', 'what',
+             'mean', 'exactly', 'not', 'necessarily', '?', 'fair', 'enough', 'makes', 'sense']
+    texts = [' '.join(rng.choice(words, rng.integers(0, 12))) for _ in range(500)]
+
+    flags = apd.DIALOGUE_ACT_MATCHER.match_many(texts)
+
+    assert flags.dtype == np.int64 and len(flags) == len(texts)
+    expected = [naive_match(apd.DIALOGUE_ACT_CUES, apd.DIALOGUE_ACT_MATCHER.bits, text) for text in texts]
+    assert flags.tolist() == expected
+    assert len(set(expected)) > 10
@@ -0,0 +1,38 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analyze_power_dynamics as apd
+
+
+def test_segments_are_split_across_bins():
+    segments = [
+        {'start': 0.0, 'end': 25.0, 'speaker': 'A', 'text': 'A long opening statement.'},
+        {'start': 25.0, 'end': 28.0, 'speaker': 'B', 'text': '...'},
+        {'start': 28.0, 'end': 35.0, 'speaker': 'B', 'text': 'A reply.'},
+    ]
+    matrix, edges = apd.participation_matrix(segments, bin_width=10)
+
+    np.testing.assert_array_equal(edges, [0, 10, 20, 30, 40])
+    # The filler segment is not speaking time
+    np.testing.assert_allclose(matrix, [[10, 10, 5, 0], [0, 0, 2, 5]])
+
+
+def test_matches_interval_overlap():
+    rng = np.random.default_rng(3)
+    starts = np.sort(rng.uniform(0, 600, 200))
+    segments = [{'start': s, 'end': s + rng.uniform(0.1, 40), 'speaker': f'S{rng.integers(0, 5)}', 'text': 'words'}
+                for s in starts]
+    table = apd.as_segment_table(segments)
+    matrix, edges = apd.participation_matrix(table, n_bins=17)
+
+    expected = np.zeros_like(matrix)
+    for seg in segments:
+        code = table.speaker_index[seg['speaker']]
+        for b in range(len(edges) - 1):
+            expected[code, b] += max(0.0, min(seg['end'], edges[b + 1]) - max(seg['start'], edges[b]))
+    np.testing.assert_allclose(matrix, expected)
+    assert edges[-1] == table.end.max()
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analyze_power_dynamics as apd
+
+
+def random_meeting(seed=11):
+    rng = np.random.default_rng(seed)
+    segments, t = [], 0.0
+    for _ in range(150):
+        t += rng.choice([-0.3, 0.2, 0.4, 2.5])
+        duration = rng.uniform(1, 12)
+        segments.append({'start': max(t, 0.0), 'end': max(t, 0.0) + duration,
+                         'speaker': f'S{rng.integers(0, 5)}', 'text': 'some words here'})
+        t = max(t, 0.0) + duration
+    return segments
+
+
+def test_windows_match_whole_meeting_metrics_on_their_slice():
+    segments = random_meeting()
+    interruptions, _ = apd.detect_interruptions(segments)
+    rolling = apd.compute_rolling_power_metrics(segments, interruptions, window=120, step=30)
+
+    assert rolling['window'] == 120 and len(rolling['series']) > 10
+    for window in rolling['series']:
+        t0, t1 = window['start'], window['end']
+        times = {}
+        for seg in segments:
+            overlap = min(seg['end'], t1) - max(seg['start'], t0)
+            if overlap > 0:
+                times[seg['speaker']] = times.get(seg['speaker'], 0.0) + overlap
+        expected = apd.calculate_inequality_metrics(times)
+
+        assert window['active_speakers'] == len(times)
+        # Same sign convention as the whole-meeting Gini
+        assert window['gini_coefficient'] == pytest.approx(expected['gini_coefficient'], abs=1e-9)
+        assert window['normalized_entropy'] == pytest.approx(expected['normalized_entropy'], abs=1e-9)
+        assert window['top_3_share'] == pytest.approx(expected['top_3_share'], abs=1e-9)
+        assert window['interruptions'] == sum(t0 <= i['time'] < t1 for i in interruptions)
+
+
+def test_silent_window_has_no_inequality():
+    segments = [{'start': 0.0, 'end': 30.0, 'speaker': 'A', 'text': 'Opening words.'},
+                {'start': 90.0, 'end': 120.0, 'speaker': 'B', 'text': 'Closing words.'}]
+    rolling = apd.compute_rolling_power_metrics(segments, [], window=30, step=30)
+
+    silent = [w for w in rolling['series'] if w['speaking_time'] == 0]
+    assert silent and all(w['gini_coefficient'] is None for w in silent)
+    assert rolling['series'][0]['gini_coefficient'] == 0.0
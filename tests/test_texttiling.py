@@ -0,0 +1,74 @@
+import os
+import sys
+
+import numpy as np
+import scipy.sparse as sp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analyze_power_dynamics as apd
+
+
+def brute_block_scores(matrix, block_size):
+    """Cosine of the summed block_size rows either side of each gap, computed directly."""
+    dense = matrix.toarray()
+    scores = []
+    for gap in range(1, dense.shape[0]):
+        left = dense[max(gap - block_size, 0):gap].sum(axis=0)
+        right = dense[gap:gap + block_size].sum(axis=0)
+        norms = np.linalg.norm(left) * np.linalg.norm(right)
+        scores.append(left @ right / norms if norms > 0 else 0.0)
+    return np.array(scores)
+
+
+def brute_depths(scores):
+    depths = []
+    for i, score in enumerate(scores):
+        left = i
+        while left > 0 and scores[left - 1] > scores[left]:
+            left -= 1
+        right = i
+        while right < len(scores) - 1 and scores[right + 1] > scores[right]:
+            right += 1
+        depths.append(scores[left] - score + scores[right] - score)
+    return np.array(depths)
+
+
+def test_block_scores_match_direct_block_cosines():
+    rng = np.random.default_rng(9)
+    dense = sp.random(60, 40, density=0.15, random_state=rng).toarray()
+    dense[[5, 6, 30]] = 0  # Empty turns
+    matrix = sp.csr_matrix(dense)
+
+    for block_size in (1, 3, 5, 40):
+        np.testing.assert_allclose(apd._block_similarity_scores(matrix, block_size),
+                                   brute_block_scores(matrix, block_size), atol=1e-12)
+    assert len(apd._block_similarity_scores(matrix[:1], 5)) == 0
+
+
+def test_depth_scores_match_hill_climbing():
+    scores = np.random.default_rng(2).uniform(0, 1, 80)
+    scores[10:13] = 0.5  # Plateau stops the climb
+
+    np.testing.assert_allclose(apd._depth_scores(scores), brute_depths(scores))
+
+
+def test_boundary_is_placed_between_two_topics():
+    garden = ['The community garden budget needs more seeds and compost this season.',
+              'Garden compost and seeds are the biggest items in the garden budget.',
+              'We could cut the seeds budget if the garden gets donated compost.',
+              'Compost deliveries for the garden should be budgeted monthly.']
+    treasurer = ['The treasurer election needs nominations from the assembly members.',
+                 'Assembly members can nominate a treasurer candidate before the election.',
+                 'The election of a treasurer happens at the annual assembly.',
+                 'Nominations for treasurer close a week before the assembly election.']
+    segments = [{'start': 12.0 * k, 'end': 12.0 * k + 10.0, 'speaker': 'ABCD'[k % 4], 'text': text}
+                for k, text in enumerate(garden + treasurer)]
+    table = apd.as_segment_table(segments)
+    turns, _ = apd.compute_turn_taking(table)
+
+    proposals = apd.detect_topic_proposals_texttiling(table, turns, block_size=3)
+
+    assert [p['turn_index'] for p in proposals] == [4]
+    assert proposals[0]['text'] == treasurer[0]
+    assert proposals[0]['similarity_to_preceding'] < 0.2
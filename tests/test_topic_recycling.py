@@ -0,0 +1,37 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analyze_power_dynamics as apd
+
+PROPOSAL = 'we should publish the community garden budget report'
+RECYCLED = 'publish the community garden budget report this week'
+
+
+def make_meeting():
+    # Speaker A repeats an ignored proposal twice; B later recycles it with success
+    lines = [('A', PROPOSAL), ('C', 'okay'), ('A', PROPOSAL), ('C', 'hmm'), ('A', PROPOSAL), ('B', RECYCLED)]
+    segments = [{'start': 2.0 * k, 'end': 2.0 * k + 1.5, 'speaker': speaker, 'text': text}
+                for k, (speaker, text) in enumerate(lines)]
+    turns, _ = apd.compute_turn_taking(segments)
+
+    def topic(turn_index, status):
+        turn = turns[turn_index]
+        return {'topic_id': f'topic_{turn_index}', 'proposer': turn['speaker'], 'turn_index': turn_index,
+                'text': lines[turn_index][1], 'status': status, 'start_time': turn['start'],
+                'end_time': turn['end'], 'stabilization': {'responders': [], 'all_responses': []}}
+
+    topics = [topic(k, 'failed_no_uptake') for k in (0, 2, 4)] + [topic(5, 'stabilized')]
+    return topics, segments, turns
+
+
+def test_top_k_ranks_only_recycling_candidates():
+    topics, segments, turns = make_meeting()
+    # The same-proposer repeats are the original's most similar topics, but not recycling
+    everything = apd.detect_topic_recycling(topics, segments, turns)
+    limited = apd.detect_topic_recycling(topics, segments, turns, top_k=1)
+
+    pairs = [(r['original_topic'], r['recycled_topic']) for r in limited]
+    assert pairs == [('topic_0', 'topic_5'), ('topic_2', 'topic_5'), ('topic_4', 'topic_5')]
+    assert limited == everything
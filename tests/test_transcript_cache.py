@@ -0,0 +1,98 @@
+import json
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analyze_power_dynamics as apd
+
+
+def write_transcript(path):
+    segments = [
+        {'start': 0.0, 'end': 1.5, 'speaker': 'SPEAKER_00', 'text': 'Welcome everyone.',
+         'words': [{'word': 'Welcome', 'start': 0.0, 'end': 0.7, 'speaker': 'SPEAKER_00'},
+                   {'word': 'everyone.', 'start': 0.8, 'end': 1.5, 'speaker': 'SPEAKER_02'}]},
+        {'start': 1.6, 'end': 3.0, 'speaker': 'SPEAKER_01', 'text': 'Thanks.',
+         'words': [{'word': 'Thanks.', 'start': 1.6, 'end': 3.0}, {'word': 'um'}]},
+        {'start': 3.2, 'end': 4.0, 'speaker': 'SPEAKER_01', 'text': '...'},
+        {'start': 4.1, 'end': 6.0, 'speaker': 'SPEAKER_00', 'text': 'Let us start with the budget.'},
+    ]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'segments': segments}, f)
+
+
+def assert_same_table(a, b):
+    for name in ('start', 'end', 'speaker', 'filler', 'text_offsets'):
+        np.testing.assert_array_equal(getattr(a, name), getattr(b, name))
+    assert a.speakers == b.speakers
+    assert a.text_buffer == b.text_buffer
+
+
+def fail_if_parsed(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('transcript was parsed again')
+    monkeypatch.setattr(apd, 'iter_json_array', fail)
+
+
+def test_cache_round_trip(tmp_path, monkeypatch):
+    transcript = tmp_path / 'meeting.json'
+    write_transcript(transcript)
+    cache_dir = tmp_path / 'cache'
+
+    parsed = apd.load_transcript(str(transcript))
+    first = apd.load_transcript(str(transcript), cache_dir=str(cache_dir))
+    fail_if_parsed(monkeypatch)
+    second = apd.load_transcript(str(transcript), cache_dir=str(cache_dir))
+
+    assert_same_table(parsed, first)
+    assert_same_table(parsed, second)
+
+
+def test_corrupt_entry_is_rebuilt(tmp_path, monkeypatch):
+    transcript = tmp_path / 'meeting.json'
+    write_transcript(transcript)
+    cache_dir = tmp_path / 'cache'
+    apd.load_transcript(str(transcript), cache_dir=str(cache_dir))
+    entry = os.path.join(str(cache_dir), apd.transcript_cache_key(str(transcript)))
+
+    with open(os.path.join(entry, 'meta.json'), 'w', encoding='utf-8') as f:
+        f.write('{not json')
+
+    # The corrupt entry forces a re-parse, which must repair the entry
+    repaired = apd.load_transcript(str(transcript), cache_dir=str(cache_dir))
+    assert_same_table(apd.load_transcript(str(transcript)), repaired)
+    assert apd.load_segment_cache(entry).speakers == repaired.speakers
+
+    # The next load is served from the cache without parsing the transcript
+    fail_if_parsed(monkeypatch)
+    assert_same_table(repaired, apd.load_transcript(str(transcript), cache_dir=str(cache_dir)))
+    assert sorted(os.listdir(str(cache_dir))) == [os.path.basename(entry)]
+
+
+def test_cache_key_tracks_format_version(tmp_path, monkeypatch):
+    transcript = tmp_path / 'meeting.json'
+    write_transcript(transcript)
+    key = apd.transcript_cache_key(str(transcript))
+    monkeypatch.setattr(apd, 'CACHE_FORMAT_VERSION', apd.CACHE_FORMAT_VERSION + 1)
+    assert apd.transcript_cache_key(str(transcript)) != key
+
+
+def test_word_intervals_come_from_cache(tmp_path, monkeypatch):
+    transcript = tmp_path / 'meeting.json'
+    write_transcript(transcript)
+    cache_dir = tmp_path / 'cache'
+    table = apd.load_transcript(str(transcript), cache_dir=str(cache_dir))
+    requests = [table.speakers, [], ['SPEAKER_02']]
+    parsed = [apd.load_word_intervals(str(transcript), speakers) for speakers in requests]
+
+    fail_if_parsed(monkeypatch)
+    for speakers, (expected, expected_speakers) in zip(requests, parsed):
+        words, word_speakers = apd.load_word_intervals(str(transcript), speakers, cache_dir=str(cache_dir))
+        np.testing.assert_array_equal(words, expected)
+        assert word_speakers == expected_speakers
+
+    # The untimed word is skipped and SPEAKER_02 speaks only at word level
+    assert len(words) == 3
+    assert word_speakers == ['SPEAKER_02', 'SPEAKER_00', 'SPEAKER_01']
@@ -0,0 +1,35 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analyze_power_dynamics as apd
+
+SPEAKERS = ['A', 'B']
+
+
+def make_words(rows):
+    words = np.zeros(len(rows), dtype=apd.WORD_DTYPE)
+    for k, (speaker, start, end) in enumerate(rows):
+        words[k] = (k, SPEAKERS.index(speaker), start, end)
+    return words
+
+
+def test_touching_words_keep_one_episode():
+    # A's words touch at 1.0 while B is still speaking: one continuous overlap
+    words = make_words([('A', 0.0, 1.0), ('A', 1.0, 2.0), ('B', 0.5, 1.5)])
+    episodes, matrix = apd.detect_word_overlaps(words, SPEAKERS)
+
+    assert [(e['start'], e['end']) for e in episodes] == [(0.5, 1.5)]
+    assert episodes[0]['participants'] == ['A', 'B']
+    assert matrix[0, 1] == matrix[1, 0] == 1.0
+
+
+def test_words_that_touch_across_speakers_do_not_overlap():
+    words = make_words([('A', 0.0, 1.0), ('B', 1.0, 2.0), ('A', 2.0, 3.0)])
+    episodes, matrix = apd.detect_word_overlaps(words, SPEAKERS)
+
+    assert episodes == []
+    assert not matrix.any()
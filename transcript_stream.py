@@ -0,0 +1,198 @@
+"""
+Streaming reader for WhisperX-style transcript files.
+
+Parses one top-level array (normally ``segments``) an element at a time, so
+the per-word arrays of long recordings are never all resident at once.
+Other top-level values (e.g. ``word_segments``) are skipped without being
+materialized. Plain, gzip- and zstd-compressed JSON files are supported.
+"""
+
+import gzip
+import io
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.S)
+_DECODER = json.JSONDecoder()
+
+
+def open_transcript(filepath: str) -> TextIO:
+    """
+    Open a transcript for text reading, decompressing transparently.
+
+    The compression format is detected from the file's magic bytes, not its
+    extension.
+
+    Args:
+        filepath: Path to a .json, gzip or zstd-compressed transcript
+
+    Returns:
+        Text-mode file object
+    """
+    with open(filepath, 'rb') as f:
+        magic = f.read(4)
+
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.open(filepath, 'rt', encoding='utf-8')
+    if magic.startswith(ZSTD_MAGIC):
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstandard library required for zstd transcripts. Install with: pip install zstandard")
+        raw = open(filepath, 'rb')
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(reader, encoding='utf-8')
+    return open(filepath, 'r', encoding='utf-8')
+
+
+class _ChunkedJsonReader:
+    """Minimal pull parser over a text stream, holding at most a few chunks."""
+
+    def __init__(self, fp: TextIO):
+        self.fp = fp
+        self.buf = ''
+        self.pos = 0
+
+    def _fill(self) -> bool:
+        """Drop the consumed prefix and append the next chunk. False at EOF."""
+        chunk = self.fp.read(CHUNK_SIZE)
+        if not chunk:
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of transcript")
+
+    def take(self) -> str:
+        """Consume and return the next non-whitespace character."""
+        ch = self.peek()
+        self.pos += 1
+        return ch
+
+    def expect(self, expected: str):
+        ch = self.take()
+        if ch != expected:
+            raise ValueError(f"Malformed transcript: expected {expected!r}, found {ch!r}")
+
+    def decode(self) -> Any:
+        """Decode one complete JSON value at the current position."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Value straddles the chunk boundary
+                if not self._fill():
+                    raise
+                continue
+            if end == len(self.buf) and self._fill():
+                # A bare number may have been cut at the boundary; decode again
+                continue
+            self.pos = end
+            return value
+
+    def skip(self):
+        """Skip one JSON value, scanning containers without building them."""
+        if self.peek() not in '[{':
+            self.decode()
+            return
+
+        depth = 0
+        while True:
+            m = _STRUCTURAL.search(self.buf, self.pos)
+            if m is None:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise ValueError("Unexpected end of transcript")
+                continue
+
+            self.pos = m.start()
+            if m.group() == '"':
+                s = _STRING.match(self.buf, self.pos)
+                if s is None:
+                    if not self._fill():
+                        raise ValueError("Unterminated string in transcript")
+                    continue
+                self.pos = s.end()
+                continue
+
+            self.pos += 1
+            depth += 1 if m.group() in '[{' else -1
+            if depth == 0:
+                return
+
+
+def iter_json_array(fp: TextIO, key: str = 'segments') -> Iterator[Any]:
+    """
+    Yield the elements of a top-level array one at a time.
+
+    Args:
+        fp: Text stream positioned at the start of a JSON object
+        key: Top-level key whose array value should be streamed
+
+    Returns:
+        Iterator over the decoded array elements
+    """
+    reader = _ChunkedJsonReader(fp)
+    reader.expect('{')
+    if reader.peek() == '}':
+        raise KeyError(key)
+
+    while True:
+        name = reader.decode()
+        reader.expect(':')
+
+        if name == key:
+            reader.expect('[')
+            if reader.peek() == ']':
+                return
+            while True:
+                yield reader.decode()
+                ch = reader.take()
+                if ch == ']':
+                    return
+                if ch != ',':
+                    raise ValueError(f"Malformed transcript: expected ',' or ']', found {ch!r}")
+
+        reader.skip()
+        ch = reader.take()
+        if ch == '}':
+            raise KeyError(key)
+        if ch != ',':
+            raise ValueError(f"Malformed transcript: expected ',' or '}}', found {ch!r}")
+
+
+def iter_spilled_words(words_path: str) -> Iterator[tuple]:
+    """
+    Read back a word side file written by the streaming loader.
+
+    Args:
+        words_path: JSON-lines file with one {"segment": i, "words": [...]} per line
+
+    Returns:
+        Iterator of (segment_index, words) tuples
+    """
+    with open(words_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                yield entry['segment'], entry['words']